@@ -0,0 +1,51 @@
+"""Throughput and FER of the check-node kernels.
+
+Decodes the same received messages with each check-node kernel to pick the
+cheapest kernel meeting the target error rate.
+
+"""
+from datetime import datetime
+
+import numpy as np
+
+from python_polar_coding.channels.simple import SimpleBPSKModulationAWGN
+from python_polar_coding.polar_codes import FastSSCPolarCodec, SCPolarCodec
+from python_polar_coding.polar_codes.base import CHECK_NODE_KERNELS
+
+
+def check_node_kernels_benchmark():
+    N, K = 1024, 512
+    design_snr = 2.0
+    messages = 10000
+    snr_range = [1.0, 1.5, 2.0, 2.5]
+    code_classes = [SCPolarCodec, FastSSCPolarCodec]
+
+    channel = SimpleBPSKModulationAWGN(fec_rate=K/N)
+    encoder = SCPolarCodec(N=N, K=K, design_snr=design_snr)
+
+    for snr in snr_range:
+        sent = np.random.randint(0, 2, (messages, K))
+        encoded = encoder.encode_batch(sent)
+        received = np.array([
+            channel.transmit(message=message, snr_db=snr)
+            for message in encoded
+        ])
+
+        for code_class in code_classes:
+            for check_node in CHECK_NODE_KERNELS:
+                code = code_class(N=N, K=K, design_snr=design_snr,
+                                  check_node=check_node)
+                # Compile the kernels before measuring
+                code.decode_batch(received[:1])
+
+                start = datetime.now()
+                decoded, _ = code.decode_batch(received)
+                seconds = (datetime.now() - start).total_seconds()
+
+                fer = np.mean(np.any(decoded != sent, axis=1))
+                print(f'{code_class.__name__}, SNR {snr} dB, {check_node}: '
+                      f'FER {fer:.4f}, {messages / seconds:.0f} frames/s')
+
+
+if __name__ == '__main__':
+    check_node_kernels_benchmark()
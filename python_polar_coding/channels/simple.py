@@ -21,7 +21,7 @@ class SimpleAWGNChannel:
     def _add_noise(signal: np.array, noise_power: float) -> np.array:
         """Add AWGN noise to signal."""
         noise = np.sqrt(noise_power / 2) * np.random.randn(signal.size)
-        return signal + noise
+        return signal + noise.astype(signal.dtype)
 
 
 class SimpleBPSKModulationAWGN:
@@ -31,18 +31,23 @@ class SimpleBPSKModulationAWGN:
     E. Viterbo, and Yi Hong (See `PlotPC and PlotPCSystematic`):
     https://ecse.monash.edu/staff/eviterbo/polarcodes.html.
 
+    Args:
+        dtype (type): Type of the modulated signal and LLRs.
+
     """
     noise_power = 2.0
 
-    def __init__(self, fec_rate: float):
+    def __init__(self, fec_rate: float, dtype=np.double):
         self.fec_rate = fec_rate
+        self.dtype = dtype
 
     def transmit(self, message: np.array,
                  snr_db: float,
                  with_noise: bool = True) -> np.array:
         """Transmit BPSK-modulated message over AWGN message."""
         symbol_energy = self._compute_symbol_energy(snr_db, self.fec_rate)
-        transmitted = self._modulate(message, symbol_energy)
+        transmitted = self._modulate(
+            message, symbol_energy, np.empty(message.size, dtype=self.dtype))
 
         if with_noise:
             transmitted = self._add_noise(transmitted, self.noise_power)
@@ -57,19 +62,31 @@ class SimpleBPSKModulationAWGN:
 
     @staticmethod
     @numba.njit
-    def _modulate(message: np.array, symbol_energy: float) -> np.array:
-        """BPSK modulation."""
-        return (2 * message - 1) * np.sqrt(symbol_energy)
+    def _modulate(message: np.array, symbol_energy: float,
+                  result: np.array) -> np.array:
+        """BPSK modulation into `result` array of the signal type."""
+        amplitude = np.sqrt(symbol_energy)
+        for i in range(message.size):
+            result[i] = (2 * message[i] - 1) * amplitude
+        return result
 
     @staticmethod
     @numba.njit
     def _add_noise(signal: np.array, noise_power: float) -> np.array:
         """Add AWGN noise to signal."""
         noise = np.sqrt(noise_power / 2) * np.random.randn(signal.size)
-        return signal + noise
+        return signal + noise.astype(signal.dtype)
 
     @staticmethod
     @numba.njit
     def _llr_detection(signal: np.array, symbol_energy: float, noise_power: float) -> np.array:
-        """LLR detection of BPSK signal with AWGN."""
-        return -(4 * np.sqrt(symbol_energy) / noise_power) * signal
+        """LLR detection of BPSK signal with AWGN.
+
+        LLRs are of the same type as the signal.
+
+        """
+        scale = -(4 * np.sqrt(symbol_energy) / noise_power)
+        result = np.empty_like(signal)
+        for i in range(signal.size):
+            result[i] = scale * signal[i]
+        return result
@@ -9,16 +9,21 @@ class SimpleBPSKModem:
     E. Viterbo, and Yi Hong (See `PlotPC and PlotPCSystematic`):
     https://ecse.monash.edu/staff/eviterbo/polarcodes.html.
 
+    Args:
+        dtype (type): Type of the modulated signal and LLRs.
+
     """
     noise_power = 2.0
 
-    def __init__(self, fec_rate: float, snr_db: float):
+    def __init__(self, fec_rate: float, snr_db: float, dtype=np.double):
         self.fec_rate = fec_rate
+        self.dtype = dtype
         self.symbol_energy = self._compute_symbol_energy(snr_db, self.fec_rate)
 
     def modulate(self, message: np.array) -> np.array:
         """BPSK modulation."""
-        return self._modulate(message, self.symbol_energy)
+        result = np.empty(message.size, dtype=self.dtype)
+        return self._modulate(message, self.symbol_energy, result)
 
     def demodulate(self, transmitted: np.array) -> np.array:
         """BPSK demodulation."""
@@ -32,12 +37,24 @@ class SimpleBPSKModem:
 
     @staticmethod
     @numba.njit
-    def _modulate(message: np.array, symbol_energy: float) -> np.array:
-        """BPSK modulation."""
-        return (2 * message - 1) * np.sqrt(symbol_energy)
+    def _modulate(message: np.array, symbol_energy: float,
+                  result: np.array) -> np.array:
+        """BPSK modulation into `result` array of the signal type."""
+        amplitude = np.sqrt(symbol_energy)
+        for i in range(message.size):
+            result[i] = (2 * message[i] - 1) * amplitude
+        return result
 
     @staticmethod
     @numba.njit
     def _llr_detect(signal: np.array, symbol_energy: float, noise_power: float) -> np.array:
-        """LLR detection of BPSK signal with AWGN."""
-        return -(4 * np.sqrt(symbol_energy) / noise_power) * signal
+        """LLR detection of BPSK signal with AWGN.
+
+        LLRs are of the same type as the signal.
+
+        """
+        scale = -(4 * np.sqrt(symbol_energy) / noise_power)
+        result = np.empty_like(signal)
+        for i in range(signal.size):
+            result[i] = scale * signal[i]
+        return result
@@ -4,3 +4,4 @@ from .decoder import BaseDecoder
 from .decoding_path import DecodingPathMixin
 from .encoder import *
 from .functions import *
+from .quantizer import Quantizer
@@ -7,6 +7,8 @@ import numpy as np
 from python_polar_coding.polar_codes import crc, pcc, utils
 
 from . import encoder
+from .functions import compute_mask_indices
+from .quantizer import Quantizer
 
 
 class BasePolarCodec(metaclass=abc.ABCMeta):
@@ -17,6 +19,10 @@ class BasePolarCodec(metaclass=abc.ABCMeta):
 
     Supports creation of a polar code from custom mask.
 
+    Decoding parameters shared by the codecs: `check_node` kernel, size
+    `llr_bits` and `fractional_bits` of quantized LLRs, floating point LLRs
+    are decoded if `llr_bits` = 0, and `dtype` of floating point LLRs.
+
     """
     encoder_class = encoder.Encoder
     decoder_class = None
@@ -33,7 +39,11 @@ class BasePolarCodec(metaclass=abc.ABCMeta):
                  design_snr: float = 0.0,
                  is_systematic: bool = True,
                  mask: Union[str, None] = None,
-                 pcc_method: str = BHATTACHARYYA):
+                 pcc_method: str = BHATTACHARYYA,
+                 check_node: str = 'min-sum',
+                 llr_bits: int = 0,
+                 fractional_bits: int = 0,
+                 dtype=np.double):
 
         assert K < N, (f'Cannot create Polar code with N = {N}, K = {K}.'
                        f'\nN must be bigger than K.')
@@ -44,10 +54,20 @@ class BasePolarCodec(metaclass=abc.ABCMeta):
         self.design_snr = design_snr
         self.is_systematic = is_systematic
 
+        self.check_node = check_node
+        self.llr_bits = llr_bits
+        self.fractional_bits = fractional_bits
+        self.quantizer = (Quantizer(llr_bits, fractional_bits) if llr_bits
+                          else None)
+        self.dtype = dtype
+
         self.pcc_method = pcc_method
         self.channel_estimates = self._compute_channels_estimates(
             N=self.N, n=self.n, design_snr=design_snr, pcc_method=pcc_method)
         self.mask = self._polar_code_construction(mask)
+        # Indices of information and frozen bits shared by encoder and decoder
+        self.info_indices, self.frozen_indices = compute_mask_indices(
+            self.mask)
 
         self.encoder = self.init_encoder()
         self.decoder = self.init_decoder()
@@ -67,24 +87,67 @@ class BasePolarCodec(metaclass=abc.ABCMeta):
             'design_snr': self.design_snr,
             'pcc_method': self.pcc_method,
             'mask': ''.join(str(m) for m in self.mask),
+            'check_node': self.check_node,
+            'llr_bits': self.llr_bits,
+            'fractional_bits': self.fractional_bits,
+            'dtype': np.dtype(self.dtype).name,
         }
 
     def init_encoder(self):
         """Get Polar Encoder instance."""
         return self.encoder_class(mask=self.mask, n=self.n,
-                                  is_systematic=self.is_systematic)
+                                  is_systematic=self.is_systematic,
+                                  info_indices=self.info_indices,
+                                  frozen_indices=self.frozen_indices)
 
     @abc.abstractmethod
     def init_decoder(self):
         """Get Polar Decoder instance."""
 
+    def get_decoder_kwargs(self) -> dict:
+        """Get arguments of the decoder shared by the codecs."""
+        return {
+            'n': self.n,
+            'mask': self.mask,
+            'is_systematic': self.is_systematic,
+            'check_node': self.check_node,
+            'quantizer': self.quantizer,
+            'dtype': self.dtype,
+            'info_indices': self.info_indices,
+        }
+
     def encode(self, message: np.array) -> np.array:
         """Encode binary message."""
         return self.encoder.encode(message)
 
-    def decode(self, received_message: np.array) -> np.array:
-        """Decode received message presented as LLR values."""
-        return self.decoder.decode(received_message)
+    def encode_batch(self, messages: np.array) -> np.array:
+        """Encode a batch of binary messages, one message per row."""
+        return self.encoder.encode_batch(messages)
+
+    def decode(self, received_message: np.array,
+               out: np.array = None) -> np.array:
+        """Decode received message presented as LLR values.
+
+        Decoded info bits are written into `out` array if given.
+
+        """
+        return self.decoder.decode(received_message, out=out)
+
+    def decode_batch(self, received_messages: np.array, workers: int = 1):
+        """Decode a batch of received messages presented as LLR values.
+
+        Args:
+            received_messages (numpy.array): LLR values of shape (B, N),
+                one message per row.
+            workers (int): Number of threads to decode the batch by.
+
+        Returns:
+            decoded (numpy.array): decoded messages of shape (B, K).
+            status (dict): decoding status of each frame as arrays of
+                size B, e.g. CRC check result of CRC-aided decoders.
+
+        """
+        return self.decoder.decode_batch(received_messages, workers=workers)
 
     def _compute_channels_estimates(self, N: int, n: int, design_snr: float,
                                     pcc_method: str):
@@ -147,7 +210,11 @@ class BaseCRCPolarCodec(BasePolarCodec):
                  is_systematic: bool = True,
                  crc_size: int = 32,
                  mask: Union[str, None] = None,
-                 pcc_method: str = BasePolarCodec.BHATTACHARYYA):
+                 pcc_method: str = BasePolarCodec.BHATTACHARYYA,
+                 check_node: str = 'min-sum',
+                 llr_bits: int = 0,
+                 fractional_bits: int = 0,
+                 dtype=np.double):
 
         assert crc_size in [16, 32], f'Unsupported CRC size ({crc_size})'
         assert K + crc_size < N, (f'Cannot create Polar code with N = {N},'
@@ -159,7 +226,11 @@ class BaseCRCPolarCodec(BasePolarCodec):
                          is_systematic=is_systematic,
                          design_snr=design_snr,
                          mask=mask,
-                         pcc_method=pcc_method)
+                         pcc_method=pcc_method,
+                         check_node=check_node,
+                         llr_bits=llr_bits,
+                         fractional_bits=fractional_bits,
+                         dtype=dtype)
 
     def __str__(self):
         return f'{super().__str__()}\nCRC {self.crc_size}'
@@ -169,11 +240,18 @@ class BaseCRCPolarCodec(BasePolarCodec):
         d.update({'crc_size': self.crc_size})
         return d
 
+    def get_decoder_kwargs(self) -> dict:
+        kwargs = super().get_decoder_kwargs()
+        kwargs.update({'crc_codec': self.crc_codec})
+        return kwargs
+
     def init_encoder(self):
         """Get Polar Encoder instance."""
         return self.encoder_class(mask=self.mask, n=self.n,
                                   is_systematic=self.is_systematic,
-                                  crc_codec=self.crc_codec)
+                                  crc_codec=self.crc_codec,
+                                  info_indices=self.info_indices,
+                                  frozen_indices=self.frozen_indices)
 
     @property
     def crc_size(self):
@@ -1,2 +1,19 @@
 # LLR = 1000 is high enough to be considered as +∞ for SCAN decoding
 INFINITY = 1000
+
+# Check-node kernels computing LLRs of the left child node (F function)
+MIN_SUM = 0
+OFFSET_MIN_SUM = 1
+NORMALIZED_MIN_SUM = 2
+BOX_PLUS = 3
+
+CHECK_NODE_KERNELS = {
+    'min-sum': MIN_SUM,
+    'offset-min-sum': OFFSET_MIN_SUM,
+    'normalized-min-sum': NORMALIZED_MIN_SUM,
+    'box-plus': BOX_PLUS,
+}
+
+# Offset of offset min-sum and scale of normalized min-sum kernels
+MIN_SUM_OFFSET = 0.5
+MIN_SUM_SCALE = 0.75
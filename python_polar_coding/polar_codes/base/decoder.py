@@ -1,34 +1,152 @@
 import abc
+from collections import defaultdict
+from concurrent import futures
 
 import numpy as np
 
+from .functions import compute_mask_indices
+from .quantizer import Quantizer
+
 
 class BaseDecoder(metaclass=abc.ABCMeta):
-    """Basic class for polar decoder."""
+    """Basic class for polar decoder.
+
+    Args:
+        info_indices (np.array): Indices of information bits of the mask,
+            computed from the mask if not set.
+
+    """
+
+    # Batch decoding keeps no state in the decoder and runs compiled
+    # kernels releasing the GIL, so frames can be decoded by threads
+    parallel_batch = False
 
-    def __init__(self, n, mask: np.array, is_systematic: bool = True):
+    def __init__(self, n, mask: np.array, is_systematic: bool = True,
+                 quantizer: Quantizer = None, dtype=np.double,
+                 info_indices: np.array = None):
         self.N = mask.shape[0]
         self.n = n
         self.is_systematic = is_systematic
         self.mask = mask
+        self.info_indices = (compute_mask_indices(mask)[0]
+                             if info_indices is None else info_indices)
+        # Received LLRs are quantized before decoding if set
+        self.quantizer = quantizer
+        # Type of floating point LLR values
+        self.dtype = dtype
+
+    @property
+    def llr_dtype(self):
+        """Type of LLR values the decoder stores."""
+        return self.quantizer.dtype if self.quantizer else self.dtype
+
+    @property
+    def llr_limit(self):
+        """Maximal magnitude of quantized LLR values, 0 if not quantized."""
+        return self.quantizer.limit if self.quantizer else 0
+
+    @property
+    def llr_scale(self):
+        """Quantized value of LLR = 1, 1 if not quantized."""
+        return self.quantizer.scale if self.quantizer else 1
+
+    def decode(self, received_llr: np.array,
+               out: np.array = None) -> np.array:
+        decoded = self.decode_internal(self.prepare_llr(received_llr))
+        return self.get_result(decoded, out=out)
+
+    def prepare_llr(self, received_llr: np.array) -> np.array:
+        """Convert received LLRs to the type the decoder stores.
+
+        LLRs are quantized for fixed-point decoding.
+
+        """
+        if self.quantizer:
+            return self.quantizer.quantize(received_llr)
+        return np.asarray(received_llr, dtype=self.dtype)
+
+    def decode_batch(self, received_llr: np.array, workers: int = 1):
+        """Decode a batch of received messages, one message per row.
+
+        Args:
+            received_llr (numpy.array): LLR values of shape (B, N).
+            workers (int): Number of threads to split the frames across.
+                Used only by decoders supporting parallel batch decoding,
+                others decode the batch in the calling thread.
+
+        Returns:
+            decoded (numpy.array): decoded info bits of shape (B, K).
+            status (dict): decoding status of each frame, e.g. the chosen
+                path of list decoders, as arrays of size B.
+
+        """
+        received_llr = self.prepare_llr(np.atleast_2d(received_llr))
+        workers = min(workers, received_llr.shape[0])
+
+        if self.parallel_batch and workers > 1:
+            decoded, status = self._decode_batch_parallel(received_llr,
+                                                          workers)
+        else:
+            decoded, status = self.decode_batch_internal(received_llr)
+        return self.get_batch_result(decoded), status
+
+    def decode_batch_internal(self, received_llr: np.array):
+        """Decode a batch of received messages frame by frame.
+
+        Decoders override it to decode all the frames at once.
+
+        Returns:
+            decoded (numpy.array): decoded messages of shape (B, N).
+            status (dict): decoding status of each frame.
+
+        """
+        decoded = np.zeros(received_llr.shape, dtype=np.int8)
+        status = defaultdict(list)
+
+        for i, llr in enumerate(received_llr):
+            decoded[i] = self.decode_internal(llr)
+            for key, value in self.status.items():
+                status[key].append(value)
+
+        return decoded, {key: np.array(value) for key, value in status.items()}
+
+    def _decode_batch_parallel(self, received_llr: np.array, workers: int):
+        """Decode a batch split into `workers` parts by separate threads.
+
+        Each thread allocates its own decoding memory, decoding plan of the
+        code is shared by all of them.
+
+        """
+        chunks = np.array_split(received_llr, workers)
+        with futures.ThreadPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(self.decode_batch_internal, chunks))
+
+        decoded = np.concatenate([d for d, _ in results])
+        status = {
+            key: np.concatenate([s[key] for _, s in results])
+            for key in results[0][1]
+        }
+        return decoded, status
 
-    def decode(self, received_llr: np.array) -> np.array:
-        decoded = self.decode_internal(received_llr)
-        return self.get_result(decoded)
+    @property
+    def status(self) -> dict:
+        """Decoding status of the last decoded frame."""
+        return dict()
 
     @abc.abstractmethod
     def decode_internal(self, received_llr: np.array) -> np.array:
         """Implementation of particular decoding method."""
 
-    def get_result(self, decoded: np.array) -> np.array:
+    def get_result(self, decoded: np.array,
+                   out: np.array = None) -> np.array:
         """Get decoding result.
 
         Extract info bits from decoded message due to polar code mask.
+        Info bits are written into `out` array of size K if given.
 
         """
-        decoded_info = list()
+        return np.take(decoded, self.info_indices, out=out)
 
-        for i in range(self.N):
-            if self.mask[i] == 1:
-                decoded_info = np.append(decoded_info, decoded[i])
-        return np.array(decoded_info, dtype=np.int)
+    def get_batch_result(self, decoded: np.array) -> np.array:
+        """Get decoding result of a batch of messages of shape (B, N)."""
+        return np.take(decoded, self.info_indices, axis=1)
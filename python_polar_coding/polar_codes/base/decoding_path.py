@@ -34,28 +34,35 @@ class DecodingPathMixin:
             f'Path metric: {self._path_metric}'
         )
 
-    @property
-    def current_llr(self):
-        return self.intermediate_llr[-1][0]
-
     def __deepcopy__(self, memodict={}):
         new_path = self.__class__(n=self.n, mask=self.mask,
-                                  is_systematic=self.is_systematic)
+                                  is_systematic=self.is_systematic,
+                                  compiled=self.compiled,
+                                  check_node=self.check_node,
+                                  quantizer=self.quantizer,
+                                  dtype=self.dtype,
+                                  info_indices=self.info_indices)
+
+        if self.compiled:
+            # Copy flat LLR, partial sums and decisions memory
+            new_path._llr = np.array(self._llr)
+            new_path._bits = np.array(self._bits)
+            new_path._decisions = np.array(self._decisions)
+            return self._copy_path_metric(new_path)
 
         # Copy intermediate LLR values
         new_path.intermediate_llr = [
             np.array(llrs) for llrs in self.intermediate_llr
         ]
         # Copy intermediate bit values
-        new_path.intermediate_bits = [
-            np.array(bits) for bits in self.intermediate_bits
-        ]
+        new_path.intermediate_bits = np.array(self.intermediate_bits)
         # Copy current state
-        new_path.current_state = np.array(self.current_state)
-        # Copy previous state
-        new_path.previous_state = np.array(self.previous_state)
+        new_path.current_state = self.current_state
+
+        return self._copy_path_metric(new_path)
 
-        # Copy path metric
+    def _copy_path_metric(self, new_path):
+        """Copy path metric to the new path and make opposite decisions."""
         new_path._path_metric = self._path_metric
 
         # Make opposite decisions for each path
@@ -70,16 +77,19 @@ class DecodingPathMixin:
         Source: https://arxiv.org/abs/1411.7282 Section III-B
 
         """
-        if self.current_llr >= 0:
-            self._path_metric -= (self.current_llr * self._current_decision)
-        if self.current_llr < 0:
-            self._path_metric += (self.current_llr * (1 - self._current_decision))
+        # Quantized LLRs are converted to prevent overflow of the metric
+        llr = float(self.current_llr)
+        if llr >= 0:
+            self._path_metric -= (llr * self._current_decision)
+        if llr < 0:
+            self._path_metric += (llr * (1 - self._current_decision))
 
     def split_path(self):
         """Make a copy of SC path with another decision.
 
         If LLR of the current position is out of bounds, there is no sense
-        of splitting path because LLR >= 20 means 0 and LLR <= -20 means 1.
+        of splitting path because LLR >= 20 means 0 and LLR <= -20 means 1,
+        see `split_threshold` of SC List decoder.
 
         """
         new_path = deepcopy(self)
@@ -3,20 +3,41 @@ from numba import njit
 
 from python_polar_coding.polar_codes.crc import CRC
 
+from .functions import (
+    compute_bitsliced_encoding,
+    compute_mask_indices,
+    pack_frames,
+    unpack_frames,
+)
+
 
 class Encoder:
-    """Polar Codes encoder."""
+    """Polar Codes encoder.
+
+    Args:
+        info_indices (np.array): Indices of information bits of the mask.
+        frozen_indices (np.array): Indices of frozen bits of the mask.
+            Both are computed from the mask if not set.
+
+    """
 
     def __init__(self,
                  mask: np.array,
                  n: int,
-                 is_systematic: bool = True):
+                 is_systematic: bool = True,
+                 info_indices: np.array = None,
+                 frozen_indices: np.array = None):
 
         self.n = n
         self.N = mask.shape[0]
         self.mask = mask
         self.is_systematic = is_systematic
 
+        if info_indices is None or frozen_indices is None:
+            info_indices, frozen_indices = compute_mask_indices(mask)
+        self.info_indices = info_indices
+        self.frozen_indices = frozen_indices
+
     def encode(self, message: np.array) -> np.array:
         """Encode message with a polar code.
 
@@ -27,11 +48,34 @@ class Encoder:
         encoded = self._non_systematic_encode(precoded, self.n)
 
         if self.is_systematic:
-            encoded *= self.mask
+            encoded[self.frozen_indices] = 0
             encoded = self._non_systematic_encode(encoded, self.n)
 
         return encoded
 
+    def encode_batch(self, messages: np.array) -> np.array:
+        """Encode a batch of messages with a polar code.
+
+        All stages of the polar transform are applied to the whole batch at
+        once. Support both non-systematic and systematic encoding.
+
+        Args:
+            messages (numpy.array): binary messages of shape (B, K),
+                one message per row.
+
+        Returns:
+            encoded (numpy.array): encoded messages of shape (B, N).
+
+        """
+        precoded = self._precode_batch(messages)
+        encoded = self._non_systematic_encode_batch(precoded, self.n)
+
+        if self.is_systematic:
+            encoded[:, self.frozen_indices] = 0
+            encoded = self._non_systematic_encode_batch(encoded, self.n)
+
+        return encoded
+
     def _precode(self, message: np.array) -> np.array:
         """Apply polar code mask to information message.
 
@@ -39,7 +83,13 @@ class Encoder:
 
         """
         precoded = np.zeros(self.N, dtype=int)
-        precoded[self.mask == 1] = message
+        precoded[self.info_indices] = message
+        return precoded
+
+    def _precode_batch(self, messages: np.array) -> np.array:
+        """Apply polar code mask to a batch of information messages."""
+        precoded = np.zeros((messages.shape[0], self.N), dtype=np.int8)
+        precoded[:, self.info_indices] = messages
         return precoded
 
     @staticmethod
@@ -67,6 +117,85 @@ class Encoder:
 
         return message
 
+    @staticmethod
+    def _non_systematic_encode_batch(messages: np.array, n: int) -> np.array:
+        """Non-systematic encoding of a batch of messages.
+
+        Each encoding step is a single XOR of the upper halves of all pairs
+        of groups with the lower halves, vectorized across the batch.
+
+        Args:
+            messages (numpy.array): precoded messages of shape (B, N).
+
+        Returns:
+            messages (numpy.array): non-systematically encoded messages.
+
+        """
+        messages = np.ascontiguousarray(messages)
+        batch_size = messages.shape[0]
+
+        for i in range(n - 1, -1, -1):
+            step = np.power(2, n - i - 1)
+            groups = np.power(2, i)
+
+            pairs = messages.reshape(batch_size, groups, 2, step)
+            pairs[:, :, 0, :] ^= pairs[:, :, 1, :]
+
+        return messages
+
+
+class BitSlicedEncoder(Encoder):
+    """Polar Codes encoder for batches of frames.
+
+    Packs 64 independent frames into each `uint64` word, so every XOR of
+    the polar transform advances 64 codewords at once.
+
+    """
+
+    def encode_batch(self, messages: np.array) -> np.array:
+        """Encode a batch of messages with a polar code.
+
+        Args:
+            messages (numpy.array): binary messages of shape (B, K),
+                one message per row.
+
+        Returns:
+            encoded (numpy.array): encoded messages of shape (B, N).
+
+        """
+        packed = self._precode_packed(pack_frames(messages))
+        packed = self.encode_packed(packed)
+        return unpack_frames(packed, messages.shape[0])
+
+    def encode_packed(self, packed: np.array) -> np.array:
+        """Encode precoded frames in bit-sliced representation.
+
+        Support both non-systematic and systematic encoding.
+
+        Args:
+            packed (numpy.array): precoded frames packed with
+                `pack_frames`, shape (N, W).
+
+        Returns:
+            packed (numpy.array): encoded frames in bit-sliced
+                representation.
+
+        """
+        packed = compute_bitsliced_encoding(packed, self.n)
+
+        if self.is_systematic:
+            packed[self.frozen_indices] = 0
+            packed = compute_bitsliced_encoding(packed, self.n)
+
+        return packed
+
+    def _precode_packed(self, packed_messages: np.array) -> np.array:
+        """Apply polar code mask to bit-sliced information messages."""
+        precoded = np.zeros((self.N, packed_messages.shape[1]),
+                            dtype=np.uint64)
+        precoded[self.info_indices] = packed_messages
+        return precoded
+
 
 class EncoderWithCRC(Encoder):
     """Polar Encoder with CRC support."""
@@ -75,8 +204,11 @@ class EncoderWithCRC(Encoder):
                  mask: np.array,
                  n: int,
                  crc_codec: CRC,
-                 is_systematic: bool = True,):
-        super().__init__(mask, n, is_systematic)
+                 is_systematic: bool = True,
+                 info_indices: np.array = None,
+                 frozen_indices: np.array = None):
+        super().__init__(mask, n, is_systematic, info_indices=info_indices,
+                         frozen_indices=frozen_indices)
         self.crc_codec = crc_codec
 
     def encode(self, message: np.array):
@@ -86,3 +218,11 @@ class EncoderWithCRC(Encoder):
             self.crc_codec.compute_crc(message),
         )
         return super().encode(message)
+
+    def encode_batch(self, messages: np.array) -> np.array:
+        """Compute CRC values and append to messages before encoding."""
+        messages = np.hstack([
+            messages,
+            self.crc_codec.compute_crc_batch(messages),
+        ])
+        return super().encode_batch(messages)
@@ -2,6 +2,29 @@
 import numba
 import numpy as np
 
+from .constants import (
+    BOX_PLUS,
+    MIN_SUM,
+    MIN_SUM_OFFSET,
+    MIN_SUM_SCALE,
+    NORMALIZED_MIN_SUM,
+    OFFSET_MIN_SUM,
+)
+
+
+def compute_mask_indices(mask):
+    """Get indices of information and frozen bits of polar code mask.
+
+    Index arrays are read-only, so they are shared by the encoder, the
+    decoder and decoding paths of the same code.
+
+    """
+    info_indices = np.flatnonzero(mask == 1)
+    frozen_indices = np.flatnonzero(mask == 0)
+    info_indices.flags.writeable = False
+    frozen_indices.flags.writeable = False
+    return info_indices, frozen_indices
+
 
 @numba.njit
 def compute_encoding_step(level, n, source, result):
@@ -19,12 +42,139 @@ def compute_encoding_step(level, n, source, result):
     return result
 
 
+# Number of frames packed into a single word of bit-sliced representation
+FRAMES_PER_WORD = 64
+
+
+@numba.njit
+def pack_frames(frames):
+    """Pack binary frames into bit-sliced representation.
+
+    Frames of shape (B, N) are packed into `uint64` words of shape (N, W),
+    W = ceil(B / 64). Bit `j` of word `packed[i, w]` is bit `i` of frame
+    `64 * w + j`, so a single XOR of two words processes 64 frames.
+
+    """
+    batch_size, N = frames.shape
+    words = (batch_size + FRAMES_PER_WORD - 1) // FRAMES_PER_WORD
+    packed = np.zeros((N, words), dtype=np.uint64)
+
+    for b in range(batch_size):
+        w = b // FRAMES_PER_WORD
+        shift = np.uint64(b % FRAMES_PER_WORD)
+        for i in range(N):
+            packed[i, w] |= np.uint64(frames[b, i] & 1) << shift
+
+    return packed
+
+
+@numba.njit
+def unpack_frames(packed, batch_size):
+    """Unpack `batch_size` frames from bit-sliced representation."""
+    N = packed.shape[0]
+    frames = np.empty((batch_size, N), dtype=np.int8)
+
+    for b in range(batch_size):
+        w = b // FRAMES_PER_WORD
+        shift = np.uint64(b % FRAMES_PER_WORD)
+        for i in range(N):
+            frames[b, i] = (packed[i, w] >> shift) & np.uint64(1)
+
+    return frames
+
+
+@numba.njit
+def compute_bitsliced_encoding(packed, n):
+    """Polar transform of frames in bit-sliced representation.
+
+    Implements the same encoding steps as `compute_encoding_step`, but each
+    XOR advances 64 frames at once.
+
+    """
+    words = packed.shape[1]
+
+    for level in range(n - 1, -1, -1):
+        pairs_per_group = step = np.power(2, n - level - 1)
+        groups = np.power(2, level)
+
+        for g in range(groups):
+            start = 2 * g * step
+
+            for p in range(start, start + pairs_per_group):
+                for w in range(words):
+                    packed[p, w] ^= packed[p + step, w]
+
+    return packed
+
+
+# Table of log(1 + exp(-x)) for x in [0, 8) used by box-plus kernel, the
+# value is close to 0 for bigger x
+BOX_PLUS_TABLE_STEP = 0.125
+BOX_PLUS_TABLE = np.log1p(np.exp(-np.arange(0, 8, BOX_PLUS_TABLE_STEP)))
+
+
 @numba.njit
-def compute_alpha(a, b):
+def compute_box_plus_correction(x, scale=1.):
+    """Approximate log(1 + exp(-x)) for x >= 0 by the table.
+
+    Both `x` and the result are in units of 1 / `scale`.
+
+    """
+    index = int(x / (BOX_PLUS_TABLE_STEP * scale) + 0.5)
+    if index < BOX_PLUS_TABLE.size:
+        return BOX_PLUS_TABLE[index] * scale
+    return 0.
+
+
+@numba.njit
+def check_node(a, b, kernel=MIN_SUM, scale=1.):
+    """Compute check node (F function) of two LLR values.
+
+    Supports the kernels:
+        * MIN_SUM - sign(a) * sign(b) * min(|a|, |b|);
+        * OFFSET_MIN_SUM - min-sum with the magnitude reduced by the offset;
+        * NORMALIZED_MIN_SUM - min-sum with the magnitude scaled down;
+        * BOX_PLUS - exact box-plus operation, the correction terms are
+          taken from the table.
+
+    LLR values are in units of 1 / `scale`, e.g. quantized LLRs with `f`
+    fractional bits are in units of 2^-f, so the offset and the box-plus
+    correction are scaled by 2^f.
+
+    """
+    sign = np.sign(a) * np.sign(b)
+    magnitude = min(np.fabs(a), np.fabs(b))
+
+    if kernel == OFFSET_MIN_SUM:
+        magnitude = max(magnitude - MIN_SUM_OFFSET * scale, 0.)
+    elif kernel == NORMALIZED_MIN_SUM:
+        magnitude *= MIN_SUM_SCALE
+    elif kernel == BOX_PLUS:
+        return (sign * magnitude
+                + compute_box_plus_correction(np.fabs(a + b), scale)
+                - compute_box_plus_correction(np.fabs(a - b), scale))
+
+    return sign * magnitude
+
+
+@numba.njit
+def saturate(value, limit):
+    """Saturate quantized LLR value to [-limit, limit].
+
+    Floating point LLR values (`limit` = 0) are returned as is.
+
+    """
+    if limit > 0:
+        return min(max(value, -limit), limit)
+    return value
+
+
+@numba.njit
+def compute_alpha(a, b, kernel=MIN_SUM):
     """Basic function to compute intermediate LLR values."""
     c = np.zeros(a.shape[0])
     for i in range(c.shape[0]):
-        c[i] = np.sign(a[i]) * np.sign(b[i]) * np.fabs(np.array([a[i], b[i]])).min()
+        c[i] = check_node(a[i], b[i], kernel)
     return c
 
 
@@ -35,12 +185,12 @@ def make_hard_decision(soft_input):
 
 
 @numba.njit
-def compute_left_alpha(llr):
+def compute_left_alpha(llr, kernel=MIN_SUM):
     """Compute Alpha for left node during SC-based decoding."""
     N = llr.size // 2
     left = llr[:N]
     right = llr[N:]
-    return compute_alpha(left, right)
+    return compute_alpha(left, right, kernel)
 
 
 @numba.njit
@@ -50,3 +200,32 @@ def compute_right_alpha(llr, left_beta):
     left = llr[:N]
     right = llr[N:]
     return right - (2 * left_beta - 1) * left
+
+
+# Functions below write the result into preallocated `result` array, so
+# decoders keep LLRs of all nodes in the same memory
+
+
+@numba.njit
+def compute_left_llr(llr, result, kernel=MIN_SUM, scale=1.):
+    """Compute LLRs of the left child node into `result`.
+
+    Check-node results of quantized LLRs are truncated towards zero.
+
+    """
+    N = result.size
+    for i in range(N):
+        result[i] = check_node(llr[i], llr[i + N], kernel, scale)
+
+
+@numba.njit
+def compute_right_llr(llr, left_bits, result, limit=0):
+    """Compute LLRs of the right child node into `result`.
+
+    Quantized LLRs are saturated to [-limit, limit].
+
+    """
+    N = result.size
+    for i in range(N):
+        result[i] = saturate(llr[i + N] + (1 - 2 * left_bits[i]) * llr[i],
+                             limit)
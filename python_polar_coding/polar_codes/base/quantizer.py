@@ -0,0 +1,52 @@
+import numpy as np
+
+
+class Quantizer:
+    """Fixed-point quantizer of LLR values.
+
+    LLR values are multiplied by 2^fractional_bits, rounded and saturated
+    to the symmetric range [-limit, limit] of signed integers of given size,
+    limit = 2^(bits - 1) - 1. Decoders keep quantized LLRs in integer memory
+    and saturate the results of G function to the same range.
+
+    Args:
+        bits (int): Size of quantized LLR value, 8 or 16.
+        fractional_bits (int): Number of fractional bits of quantized LLR.
+
+    """
+    DTYPES = {
+        8: np.int8,
+        16: np.int16,
+    }
+
+    def __init__(self, bits: int = 8, fractional_bits: int = 0):
+        assert bits in self.DTYPES, f'Unsupported LLR size ({bits} bits)'
+        assert 0 <= fractional_bits < bits, (
+            f'Cannot quantize {bits}-bit LLR with {fractional_bits} '
+            f'fractional bits')
+
+        self.bits = bits
+        self.fractional_bits = fractional_bits
+
+    def __str__(self):
+        return f'Q{self.bits - self.fractional_bits}.{self.fractional_bits}'
+
+    @property
+    def dtype(self):
+        """Type of quantized LLR values."""
+        return self.DTYPES[self.bits]
+
+    @property
+    def scale(self):
+        """Quantized value of LLR = 1."""
+        return 2 ** self.fractional_bits
+
+    @property
+    def limit(self):
+        """Maximal magnitude of quantized LLR value."""
+        return 2 ** (self.bits - 1) - 1
+
+    def quantize(self, llr: np.array) -> np.array:
+        """Quantize LLR values of any shape."""
+        scaled = np.round(np.asarray(llr) * self.scale)
+        return np.clip(scaled, -self.limit, self.limit).astype(self.dtype)
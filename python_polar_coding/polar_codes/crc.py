@@ -19,6 +19,8 @@ class CRC:
     def __init__(self, crc_size):
         self.crc_size = crc_size
         self.crc_coder = self.crc_classes[crc_size]()
+        # Cache of CRC generator matrices per message length
+        self._generators = dict()
 
     def compute_crc(self, message: np.array) -> np.array:
         """Compute CRC value."""
@@ -27,6 +29,38 @@ class CRC:
             size=self.crc_size,
         )
 
+    def compute_crc_batch(self, messages: np.array) -> np.array:
+        """Compute CRC values for a batch of messages of the same length.
+
+        CRC is an affine function of message bits, so the CRC of each row
+        is computed as a single matrix product over GF(2).
+
+        Args:
+            messages (numpy.array): binary messages of shape (B, K).
+
+        Returns:
+            (numpy.array): CRC values of shape (B, CRC size).
+
+        """
+        zero_crc, generator = self._get_generator(messages.shape[1])
+        return (messages @ generator + zero_crc) % 2
+
+    def _get_generator(self, message_size: int):
+        """Get CRC of all-zero message and CRC generator matrix.
+
+        Row `i` of the generator matrix is the change of CRC value caused by
+        the `i`-th message bit.
+
+        """
+        if message_size not in self._generators:
+            zero_crc = self.compute_crc(np.zeros(message_size, dtype=int))
+            unit_messages = np.eye(message_size, dtype=int)
+            generator = np.array([
+                self.compute_crc(m) ^ zero_crc for m in unit_messages
+            ])
+            self._generators[message_size] = (zero_crc, generator)
+        return self._generators[message_size]
+
     def _compute_crc(self, message: np.array) -> int:
         """Compute CRC bytes value."""
         bit_string = ''.join(str(m) for m in message)
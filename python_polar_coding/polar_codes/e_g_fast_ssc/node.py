@@ -1,9 +1,16 @@
 import numpy as np
 
+from python_polar_coding.polar_codes.base import (
+    compute_left_llr,
+    compute_right_llr,
+)
+from python_polar_coding.polar_codes.fast_ssc import (
+    compute_parent_bits,
+    compute_repetition_bits,
+    program,
+)
 from python_polar_coding.polar_codes.g_fast_ssc import GeneralizedFastSSCNode
 
-from .functions import compute_left_alpha_sign, compute_right_alpha
-
 
 class EGFastSSCNode(GeneralizedFastSSCNode):
     """Decoder for Generalized Fast SSC code.
@@ -14,11 +21,22 @@ class EGFastSSCNode(GeneralizedFastSSCNode):
     ZERO_ANY = 'ZERO-ANY'
     REP_ANY = 'REP-ANY'
 
+    OPCODES = {
+        **GeneralizedFastSSCNode.OPCODES,
+        ZERO_ANY: program.ZERO_ANY,
+        REP_ANY: program.REP_ANY,
+    }
+
     def __init__(self, *args, **kwargs):
         # Contains `ANY` node for ZERO_ANY or REP_ANY
         self.inner_node = None
         super().__init__(*args, **kwargs)
 
+        # Inner node keeps LLRs of the same type as the node
+        if self.inner_node is not None:
+            self.inner_node._alpha = np.zeros(self.inner_node.N,
+                                              dtype=self._alpha.dtype)
+
     @property
     def is_any(self):
         return (
@@ -38,6 +56,24 @@ class EGFastSSCNode(GeneralizedFastSSCNode):
     def is_rep_any(self):
         return self._node_type == self.REP_ANY
 
+    def _classify(self):
+        node_type = super()._classify()
+        # Inner nodes are not cached because they keep decoding state
+        if self.inner_node is None and node_type in (self.ZERO_ANY,
+                                                     self.REP_ANY):
+            self.inner_node = self._create_inner_node(self._mask)
+        return node_type
+
+    def _create_inner_node(self, mask):
+        """Create `ANY` node from the right half of the mask."""
+        return self.__class__(
+            mask=mask[mask.size // 2:],
+            name=self.ROOT,
+            N_min=self.N_min,
+            AF=self.AF,
+            build_tree=False,
+        )
+
     def get_node_type(self):
         ntype = super().get_node_type()
         if ntype != self.OTHER:
@@ -53,12 +89,7 @@ class EGFastSSCNode(GeneralizedFastSSCNode):
         left, right = np.split(mask, 2)
         if not self._check_is_zero(left):
             return False
-        inner_node = self.__class__(
-            mask=right,
-            name=self.ROOT,
-            N_min=self.N_min,
-            AF=self.AF
-        )
+        inner_node = self._create_inner_node(mask)
         if not inner_node.is_any:
             return False
 
@@ -70,12 +101,7 @@ class EGFastSSCNode(GeneralizedFastSSCNode):
         left, right = np.split(mask, 2)
         if not self._check_is_rep(left):
             return False
-        right_node = self.__class__(
-            mask=right,
-            name=self.ROOT,
-            N_min=self.N_min,
-            AF=self.AF
-        )
+        right_node = self._create_inner_node(mask)
         if not right_node.is_any:
             return False
 
@@ -87,31 +113,28 @@ class EGFastSSCNode(GeneralizedFastSSCNode):
         klass = self.__class__
 
         if self._node_type == klass.ZERO_ANY:
-            self._beta = self.compute_zero_any()
+            self.compute_zero_any()
         if self._node_type == klass.REP_ANY:
-            self._beta = self.compute_rep_any()
+            self.compute_rep_any()
 
     def compute_zero_any(self):
         """"""
-        right_alpha = compute_right_alpha(self.alpha, left_sign=1)
-
-        self.inner_node.alpha = right_alpha
-        self.inner_node.compute_leaf_beta()
-
-        beta = np.zeros(self.N, dtype=np.int8)
-        beta[:self.inner_node.N] = self.inner_node.beta
-        beta[self.inner_node.N:] = self.inner_node.beta
-        return beta
+        left_beta = self._beta[:self.inner_node.N]
+        left_beta[:] = 0
+        self._compute_inner_beta(left_beta)
 
     def compute_rep_any(self):
         """"""
-        left_sign = compute_left_alpha_sign(self.alpha)
-        right_alpha = compute_right_alpha(self.alpha, left_sign)
-
-        self.inner_node.alpha = right_alpha
+        # Inner node ALPHA is used to compute the repetition first
+        left_beta = self._beta[:self.inner_node.N]
+        compute_left_llr(self.alpha, self.inner_node.alpha, self.kernel,
+                         self.llr_scale)
+        compute_repetition_bits(self.inner_node.alpha, left_beta)
+        self._compute_inner_beta(left_beta)
+
+    def _compute_inner_beta(self, left_beta):
+        """Compute BETA of the node given BETA of the left half."""
+        compute_right_llr(self.alpha, left_beta, self.inner_node.alpha,
+                          self.llr_limit)
         self.inner_node.compute_leaf_beta()
-
-        beta = np.zeros(self.N, dtype=np.int8)
-        beta[:self.inner_node.N] = self.inner_node.beta
-        beta[self.inner_node.N:] = self.inner_node.beta
-        return beta
+        compute_parent_bits(left_beta, self.inner_node.beta, self._beta)
@@ -2,3 +2,4 @@ from .codec import FastSSCPolarCodec
 from .decoder import FastSSCDecoder
 from .functions import *
 from .node import FastSSCNode
+from .tree import DecodingTree
@@ -1,17 +1,30 @@
 import numpy as np
-from anytree import PreOrderIter
 
-from python_polar_coding.polar_codes.base.functions import (
-    compute_left_alpha,
-    compute_right_alpha,
+from python_polar_coding.polar_codes.base import (
+    Quantizer,
+    compute_left_llr,
+    compute_right_llr,
 )
 from python_polar_coding.polar_codes.sc import SCDecoder
 
+from .functions import compute_parent_bits
 from .node import FastSSCNode
+from .program import (
+    compile_program,
+    execute_program,
+    execute_program_batch,
+)
+from .tree import DecodingTree
 
 
 class FastSSCDecoder(SCDecoder):
-    """Implements Fast SSC decoding algorithm."""
+    """Implements Fast SSC decoding algorithm.
+
+    Args:
+        compiled (bool): Decode by executing the decoding tree lowered into
+            a program of instructions instead of walking the tree.
+
+    """
     node_class = FastSSCNode
 
     def __init__(
@@ -20,33 +33,82 @@ class FastSSCDecoder(SCDecoder):
             mask: np.array,
             is_systematic: bool = True,
             code_min_size: int = 0,
+            compiled: bool = False,
+            check_node: str = 'min-sum',
+            quantizer: Quantizer = None,
+            dtype=np.double,
+            info_indices: np.array = None,
     ):
-        super().__init__(n=n, mask=mask, is_systematic=is_systematic)
-        self._decoding_tree = self.setup_decoding_tree(code_min_size)
+        super().__init__(n=n, mask=mask, is_systematic=is_systematic,
+                         compiled=compiled, check_node=check_node,
+                         quantizer=quantizer, dtype=dtype,
+                         info_indices=info_indices)
+        self._tree = self.setup_decoding_tree(code_min_size)
+        self._nodes = None
+        self._leaves = None
+        self._paths = None
         self._position = 0
+        # Decoding program is used by compiled and batch decoding and is
+        # shared by all the threads of parallel batch decoding
+        self._program = compile_program(self._tree)
+
+        # Number of decoded frames, marks ALPHA values computed for the
+        # current frame instead of resetting all the nodes
+        self._generation = 0
+
+        # ALPHA and BETA values of all nodes of the decoding tree
+        self._alpha = self._beta = None
+        if not compiled:
+            self._alpha = np.zeros(self._tree.arena_size,
+                                   dtype=self.llr_dtype)
+            self._beta = np.zeros(self._tree.arena_size,
+                                  dtype=self.beta_dtype)
+
+    @property
+    def beta_dtype(self):
+        """Type of BETA values of the nodes."""
+        return self.node_class.BETA_DTYPE
 
     def setup_decoding_tree(self, N_min, **kwargs):
         """Setup decoding tree."""
-        return self.node_class(mask=self.mask, N_min=N_min)
+        return DecodingTree(mask=self.mask, node_class=self.node_class,
+                            N_min=N_min, **kwargs)
+
+    @property
+    def _decoding_tree(self):
+        """Decoding tree of nodes.
+
+        Built on first access, compiled decoding does not use it.
+
+        """
+        if self._nodes is None:
+            self._nodes = self._tree.to_anytree(alpha=self._alpha,
+                                                beta=self._beta,
+                                                kernel=self._kernel,
+                                                llr_limit=self.llr_limit,
+                                                llr_scale=self.llr_scale)
+            self._leaves = self._nodes.leaves
+            self._paths = {leaf: leaf.path[1:] for leaf in self._leaves}
+        return self._nodes
 
     def _set_initial_state(self, received_llr):
         """Initialize decoder with received message."""
-        self.current_state = np.zeros(self.n, dtype=np.int8)
-        self.previous_state = np.ones(self.n, dtype=np.int8)
-
         # LLR values at intermediate steps
         self._position = 0
         self._decoding_tree.root.alpha = received_llr
 
     def decode_internal(self, received_llr: np.array) -> np.array:
         """Implementation of SC decoding method."""
-        self._set_initial_state(received_llr)
+        if self.compiled:
+            execute_program(self._program, received_llr,
+                            self._llr, self._bits[self.N:], self._kernel,
+                            self.llr_limit, self.llr_scale)
+            return self.result
 
-        # Reset the state of the tree before decoding
-        for node in PreOrderIter(self._decoding_tree):
-            node.is_computed = False
+        self._set_initial_state(received_llr)
+        self._generation += 1
 
-        for leaf in self._decoding_tree.leaves:
+        for leaf in self._leaves:
             self._set_decoder_state(self._position)
             self.compute_intermediate_alpha(leaf)
             leaf.compute_leaf_beta()
@@ -55,6 +117,16 @@ class FastSSCDecoder(SCDecoder):
 
         return self.result
 
+    def decode_batch_internal(self, received_llr: np.array):
+        """Decode a batch of frames at once by the decoding program."""
+        batch_size = received_llr.shape[0]
+        llr = np.zeros((2 * self.N - 1, batch_size), dtype=self.llr_dtype)
+        bits = np.zeros((self.N, batch_size), dtype=np.int8)
+
+        execute_program_batch(self._program, received_llr, llr, bits,
+                              self._kernel, self.llr_limit, self.llr_scale)
+        return bits.T, dict()
+
     @property
     def root(self):
         """Returns root node of decoding tree."""
@@ -63,32 +135,32 @@ class FastSSCDecoder(SCDecoder):
     @property
     def result(self):
         if self.is_systematic:
-            return self.root.beta
+            return self._bits[self.N:] if self.compiled else self.root.beta
 
     @property
     def M(self):
-        return self._decoding_tree.M
+        return self._tree.M
 
     def compute_intermediate_alpha(self, leaf):
         """Compute intermediate Alpha values (LLR)."""
-        for node in leaf.path[1:]:
-            if node.is_computed:
+        for node in self._paths[leaf]:
+            if node.generation == self._generation:
                 continue
 
             # No need to compute zero node because output is vector of zeros
             if node.is_zero:
                 continue
 
-            parent_alpha = node.parent.alpha
+            parent = node.parent
 
             if node.is_left:
-                node.alpha = compute_left_alpha(parent_alpha)
-                continue
-
-            left_node = node.siblings[0]
-            left_beta = left_node.beta
-            node.alpha = compute_right_alpha(parent_alpha, left_beta)
-            node.is_computed = True
+                compute_left_llr(parent.alpha, node.alpha, self._kernel,
+                                 self.llr_scale)
+            else:
+                left_node = parent.children[0]
+                compute_right_llr(parent.alpha, left_node.beta, node.alpha,
+                                  self.llr_limit)
+            node.generation = self._generation
 
     def compute_intermediate_beta(self, node):
         """Compute intermediate Beta values (BIT)."""
@@ -99,16 +171,9 @@ class FastSSCDecoder(SCDecoder):
             return
 
         parent = node.parent
-        left = node.siblings[0]
-        parent.beta = self.compute_parent_beta(left.beta, node.beta)
+        left = parent.children[0]
+        compute_parent_bits(left.beta, node.beta, parent.beta)
         return self.compute_intermediate_beta(parent)
 
     def set_next_state(self, leaf_size):
         self._position += leaf_size
-
-    @staticmethod
-    def compute_parent_beta(left, right):
-        """Compute Beta (BITS) of a parent Node."""
-        N = left.size
-        # append - njit incompatible
-        return np.append((left + right) % 2, right)
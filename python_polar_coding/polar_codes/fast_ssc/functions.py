@@ -29,3 +29,76 @@ def compute_repetition(llr):
         np.zeros(llr.size, dtype=np.int8) if np.sum(llr) >= 0
         else np.ones(llr.size, dtype=np.int8)
     )
+
+
+# Functions below write the result into preallocated `result` array, so
+# decoders keep LLRs and bits of all nodes in the same memory
+
+
+@numba.njit
+def compute_parent_bits(left_bits, right_bits, result):
+    """Compute bits of the parent node into `result`."""
+    N = left_bits.size
+    for i in range(N):
+        result[i] = left_bits[i] ^ right_bits[i]
+        result[i + N] = right_bits[i]
+
+
+@numba.njit
+def compute_hard_decision(llr, result):
+    """Make hard decision on LLRs into `result`."""
+    for i in range(llr.size):
+        result[i] = llr[i] < 0
+
+
+@numba.njit
+def compute_spc_bits(llr, result):
+    """Compute bits for Single Parity Check node into `result`."""
+    parity = 0
+    arg_min = 0
+    for i in range(llr.size):
+        result[i] = llr[i] < 0
+        parity ^= result[i]
+        if np.fabs(llr[i]) < np.fabs(llr[arg_min]):
+            arg_min = i
+    result[arg_min] ^= parity
+
+
+@numba.njit
+def compute_repetition_bits(llr, result):
+    """Compute bits for Repetition node into `result`."""
+    result[:] = 1 if np.sum(llr) < 0 else 0
+
+
+@numba.njit
+def compute_g_repetition_bits(llr, result, mask_steps, last_chunk_type):
+    """Compute bits for Generalized Repetition node into `result`."""
+    step = llr.size // mask_steps
+
+    last_llr = np.zeros(step)
+    for j in range(mask_steps):
+        last_llr += llr[j * step:(j + 1) * step]
+
+    if last_chunk_type == 1:
+        compute_hard_decision(last_llr, result[:step])
+    else:
+        compute_spc_bits(last_llr, result[:step])
+
+    for j in range(1, mask_steps):
+        result[j * step:(j + 1) * step] = result[:step]
+
+
+@numba.njit
+def compute_rg_parity_bits(llr, result, mask_steps):
+    """Compute bits for Relaxed Generalized Parity Check node into `result`.
+    """
+    step = llr.size // mask_steps
+    chunk_llr = np.zeros(mask_steps)
+    chunk_bits = np.zeros(mask_steps, dtype=result.dtype)
+
+    for i in range(step):
+        for j in range(mask_steps):
+            chunk_llr[j] = llr[i + j * step]
+        compute_spc_bits(chunk_llr, chunk_bits)
+        for j in range(mask_steps):
+            result[i + j * step] = chunk_bits[j]
@@ -1,9 +1,16 @@
+import threading
+from collections import OrderedDict
+
 import numpy as np
 from anytree import Node
 
-from python_polar_coding.polar_codes.base import make_hard_decision
-
-from .functions import compute_repetition, compute_single_parity_check
+from ..base import MIN_SUM
+from . import program
+from .functions import (
+    compute_hard_decision,
+    compute_repetition_bits,
+    compute_spc_bits,
+)
 
 
 class FastSSCNode(Node):
@@ -24,8 +31,40 @@ class FastSSCNode(Node):
     # Minimal size of Repetition Fast SSC Node
     REPETITION_MIN_SIZE = 2
 
-    def __init__(self, mask, name=ROOT, N_min=None, **kwargs):
-        """A node of Fast SSC decoder."""
+    # Type of BETA values
+    BETA_DTYPE = np.int8
+
+    # Maximal number of node classifications shared by all decoding trees
+    CACHE_SIZE = 2 ** 16
+    # Attributes the classification depends on
+    CLASSIFICATION_PARAMETERS = ()
+    # Attributes set on classification and restored from the cache
+    CACHED_ATTRIBUTES = ()
+
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    # Instructions of decoding program to compute BETA of leaf nodes
+    OPCODES = {
+        ZERO_NODE: program.ZERO,
+        ONE_NODE: program.ONE,
+        SINGLE_PARITY_CHECK: program.SINGLE_PARITY_CHECK,
+        REPETITION: program.REPETITION,
+    }
+
+    def __init__(self, mask, name=ROOT, N_min=None, build_tree=True,
+                 alpha=None, beta=None, kernel=MIN_SUM, llr_limit=0,
+                 llr_scale=1, **kwargs):
+        """A node of Fast SSC decoder.
+
+        Set `build_tree` to False to create the node without children.
+        `alpha` and `beta` are arrays to store values of the node in, e.g.
+        views of memory shared by all nodes of a decoding tree. `kernel` is
+        the check-node kernel used to compute BETA of the node, `llr_limit`
+        is the maximal magnitude of quantized LLRs and `llr_scale` is the
+        quantized value of LLR = 1.
+
+        """
         if name not in self.__class__.NODE_NAMES:
             raise ValueError('Wrong Fast SSC Node type')
 
@@ -33,12 +72,19 @@ class FastSSCNode(Node):
 
         self._mask = mask
         self.N_min = N_min
-        self._node_type = self.get_node_type()
-        self._alpha = np.zeros(self.N, dtype=np.double)
-        self._beta = np.zeros(self.N, dtype=np.int8)
-
-        self.is_computed = False
-        self._build_decoding_tree()
+        self.kernel = kernel
+        self.llr_limit = llr_limit
+        self.llr_scale = llr_scale
+        self._node_type = self._classify()
+        self._alpha = (np.zeros(self.N, dtype=np.double) if alpha is None
+                       else alpha)
+        self._beta = (np.zeros(self.N, dtype=self.BETA_DTYPE) if beta is None
+                      else beta)
+
+        # Number of the decoded frame the ALPHA values were computed for
+        self.generation = 0
+        if build_tree:
+            self._build_decoding_tree()
 
     def __str__(self):
         return ''.join([str(m) for m in self._mask])
@@ -63,7 +109,7 @@ class FastSSCNode(Node):
     def alpha(self, value):
         if self._mask.size != value.size:
             raise ValueError('Wrong size of LLR vector')
-        self._alpha = np.array(value)
+        self._alpha[:] = value
 
     @property
     def beta(self):
@@ -73,7 +119,7 @@ class FastSSCNode(Node):
     def beta(self, value):
         if self._mask.size != value.size:
             raise ValueError('Wrong size of Bits vector')
-        self._beta = np.array(value)
+        self._beta[:] = value
 
     @property
     def is_left(self):
@@ -134,18 +180,94 @@ class FastSSCNode(Node):
             raise TypeError('Cannot make decision in not a leaf node.')
 
         if self._node_type == FastSSCNode.ZERO_NODE:
-            self._beta = np.zeros(self.N, dtype=np.int8)
+            self._beta[:] = 0
         if self._node_type == FastSSCNode.ONE_NODE:
-            self._beta = make_hard_decision(self.alpha)
+            compute_hard_decision(self.alpha, self._beta)
         if self._node_type == FastSSCNode.SINGLE_PARITY_CHECK:
-            self._beta = compute_single_parity_check(self.alpha)
+            compute_spc_bits(self.alpha, self._beta)
         if self._node_type == FastSSCNode.REPETITION:
-            self._beta = compute_repetition(self.alpha)
+            compute_repetition_bits(self.alpha, self._beta)
 
     def _initialize_beta(self):
         """Initialize BETA values on tree building."""
         return np.zeros(self.N, dtype=np.int8)
 
+    @classmethod
+    def classify(cls, mask, N_min=None, **kwargs):
+        """Get the type of a node and attributes set on classification.
+
+        A node without subtree is created only if the mask is not in the
+        cache of classifications.
+
+        Returns:
+            node_type (str): Type of the node.
+            attributes (dict): Attributes of the node, e.g. chunks
+                parameters of Generalized nodes.
+
+        """
+        key = cls._get_cache_key(mask, N_min, **kwargs)
+        cached = cls._get_cached(key)
+        if cached is None:
+            node = cls(mask=mask, N_min=N_min, build_tree=False, **kwargs)
+            cached = node.type, node._get_cached_attributes()
+        node_type, attributes = cached
+        return node_type, dict(zip(cls.CACHED_ATTRIBUTES, attributes))
+
+    @classmethod
+    def clear_cache(cls):
+        """Clear the cache of node classifications."""
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    @classmethod
+    def _get_cache_key(cls, mask, N_min, **kwargs):
+        """Get the key of node classification in the cache."""
+        mask = np.asarray(mask, dtype=np.int8)
+        parameters = tuple(kwargs.get(name)
+                           for name in cls.CLASSIFICATION_PARAMETERS)
+        return (cls, mask.tobytes(), N_min) + parameters
+
+    @classmethod
+    def _get_cached(cls, key):
+        with cls._cache_lock:
+            cached = cls._cache.get(key)
+            if cached is not None:
+                cls._cache.move_to_end(key)
+        return cached
+
+    @classmethod
+    def _set_cached(cls, key, value):
+        with cls._cache_lock:
+            cls._cache[key] = value
+            if len(cls._cache) > cls.CACHE_SIZE:
+                cls._cache.popitem(last=False)
+
+    def _get_cached_attributes(self):
+        return tuple(getattr(self, name) for name in self.CACHED_ATTRIBUTES)
+
+    def _classify(self):
+        """Get the type of the node.
+
+        Classifications are cached by mask content, so repeated sub-masks
+        of a tree and trees of the same code are classified once. The least
+        recently used classifications are evicted from the cache.
+
+        """
+        parameters = {name: getattr(self, name)
+                      for name in self.CLASSIFICATION_PARAMETERS}
+        key = self._get_cache_key(self._mask, self.N_min, **parameters)
+        cached = self._get_cached(key)
+
+        if cached is not None:
+            node_type, attributes = cached
+            for name, value in zip(self.CACHED_ATTRIBUTES, attributes):
+                setattr(self, name, value)
+            return node_type
+
+        node_type = self.get_node_type()
+        self._set_cached(key, (node_type, self._get_cached_attributes()))
+        return node_type
+
     def get_node_type(self):
         """Get the type of Fast SSC Node.
 
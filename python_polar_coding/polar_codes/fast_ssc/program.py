@@ -0,0 +1,235 @@
+"""Decoding programs of Fast SSC decoders.
+
+A decoding tree of Fast SSC family decoders is lowered into a linear
+program of instructions executed by a single compiled interpreter loop.
+
+Each instruction is a row of 5 integers: opcode, size of the node, offset
+of the node in the codeword and two parameters of the node (number of
+chunks and type of the last chunk for Generalized nodes).
+
+LLRs are stored in flat memory of size 2N - 1 as for compiled SC decoding:
+LLRs of a node of size `s` take positions [s - 1, 2s - 1). Bits are stored
+in a single array of size N: bits of a node take the positions of the node
+in the codeword, so the parent bits are combined in place.
+
+A batch of frames is decoded by the same program over the memory with an
+extra last axis of size B: F, G and COMBINE instructions are computed for
+all the frames at once, leaf nodes are decoded for each frame.
+
+"""
+import numba
+import numpy as np
+
+from ..base import (
+    MIN_SUM,
+    check_node,
+    compute_left_llr,
+    compute_right_llr,
+    saturate,
+)
+from .functions import (
+    compute_g_repetition_bits,
+    compute_hard_decision,
+    compute_repetition_bits,
+    compute_rg_parity_bits,
+    compute_spc_bits,
+)
+
+# Compute LLRs of the left child
+F = 0
+# Compute LLRs of the right child
+G = 1
+# Compute bits of the parent from bits of the children
+COMBINE = 2
+
+ZERO = 3
+ONE = 4
+SINGLE_PARITY_CHECK = 5
+REPETITION = 6
+G_REPETITION = 7
+RG_PARITY = 8
+
+# Compute LLRs of the right half and bits of the left half of ZERO-ANY and
+# REP-ANY nodes; bits of the right half are computed by the next instruction
+ZERO_ANY = 9
+REP_ANY = 10
+
+INSTRUCTION_SIZE = 5
+
+
+def compile_program(tree, zero_llr: bool = False) -> np.array:
+    """Lower a decoding tree stored in arrays into a program.
+
+    Set `zero_llr` to compute LLRs of ZERO nodes, e.g. to update path
+    metrics of list decoding.
+
+    """
+    opcodes = tree.node_class.OPCODES
+    program = list()
+    stack = [0]
+
+    # Iterative traversal: leaves are decoded from left to right and bits of
+    # the parent are combined when both children are decoded. Instructions
+    # of inner nodes are put on the stack as is.
+    while stack:
+        item = stack.pop()
+        if isinstance(item, tuple):
+            program.append(item)
+            continue
+
+        node_type = tree.types[item]
+        size = tree.sizes[item]
+        offset = tree.offsets[item]
+        half = size // 2
+        left, right = tree.left[item], tree.right[item]
+
+        if left == tree.NO_NODE:
+            if node_type not in opcodes:
+                raise TypeError(f'Cannot compile {node_type} node.')
+            program.append((opcodes[node_type], size, offset,
+                            tree.mask_steps[item],
+                            tree.last_chunk_types[item]))
+
+            # Compute bits of inner node of ZERO-ANY and REP-ANY nodes
+            inner_type = tree.inner_types[item]
+            if inner_type:
+                program.append((opcodes[inner_type], half, offset + half,
+                                tree.inner_mask_steps[item],
+                                tree.inner_last_chunk_types[item]))
+                program.append((COMBINE, size, offset, 0, 0))
+            continue
+
+        stack.append((COMBINE, size, offset, 0, 0))
+        stack.append(right)
+        # No need to compute LLRs of zero node because output is vector
+        # of zeros
+        if zero_llr or tree.types[right] != tree.node_class.ZERO_NODE:
+            stack.append((G, size, offset, 0, 0))
+        stack.append(left)
+        if zero_llr or tree.types[left] != tree.node_class.ZERO_NODE:
+            stack.append((F, size, offset, 0, 0))
+
+    return np.array(program, dtype=np.int64).reshape(-1, INSTRUCTION_SIZE)
+
+
+@numba.njit
+def execute_program(program, received_llr, llr, bits, kernel=MIN_SUM,
+                    limit=0, scale=1):
+    """Execute decoding program for received LLRs.
+
+    `kernel` is the check-node kernel to compute LLRs of left children.
+    Quantized LLRs of right children are saturated to [-limit, limit],
+    `scale` is the quantized value of LLR = 1.
+
+    """
+    N = received_llr.size
+    llr[N - 1:] = received_llr
+
+    for k in range(program.shape[0]):
+        opcode = program[k, 0]
+        size = program[k, 1]
+        offset = program[k, 2]
+        alpha = llr[size - 1:2 * size - 1]
+        beta = bits[offset:offset + size]
+        half = size // 2
+
+        if opcode == F:
+            compute_left_llr(alpha, llr[half - 1:size - 1], kernel, scale)
+        elif opcode == G:
+            compute_right_llr(alpha, beta[:half], llr[half - 1:size - 1],
+                              limit)
+        elif opcode == COMBINE:
+            for i in range(half):
+                beta[i] ^= beta[half + i]
+        elif opcode == ZERO:
+            beta[:] = 0
+        elif opcode == ONE:
+            compute_hard_decision(alpha, beta)
+        elif opcode == SINGLE_PARITY_CHECK:
+            compute_spc_bits(alpha, beta)
+        elif opcode == REPETITION:
+            compute_repetition_bits(alpha, beta)
+        elif opcode == G_REPETITION:
+            compute_g_repetition_bits(alpha, beta,
+                                      program[k, 3], program[k, 4])
+        elif opcode == RG_PARITY:
+            compute_rg_parity_bits(alpha, beta, program[k, 3])
+        elif opcode == ZERO_ANY:
+            beta[:half] = 0
+            compute_right_llr(alpha, beta[:half], llr[half - 1:size - 1],
+                              limit)
+        elif opcode == REP_ANY:
+            compute_left_llr(alpha, llr[half - 1:size - 1], kernel, scale)
+            compute_repetition_bits(llr[half - 1:size - 1], beta[:half])
+            compute_right_llr(alpha, beta[:half], llr[half - 1:size - 1],
+                              limit)
+
+
+@numba.njit(nogil=True)
+def execute_program_batch(program, received_llr, llr, bits,
+                          kernel=MIN_SUM, limit=0, scale=1):
+    """Execute decoding program for a batch of received LLRs.
+
+    Args:
+        received_llr (np.array): LLRs of shape (B, N).
+        llr (np.array): LLR memory of shape (2N - 1, B).
+        bits (np.array): Bits memory of shape (N, B).
+        kernel (int): Check-node kernel.
+        limit (int): Maximal magnitude of quantized LLRs, 0 for floating
+            point LLRs.
+        scale (int): Quantized value of LLR = 1, 1 for floating point LLRs.
+
+    """
+    batch_size, N = received_llr.shape
+    llr[N - 1:] = received_llr.T
+
+    for k in range(program.shape[0]):
+        opcode = program[k, 0]
+        size = program[k, 1]
+        offset = program[k, 2]
+        alpha = llr[size - 1:2 * size - 1]
+        beta = bits[offset:offset + size]
+        half = size // 2
+        child = llr[half - 1:size - 1]
+
+        if opcode == F or opcode == REP_ANY:
+            for i in range(half):
+                for b in range(batch_size):
+                    child[i, b] = check_node(alpha[i, b], alpha[half + i, b],
+                                             kernel, scale)
+            if opcode == F:
+                continue
+
+        if opcode == ZERO_ANY:
+            beta[:half] = 0
+        elif opcode == REP_ANY:
+            for b in range(batch_size):
+                compute_repetition_bits(child[:, b], beta[:half, b])
+
+        if opcode == G or opcode == ZERO_ANY or opcode == REP_ANY:
+            for i in range(half):
+                for b in range(batch_size):
+                    value = (alpha[half + i, b]
+                             + (1 - 2 * beta[i, b]) * alpha[i, b])
+                    child[i, b] = saturate(value, limit)
+        elif opcode == COMBINE:
+            beta[:half] ^= beta[half:]
+        elif opcode == ZERO:
+            beta[:] = 0
+        elif opcode == ONE:
+            for i in range(size):
+                for b in range(batch_size):
+                    beta[i, b] = alpha[i, b] < 0
+        else:
+            for b in range(batch_size):
+                column_alpha, column_beta = alpha[:, b], beta[:, b]
+                if opcode == SINGLE_PARITY_CHECK:
+                    compute_spc_bits(column_alpha, column_beta)
+                elif opcode == REPETITION:
+                    compute_repetition_bits(column_alpha, column_beta)
+                elif opcode == G_REPETITION:
+                    compute_g_repetition_bits(column_alpha, column_beta,
+                                              program[k, 3], program[k, 4])
+                elif opcode == RG_PARITY:
+                    compute_rg_parity_bits(column_alpha, column_beta,
+                                           program[k, 3])
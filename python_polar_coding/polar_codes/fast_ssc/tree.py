@@ -0,0 +1,169 @@
+import numpy as np
+
+from ..base import MIN_SUM
+from .node import FastSSCNode
+
+
+class DecodingTree:
+    """Decoding tree of Fast SSC family decoders stored in arrays.
+
+    The tree is built iteratively without creating node objects. Nodes are
+    stored in pre-order, so leaves are stored in decoding order. Each
+    attribute of the nodes is a separate array indexed by node index.
+
+    EG-Fast-SSC ZERO-ANY and REP-ANY nodes are leaves, their inner nodes
+    are described by the `inner_*` arrays.
+
+    Args:
+        mask (np.array): Polar code mask.
+        node_class (type): Class of nodes used for classification.
+        N_min (int): Minimal size of component polar code.
+        kwargs: Classification parameters of nodes, e.g. `AF`.
+
+    """
+    NO_NODE = -1
+
+    def __init__(self, mask, node_class=FastSSCNode, N_min=None, **kwargs):
+        self.mask = mask
+        self.node_class = node_class
+        self.N_min = N_min
+        self.kwargs = kwargs
+
+        types = list()
+        offsets = list()
+        sizes = list()
+        parents = list()
+        left = list()
+        right = list()
+        mask_steps = list()
+        last_chunk_types = list()
+        inner_types = list()
+        inner_mask_steps = list()
+        inner_last_chunk_types = list()
+
+        stack = [(0, mask.size, self.NO_NODE)]
+        while stack:
+            offset, size, parent = stack.pop()
+            index = len(types)
+            if parent != self.NO_NODE:
+                if left[parent] == self.NO_NODE:
+                    left[parent] = index
+                else:
+                    right[parent] = index
+
+            node_type, attributes = self.classify(offset, size)
+            types.append(node_type)
+            offsets.append(offset)
+            sizes.append(size)
+            parents.append(parent)
+            left.append(self.NO_NODE)
+            right.append(self.NO_NODE)
+            mask_steps.append(attributes.get('mask_steps') or 0)
+            last_chunk_types.append(attributes.get('last_chunk_type') or 0)
+
+            inner_type, inner_attributes = '', dict()
+            if node_type in self.any_types:
+                inner_type, inner_attributes = self.classify(
+                    offset + size // 2, size // 2)
+            inner_types.append(inner_type)
+            inner_mask_steps.append(inner_attributes.get('mask_steps') or 0)
+            inner_last_chunk_types.append(
+                inner_attributes.get('last_chunk_type') or 0)
+
+            if node_type != FastSSCNode.OTHER or size == self.N_min:
+                continue
+
+            # Left child is taken from the stack first
+            stack.append((offset + size // 2, size // 2, index))
+            stack.append((offset, size // 2, index))
+
+        self.types = np.array(types)
+        self.offsets = np.array(offsets, dtype=np.int64)
+        self.sizes = np.array(sizes, dtype=np.int64)
+        self.parents = np.array(parents, dtype=np.int64)
+        self.left = np.array(left, dtype=np.int64)
+        self.right = np.array(right, dtype=np.int64)
+        self.mask_steps = np.array(mask_steps, dtype=np.int64)
+        self.last_chunk_types = np.array(last_chunk_types, dtype=np.int64)
+        self.inner_types = np.array(inner_types)
+        self.inner_mask_steps = np.array(inner_mask_steps, dtype=np.int64)
+        self.inner_last_chunk_types = np.array(inner_last_chunk_types,
+                                               dtype=np.int64)
+
+        # Positions of nodes values in memory shared by all nodes
+        self.arena_offsets = np.cumsum(self.sizes) - self.sizes
+        self.arena_size = int(np.sum(self.sizes))
+
+    def __len__(self):
+        return self.types.size
+
+    @property
+    def M(self):
+        """Minimal size of component polar code."""
+        return self.N_min
+
+    @property
+    def any_types(self):
+        """Types of nodes with inner node."""
+        return (
+            getattr(self.node_class, 'ZERO_ANY', None),
+            getattr(self.node_class, 'REP_ANY', None),
+        )
+
+    @property
+    def leaves(self):
+        """Indices of leaves in decoding order."""
+        return np.flatnonzero(self.left == self.NO_NODE)
+
+    def classify(self, offset, size):
+        """Classify the node taking given positions of the mask."""
+        return self.node_class.classify(
+            mask=self.mask[offset:offset + size],
+            N_min=self.N_min,
+            **self.kwargs,
+        )
+
+    def to_anytree(self, alpha=None, beta=None, kernel=MIN_SUM,
+                   llr_limit=0, llr_scale=1):
+        """Build the tree of `node_class` nodes.
+
+        Args:
+            alpha (np.array): Memory of size `arena_size` for ALPHA values
+                of all nodes. Each node gets its own array if not set.
+            beta (np.array): Memory of size `arena_size` for BETA values
+                of all nodes. Each node gets its own array if not set.
+            kernel (int): Check-node kernel used by the nodes.
+            llr_limit (int): Maximal magnitude of quantized LLRs, 0 for
+                floating point LLRs.
+            llr_scale (int): Quantized value of LLR = 1, 1 for floating
+                point LLRs.
+
+        """
+        nodes = list()
+        cls = self.node_class
+
+        for index in range(len(self)):
+            parent = self.parents[index]
+            if parent == self.NO_NODE:
+                name, parent_node = cls.ROOT, None
+            else:
+                name = cls.LEFT if self.left[parent] == index else cls.RIGHT
+                parent_node = nodes[parent]
+
+            offset, size = self.offsets[index], self.sizes[index]
+            start = self.arena_offsets[index]
+            nodes.append(cls(
+                mask=self.mask[offset:offset + size],
+                name=name,
+                N_min=self.N_min,
+                parent=parent_node,
+                build_tree=False,
+                alpha=None if alpha is None else alpha[start:start + size],
+                beta=None if beta is None else beta[start:start + size],
+                kernel=kernel,
+                llr_limit=llr_limit,
+                llr_scale=llr_scale,
+                **self.kwargs,
+            ))
+
+        return nodes[0]
@@ -0,0 +1,2 @@
+from .codec import FastSSCListCRCPolarCodec, FastSSCListPolarCodec
+from .decoder import FastSSCListCRCDecoder, FastSSCListDecoder
@@ -0,0 +1,90 @@
+from typing import Union
+
+import numpy as np
+
+from ..base import BaseCRCPolarCodec
+from ..fast_ssc import FastSSCPolarCodec
+from .decoder import FastSSCListCRCDecoder, FastSSCListDecoder
+
+
+class FastSSCListPolarCodec(FastSSCPolarCodec):
+    """Polar code with Fast SSC List decoding algorithm.
+
+    Based on: https://arxiv.org/abs/1703.08208
+
+    """
+    decoder_class = FastSSCListDecoder
+
+    def __init__(
+            self,
+            N: int,
+            K: int,
+            design_snr: float = 0.0,
+            is_systematic: bool = True,
+            mask: Union[str, None] = None,
+            pcc_method: str = FastSSCPolarCodec.BHATTACHARYYA,
+            L: int = 1,
+            check_node: str = 'min-sum',
+            llr_bits: int = 0,
+            fractional_bits: int = 0,
+            dtype=np.double,
+    ):
+        self.L = L
+        super().__init__(N=N, K=K,
+                         is_systematic=is_systematic,
+                         design_snr=design_snr,
+                         mask=mask,
+                         pcc_method=pcc_method,
+                         compiled=True,
+                         check_node=check_node,
+                         llr_bits=llr_bits,
+                         fractional_bits=fractional_bits,
+                         dtype=dtype)
+
+    def init_decoder(self):
+        return self.decoder_class(L=self.L, **self.get_decoder_kwargs())
+
+    def to_dict(self):
+        d = super().to_dict()
+        d.update({'L': self.L})
+        return d
+
+
+class FastSSCListCRCPolarCodec(BaseCRCPolarCodec):
+    """Polar code with Fast SSC List decoding algorithm and CRC."""
+    decoder_class = FastSSCListCRCDecoder
+
+    def __init__(
+            self,
+            N: int,
+            K: int,
+            crc_size: int = 32,
+            design_snr: float = 0.0,
+            is_systematic: bool = True,
+            mask: Union[str, None] = None,
+            pcc_method: str = BaseCRCPolarCodec.BHATTACHARYYA,
+            L: int = 1,
+            check_node: str = 'min-sum',
+            llr_bits: int = 0,
+            fractional_bits: int = 0,
+            dtype=np.double,
+    ):
+        self.L = L
+        super().__init__(N=N, K=K,
+                         is_systematic=is_systematic,
+                         design_snr=design_snr,
+                         mask=mask,
+                         pcc_method=pcc_method,
+                         crc_size=crc_size,
+                         check_node=check_node,
+                         llr_bits=llr_bits,
+                         fractional_bits=fractional_bits,
+                         dtype=dtype)
+
+    def init_decoder(self):
+        return self.decoder_class(L=self.L, **self.get_decoder_kwargs())
+
+    def to_dict(self):
+        d = super().to_dict()
+        d.update({'L': self.L})
+        return d
@@ -0,0 +1,151 @@
+import numpy as np
+
+from python_polar_coding.polar_codes.base import (
+    BaseDecoder,
+    Encoder,
+    Quantizer,
+)
+from python_polar_coding.polar_codes.crc import CRC
+from python_polar_coding.polar_codes.fast_ssc import FastSSCDecoder
+from python_polar_coding.polar_codes.fast_ssc.program import compile_program
+
+from .functions import decode_list_program
+
+
+class FastSSCListDecoder(FastSSCDecoder):
+    """Fast SSC List decoding.
+
+    Paths execute the decoding program of Fast SSC decoding and fork at
+    REPETITION, SINGLE PARITY CHECK and ONE nodes, ZERO nodes only update
+    path metrics. See `functions.decode_list_program`.
+
+    Based on: https://arxiv.org/abs/1703.08208
+
+    Args:
+        L (int): Maximal number of paths.
+
+    """
+    # Paths of the last decoded frame are kept in the decoder
+    parallel_batch = False
+
+    def __init__(
+            self,
+            n: int,
+            mask: np.array,
+            is_systematic: bool = True,
+            code_min_size: int = 0,
+            L: int = 1,
+            check_node: str = 'min-sum',
+            quantizer: Quantizer = None,
+            dtype=np.double,
+            info_indices: np.array = None,
+    ):
+        super().__init__(n=n, mask=mask, is_systematic=is_systematic,
+                         code_min_size=code_min_size, compiled=True,
+                         check_node=check_node, quantizer=quantizer,
+                         dtype=dtype, info_indices=info_indices)
+        self.L = L
+        # Path metrics need LLRs of ZERO nodes
+        self._list_program = compile_program(self._tree, zero_llr=True)
+
+        self._list_llr = np.zeros((L, 2 * self.N - 1), dtype=self.llr_dtype)
+        self._list_bits = np.zeros((L, self.N), dtype=np.int8)
+        # Paths from the best to the worst one and their metrics
+        self._order = np.zeros(L, dtype=np.int64)
+        self._metrics = np.zeros(L)
+        self._count = 1
+
+    def decode_internal(self, received_llr: np.array) -> np.array:
+        """Decode the frame by all the paths in a single compiled call."""
+        self._count = decode_list_program(
+            self._list_program, received_llr, self._list_llr,
+            self._list_bits, self._order, self._metrics, self._kernel,
+            self.llr_limit, self.llr_scale,
+        )
+        return self.best_result
+
+    def decode_batch_internal(self, received_llr: np.array):
+        """Decode a batch of received messages frame by frame."""
+        return BaseDecoder.decode_batch_internal(self, received_llr)
+
+    @property
+    def result(self):
+        """Decoding results of the paths from the best to the worst one."""
+        return [self._get_path_result(path)
+                for path in self._order[:self._count]]
+
+    @property
+    def best_result(self):
+        """Result from the best path."""
+        return self.result[0]
+
+    @property
+    def status(self):
+        """Index of the path the result is taken from."""
+        return {'path': 0}
+
+    def _get_path_result(self, path):
+        """Decoding result of the path."""
+        codeword = self._list_bits[path]
+        if self.is_systematic:
+            return codeword
+        return Encoder._non_systematic_encode(np.array(codeword), self.n)
+
+
+class FastSSCListCRCDecoder(FastSSCListDecoder):
+    """Fast SSC List decoding with CRC.
+
+    The result is taken from the best path which info bits pass the CRC
+    check, or from the best path if there is no such path. CRC is removed
+    from the decoded info bits.
+
+    """
+
+    def __init__(
+            self,
+            n: int,
+            mask: np.array,
+            crc_codec: CRC,
+            is_systematic: bool = True,
+            code_min_size: int = 0,
+            L: int = 1,
+            check_node: str = 'min-sum',
+            quantizer: Quantizer = None,
+            dtype=np.double,
+            info_indices: np.array = None,
+    ):
+        super().__init__(n=n, mask=mask, is_systematic=is_systematic,
+                         code_min_size=code_min_size, L=L,
+                         check_node=check_node, quantizer=quantizer,
+                         dtype=dtype, info_indices=info_indices)
+        self.crc_codec = crc_codec
+        # Indices of info bits without CRC
+        self._message_indices = self.info_indices[:-crc_codec.crc_size]
+        self._best_path = 0
+        self._crc_passed = False
+
+    @property
+    def best_result(self):
+        """Result from the best path passing the CRC check."""
+        results = self.result
+        for i, result in enumerate(results):
+            if self.crc_codec.check_crc(result[self.info_indices]):
+                self._best_path, self._crc_passed = i, True
+                return result
+
+        self._best_path, self._crc_passed = 0, False
+        return results[0]
+
+    @property
+    def status(self):
+        """Index of the chosen path and the result of CRC check."""
+        return {'path': self._best_path, 'crc_passed': self._crc_passed}
+
+    def get_result(self, decoded: np.array,
+                   out: np.array = None) -> np.array:
+        """Get decoded info bits without CRC."""
+        return np.take(decoded, self._message_indices, out=out)
+
+    def get_batch_result(self, decoded: np.array) -> np.array:
+        """Get decoded info bits of a batch of messages without CRC."""
+        return np.take(decoded, self._message_indices, axis=1)
@@ -0,0 +1,330 @@
+"""Functions for Fast SSC List decoding.
+
+Based on: S. A. Hashemi, C. Condo, W. J. Gross, "Fast and Flexible
+Successive-Cancellation List Decoders for Polar Codes",
+https://arxiv.org/abs/1703.08208
+
+All the paths execute the decoding program of Fast SSC decoding over their
+own rows of LLRs and bits memory of shapes (L, 2N - 1) and (L, N), see
+`fast_ssc.program` for the layout of a row. Paths are forked only at leaf
+nodes: a path is copied into a free row when more than one of its
+candidates survive.
+
+Path metric is LLR-based: a bit decided against the sign of its LLR costs
+the magnitude of the LLR, https://arxiv.org/abs/1411.7282 Section III-B.
+
+"""
+import numba
+import numpy as np
+
+from ..base import MIN_SUM, compute_left_llr, compute_right_llr
+from ..fast_ssc.program import (
+    COMBINE,
+    G_REPETITION,
+    REPETITION,
+    RG_PARITY,
+    SINGLE_PARITY_CHECK,
+    ZERO,
+    F,
+    G,
+)
+from ..sc_list.functions import select_candidates
+
+
+@numba.njit
+def compute_zero_metric(llr):
+    """Cost of deciding all the bits with LLRs to be zeros."""
+    metric = 0.0
+    for i in range(llr.size):
+        metric += min(float(llr[i]), 0.0)
+    return metric
+
+
+@numba.njit
+def compute_one_metric(llr):
+    """Cost of deciding all the bits with LLRs to be ones."""
+    metric = 0.0
+    for i in range(llr.size):
+        metric -= max(float(llr[i]), 0.0)
+    return metric
+
+
+@numba.njit
+def start_parity_node(alpha, beta, groups, flips, costs, least, parities):
+    """Make the hard decision satisfying the parity checks of the node.
+
+    Bit `i` of the node is checked by the parity check `i % groups`, no
+    bits are checked if `groups` is 0. The least reliable bit of each
+    parity check is flipped if the check is not satisfied.
+
+    Args:
+        flips (np.array): Memory for the bits to fork on, all the bits
+            except the least reliable bits of the checks from the least
+            reliable one.
+        costs (np.array): Memory for LLR magnitudes of the bits.
+        least (np.array): Memory for the least reliable bits of the checks.
+        parities (np.array): Memory for flags of the least reliable bits
+            flipped by the checks.
+
+    Returns:
+        metric (float): Change of path metric.
+        count (int): Number of bits to fork on.
+
+    """
+    size = alpha.size
+    for i in range(size):
+        beta[i] = alpha[i] < 0
+        costs[i] = abs(float(alpha[i]))
+
+    least[:groups] = np.arange(groups)
+    parities[:groups] = 0
+    for i in range(size):
+        if groups == 0:
+            break
+        group = i % groups
+        parities[group] ^= beta[i]
+        if costs[i] < costs[least[group]]:
+            least[group] = i
+
+    metric = 0.0
+    for group in range(groups):
+        if parities[group]:
+            beta[least[group]] ^= 1
+            metric -= costs[least[group]]
+
+    count = 0
+    for i in np.argsort(costs[:size], kind='mergesort'):
+        if groups and least[i % groups] == i:
+            continue
+        flips[count] = i
+        count += 1
+    return metric, count
+
+
+@numba.njit
+def compute_flip_cost(i, groups, costs, least, parities):
+    """Cost of flipping bit `i` of the node together with the least
+    reliable bit of its parity check."""
+    cost = costs[i]
+    if groups:
+        group = i % groups
+        if parities[group]:
+            cost -= costs[least[group]]
+        else:
+            cost += costs[least[group]]
+    return cost
+
+
+@numba.njit
+def flip_bit(i, beta, groups, least, parities):
+    """Flip bit `i` of the node keeping its parity check satisfied."""
+    beta[i] ^= 1
+    if groups:
+        group = i % groups
+        beta[least[group]] ^= 1
+        parities[group] ^= 1
+
+
+@numba.njit
+def fork_paths(candidates, paths, order, L, llr, bits, flips, costs, least,
+               parities):
+    """Select the best candidates and give each of them its own path.
+
+    Paths without selected candidates are released. When several
+    candidates of a path are selected, the path is copied into free rows
+    before any of them is decided.
+
+    Returns:
+        selected (np.array): selected candidates from the best to the worst
+            one, `order[k]` is the path of the k-th of them.
+
+    """
+    selected = select_candidates(candidates, L)
+
+    alive = np.zeros(L, dtype=np.bool_)
+    for i in selected:
+        alive[paths[i]] = True
+
+    taken = np.zeros(L, dtype=np.bool_)
+    for k in range(selected.size):
+        path = paths[selected[k]]
+        if taken[path]:
+            new_path = 0
+            while alive[new_path]:
+                new_path += 1
+            alive[new_path] = True
+            llr[new_path] = llr[path]
+            bits[new_path] = bits[path]
+            flips[new_path] = flips[path]
+            costs[new_path] = costs[path]
+            least[new_path] = least[path]
+            parities[new_path] = parities[path]
+            path = new_path
+        taken[path] = True
+        order[k] = path
+    return selected
+
+
+@numba.njit(nogil=True)
+def decode_list_program(program, received_llr, llr, bits, order, metrics,
+                        kernel=MIN_SUM, limit=0, scale=1):
+    """Execute Fast SSC decoding program by a list of paths.
+
+    Leaf nodes are decoded as follows:
+
+    * ZERO node is decided as zeros by each path without forking;
+    * REPETITION node is forked into all-zeros and all-ones candidates;
+    * ONE, SINGLE PARITY CHECK and RG-PARITY nodes start from the hard
+      decision satisfying the parity checks of the node, then the
+      min(L - 1, count) least reliable bits, except the least reliable
+      bits of the checks, are forked one after another. Flipping a bit
+      flips the least reliable bit of its check too.
+    * G-REPETITION node repeats a ONE or SINGLE PARITY CHECK chunk, the
+      chunk is decoded as above over the sums of LLRs of the repeated
+      bits.
+
+    The best L candidates survive each fork.
+
+    Args:
+        program (np.array): Decoding program computing LLRs of ZERO nodes.
+        order (np.array): Memory of size L for the paths from the best to
+            the worst one.
+        metrics (np.array): Memory of size L for the path metrics.
+
+    Returns:
+        count (int): Number of paths in `order`.
+
+    """
+    L = order.size
+    N = received_llr.size
+
+    llr[0, N - 1:] = received_llr
+    metrics[:] = 0
+    order[0] = 0
+    count = 1
+
+    # State of the current leaf node of each path, see `start_parity_node`
+    flips = np.zeros((L, N), dtype=np.int64)
+    costs = np.zeros((L, N))
+    least = np.zeros((L, N), dtype=np.int64)
+    parities = np.zeros((L, N), dtype=np.int8)
+    chunk_llr = np.zeros(N)
+
+    paths = np.empty(2 * L, dtype=np.int64)
+    decisions = np.empty(2 * L, dtype=np.int8)
+    candidates = np.empty(2 * L)
+
+    for k in range(program.shape[0]):
+        opcode = program[k, 0]
+        size = program[k, 1]
+        offset = program[k, 2]
+        half = size // 2
+
+        if opcode == F or opcode == G or opcode == COMBINE:
+            for j in range(count):
+                path = order[j]
+                alpha = llr[path, size - 1:2 * size - 1]
+                beta = bits[path, offset:offset + size]
+                child = llr[path, half - 1:size - 1]
+                if opcode == F:
+                    compute_left_llr(alpha, child, kernel, scale)
+                elif opcode == G:
+                    compute_right_llr(alpha, beta[:half], child, limit)
+                else:
+                    for i in range(half):
+                        beta[i] ^= beta[half + i]
+            continue
+
+        if opcode == ZERO:
+            for j in range(count):
+                path = order[j]
+                bits[path, offset:offset + size] = 0
+                metrics[path] += compute_zero_metric(
+                    llr[path, size - 1:2 * size - 1])
+            continue
+
+        if opcode == REPETITION:
+            for j in range(count):
+                path = order[j]
+                alpha = llr[path, size - 1:2 * size - 1]
+                paths[2 * j] = paths[2 * j + 1] = path
+                decisions[2 * j] = 0
+                decisions[2 * j + 1] = 1
+                candidates[2 * j] = metrics[path] + compute_zero_metric(alpha)
+                candidates[2 * j + 1] = (metrics[path]
+                                         + compute_one_metric(alpha))
+
+            selected = fork_paths(candidates[:2 * count], paths, order, L,
+                                  llr, bits, flips, costs, least, parities)
+            count = selected.size
+            for j in range(count):
+                path = order[j]
+                bits[path, offset:offset + size] = decisions[selected[j]]
+                metrics[path] = candidates[selected[j]]
+            continue
+
+        # Nodes with parity checks: size of the decoded chunk of the node
+        # and the number of the checks
+        chunk = size
+        groups = 0
+        if opcode == SINGLE_PARITY_CHECK:
+            groups = 1
+        elif opcode == RG_PARITY:
+            groups = size // program[k, 3]
+        elif opcode == G_REPETITION:
+            # Last chunk of type 1 is ONE node
+            chunk = size // program[k, 3]
+            groups = 0 if program[k, 4] == 1 else 1
+
+        flip_count = 0
+        for j in range(count):
+            path = order[j]
+            alpha = llr[path, size - 1:2 * size - 1]
+            beta = bits[path, offset:offset + chunk]
+
+            if opcode == G_REPETITION:
+                # Sums of LLRs of the repeated bits and the cost of the
+                # decisions on the sums instead of on each bit
+                chunk_llr[:chunk] = 0
+                for i in range(size):
+                    chunk_llr[i % chunk] += alpha[i]
+                metrics[path] += (compute_zero_metric(alpha)
+                                  - compute_zero_metric(chunk_llr[:chunk]))
+                metric, flip_count = start_parity_node(
+                    chunk_llr[:chunk], beta, groups, flips[path],
+                    costs[path], least[path], parities[path])
+            else:
+                metric, flip_count = start_parity_node(
+                    alpha, beta, groups, flips[path], costs[path],
+                    least[path], parities[path])
+            metrics[path] += metric
+
+        for step in range(min(L - 1, flip_count)):
+            for j in range(count):
+                path = order[j]
+                cost = compute_flip_cost(flips[path, step], groups,
+                                         costs[path], least[path],
+                                         parities[path])
+                paths[2 * j] = paths[2 * j + 1] = path
+                decisions[2 * j] = 0
+                decisions[2 * j + 1] = 1
+                candidates[2 * j] = metrics[path]
+                candidates[2 * j + 1] = metrics[path] - cost
+
+            selected = fork_paths(candidates[:2 * count], paths, order, L,
+                                  llr, bits, flips, costs, least, parities)
+            count = selected.size
+            for j in range(count):
+                path = order[j]
+                metrics[path] = candidates[selected[j]]
+                if decisions[selected[j]]:
+                    flip_bit(flips[path, step], bits[path, offset:],
+                             groups, least[path], parities[path])
+
+        if opcode == G_REPETITION:
+            for j in range(count):
+                beta = bits[order[j], offset:offset + size]
+                for i in range(chunk, size):
+                    beta[i] = beta[i - chunk]
+
+    return count
@@ -1,5 +1,7 @@
 from typing import Union
 
+import numpy as np
+
 from python_polar_coding.polar_codes.fast_ssc import FastSSCPolarCodec
 
 from .decoder import GeneralizedFastSSCDecoder
@@ -23,6 +25,11 @@ class GeneralizedFastSSCPolarCodec(FastSSCPolarCodec):
             pcc_method: str = FastSSCPolarCodec.BHATTACHARYYA,
             Ns: int = 1,
             AF: int = 1,
+            compiled: bool = False,
+            check_node: str = 'min-sum',
+            llr_bits: int = 0,
+            fractional_bits: int = 0,
+            dtype=np.double,
     ):
 
         self.Ns = Ns
@@ -31,13 +38,18 @@ class GeneralizedFastSSCPolarCodec(FastSSCPolarCodec):
                          is_systematic=is_systematic,
                          design_snr=design_snr,
                          mask=mask,
-                         pcc_method=pcc_method)
+                         pcc_method=pcc_method,
+                         compiled=compiled,
+                         check_node=check_node,
+                         llr_bits=llr_bits,
+                         fractional_bits=fractional_bits,
+                         dtype=dtype)
 
     def init_decoder(self):
-        return self.decoder_class(n=self.n, mask=self.mask,
-                                  is_systematic=self.is_systematic,
-                                  code_min_size=self.Ns,
-                                  AF=self.AF)
+        return self.decoder_class(code_min_size=self.Ns,
+                                  AF=self.AF,
+                                  compiled=self.compiled,
+                                  **self.get_decoder_kwargs())
 
     def to_dict(self):
         d = super().to_dict()
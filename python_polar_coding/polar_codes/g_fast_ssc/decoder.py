@@ -1,5 +1,6 @@
 import numpy as np
 
+from python_polar_coding.polar_codes.base import Quantizer
 from python_polar_coding.polar_codes.fast_ssc import FastSSCDecoder
 
 from .node import GeneralizedFastSSCNode
@@ -15,6 +16,11 @@ class GeneralizedFastSSCDecoder(FastSSCDecoder):
             is_systematic: bool = True,
             code_min_size: int = 0,
             AF: int = 1,
+            compiled: bool = False,
+            check_node: str = 'min-sum',
+            quantizer: Quantizer = None,
+            dtype=np.double,
+            info_indices: np.array = None,
     ):
         self.AF = AF
         super().__init__(
@@ -22,8 +28,13 @@ class GeneralizedFastSSCDecoder(FastSSCDecoder):
             mask=mask,
             is_systematic=is_systematic,
             code_min_size=code_min_size,
+            compiled=compiled,
+            check_node=check_node,
+            quantizer=quantizer,
+            dtype=dtype,
+            info_indices=info_indices,
         )
 
     def setup_decoding_tree(self, N_min, **kwargs):
         """Setup decoding tree."""
-        return self.node_class(mask=self.mask, N_min=N_min, AF=self.AF)
+        return super().setup_decoding_tree(N_min, AF=self.AF)
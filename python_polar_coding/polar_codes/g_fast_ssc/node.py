@@ -1,10 +1,13 @@
 import numpy as np
 
-from python_polar_coding.polar_codes.fast_ssc import FastSSCNode
+from python_polar_coding.polar_codes.fast_ssc import (
+    FastSSCNode,
+    compute_g_repetition_bits,
+    compute_rg_parity_bits,
+    program,
+)
 from python_polar_coding.polar_codes.utils import splits
 
-from .functions import compute_g_repetition, compute_rg_parity
-
 
 class GeneralizedFastSSCNode(FastSSCNode):
     """Decoder for Generalized Fast SSC code.
@@ -17,6 +20,15 @@ class GeneralizedFastSSCNode(FastSSCNode):
 
     MIN_CHUNKS = 2
 
+    CLASSIFICATION_PARAMETERS = ('AF', )
+    CACHED_ATTRIBUTES = ('mask_steps', 'last_chunk_type')
+
+    OPCODES = {
+        **FastSSCNode.OPCODES,
+        G_REPETITION: program.G_REPETITION,
+        RG_PARITY: program.RG_PARITY,
+    }
+
     def __init__(self, AF=1, *args, **kwargs):
         self.AF = AF
         self.last_chunk_type = None
@@ -72,7 +84,7 @@ class GeneralizedFastSSCNode(FastSSCNode):
             if not last_ok:
                 continue
 
-            others_ok = all(self._check_is_zero(c) for c in chunks[:-1])
+            others_ok = not np.any(mask[:-last.size])
             if not others_ok:
                 continue
 
@@ -90,19 +102,19 @@ class GeneralizedFastSSCNode(FastSSCNode):
         """
         # 1. Split mask into T chunks, T in range [2, 4, ..., N/2]
         for t in splits(self.MIN_CHUNKS, self.N // 2):
-            chunks = np.split(mask, t)
+            chunks = np.reshape(mask, (t, -1))
 
             first = chunks[0]
             if not self._check_is_zero(first):
                 continue
 
-            ones = 0
+            # Chunks are checked at once by their weights
+            size = first.size
+            weights = np.sum(chunks[1:], axis=1)
+            ones = np.sum(weights == size)
             spcs = 0
-            for c in chunks[1:]:
-                if self._check_is_one(c):
-                    ones += 1
-                elif c.size >= self.SPC_MIN_SIZE and self._check_is_spc(c):
-                    spcs += 1
+            if size >= self.SPC_MIN_SIZE:
+                spcs = np.sum((weights == size - 1) & (chunks[1:, 0] == 0))
 
             others_ok = (ones + spcs + 1) == t and spcs <= self.AF
             if not others_ok:
@@ -118,15 +130,15 @@ class GeneralizedFastSSCNode(FastSSCNode):
         klass = self.__class__
 
         if self._node_type == klass.G_REPETITION:
-            self._beta = compute_g_repetition(
+            compute_g_repetition_bits(
                 llr=self.alpha,
+                result=self._beta,
                 mask_steps=self.mask_steps,
                 last_chunk_type=self.last_chunk_type,
-                N=self.N,
             )
         if self._node_type == klass.RG_PARITY:
-            self._beta = compute_rg_parity(
+            compute_rg_parity_bits(
                 llr=self.alpha,
+                result=self._beta,
                 mask_steps=self.mask_steps,
-                N=self.N,
             )
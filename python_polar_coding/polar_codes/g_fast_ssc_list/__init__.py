@@ -0,0 +1,8 @@
+from .codec import (
+    GeneralizedFastSSCListCRCPolarCodec,
+    GeneralizedFastSSCListPolarCodec,
+)
+from .decoder import (
+    GeneralizedFastSSCListCRCDecoder,
+    GeneralizedFastSSCListDecoder,
+)
@@ -0,0 +1,110 @@
+from typing import Union
+
+import numpy as np
+
+from python_polar_coding.polar_codes.fast_ssc_list import (
+    FastSSCListCRCPolarCodec,
+    FastSSCListPolarCodec,
+)
+
+from .decoder import (
+    GeneralizedFastSSCListCRCDecoder,
+    GeneralizedFastSSCListDecoder,
+)
+
+
+class GeneralizedFastSSCListPolarCodec(FastSSCListPolarCodec):
+    """Polar code with Generalized Fast SSC List decoding algorithm.
+
+    Based on: https://arxiv.org/pdf/1804.09508.pdf
+
+    """
+    decoder_class = GeneralizedFastSSCListDecoder
+
+    def __init__(
+            self,
+            N: int,
+            K: int,
+            design_snr: float = 0.0,
+            is_systematic: bool = True,
+            mask: Union[str, None] = None,
+            pcc_method: str = FastSSCListPolarCodec.BHATTACHARYYA,
+            Ns: int = 1,
+            AF: int = 1,
+            L: int = 1,
+            check_node: str = 'min-sum',
+            llr_bits: int = 0,
+            fractional_bits: int = 0,
+            dtype=np.double,
+    ):
+        self.Ns = Ns
+        self.AF = AF
+        super().__init__(N=N, K=K,
+                         is_systematic=is_systematic,
+                         design_snr=design_snr,
+                         mask=mask,
+                         pcc_method=pcc_method,
+                         L=L,
+                         check_node=check_node,
+                         llr_bits=llr_bits,
+                         fractional_bits=fractional_bits,
+                         dtype=dtype)
+
+    def init_decoder(self):
+        return self.decoder_class(code_min_size=self.Ns,
+                                  AF=self.AF,
+                                  L=self.L,
+                                  **self.get_decoder_kwargs())
+
+    def to_dict(self):
+        d = super().to_dict()
+        d.update({'AF': self.AF})
+        return d
+
+
+class GeneralizedFastSSCListCRCPolarCodec(FastSSCListCRCPolarCodec):
+    """Polar code with Generalized Fast SSC List decoding algorithm and CRC.
+    """
+    decoder_class = GeneralizedFastSSCListCRCDecoder
+
+    def __init__(
+            self,
+            N: int,
+            K: int,
+            crc_size: int = 32,
+            design_snr: float = 0.0,
+            is_systematic: bool = True,
+            mask: Union[str, None] = None,
+            pcc_method: str = FastSSCListCRCPolarCodec.BHATTACHARYYA,
+            Ns: int = 1,
+            AF: int = 1,
+            L: int = 1,
+            check_node: str = 'min-sum',
+            llr_bits: int = 0,
+            fractional_bits: int = 0,
+            dtype=np.double,
+    ):
+        self.Ns = Ns
+        self.AF = AF
+        super().__init__(N=N, K=K,
+                         crc_size=crc_size,
+                         is_systematic=is_systematic,
+                         design_snr=design_snr,
+                         mask=mask,
+                         pcc_method=pcc_method,
+                         L=L,
+                         check_node=check_node,
+                         llr_bits=llr_bits,
+                         fractional_bits=fractional_bits,
+                         dtype=dtype)
+
+    def init_decoder(self):
+        return self.decoder_class(code_min_size=self.Ns,
+                                  AF=self.AF,
+                                  L=self.L,
+                                  **self.get_decoder_kwargs())
+
+    def to_dict(self):
+        d = super().to_dict()
+        d.update({'AF': self.AF})
+        return d
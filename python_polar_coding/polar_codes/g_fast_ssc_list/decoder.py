@@ -0,0 +1,72 @@
+import numpy as np
+
+from python_polar_coding.polar_codes.base import Quantizer
+from python_polar_coding.polar_codes.crc import CRC
+from python_polar_coding.polar_codes.fast_ssc_list import (
+    FastSSCListCRCDecoder,
+    FastSSCListDecoder,
+)
+from python_polar_coding.polar_codes.g_fast_ssc import GeneralizedFastSSCNode
+
+
+class GeneralizedFastSSCListDecoder(FastSSCListDecoder):
+    """Generalized Fast SSC List decoding.
+
+    Paths fork at G-REPETITION and RG-PARITY nodes too, see
+    `fast_ssc_list.functions.decode_list_program`.
+
+    """
+    node_class = GeneralizedFastSSCNode
+
+    def __init__(
+            self,
+            n: int,
+            mask: np.array,
+            is_systematic: bool = True,
+            code_min_size: int = 0,
+            AF: int = 1,
+            L: int = 1,
+            check_node: str = 'min-sum',
+            quantizer: Quantizer = None,
+            dtype=np.double,
+            info_indices: np.array = None,
+    ):
+        self.AF = AF
+        super().__init__(n=n, mask=mask, is_systematic=is_systematic,
+                         code_min_size=code_min_size, L=L,
+                         check_node=check_node, quantizer=quantizer,
+                         dtype=dtype, info_indices=info_indices)
+
+    def setup_decoding_tree(self, N_min, **kwargs):
+        """Setup decoding tree."""
+        return super().setup_decoding_tree(N_min, AF=self.AF)
+
+
+class GeneralizedFastSSCListCRCDecoder(FastSSCListCRCDecoder):
+    """Generalized Fast SSC List decoding with CRC."""
+    node_class = GeneralizedFastSSCNode
+
+    def __init__(
+            self,
+            n: int,
+            mask: np.array,
+            crc_codec: CRC,
+            is_systematic: bool = True,
+            code_min_size: int = 0,
+            AF: int = 1,
+            L: int = 1,
+            check_node: str = 'min-sum',
+            quantizer: Quantizer = None,
+            dtype=np.double,
+            info_indices: np.array = None,
+    ):
+        self.AF = AF
+        super().__init__(n=n, mask=mask, crc_codec=crc_codec,
+                         is_systematic=is_systematic,
+                         code_min_size=code_min_size, L=L,
+                         check_node=check_node, quantizer=quantizer,
+                         dtype=dtype, info_indices=info_indices)
+
+    def setup_decoding_tree(self, N_min, **kwargs):
+        """Setup decoding tree."""
+        return super().setup_decoding_tree(N_min, AF=self.AF)
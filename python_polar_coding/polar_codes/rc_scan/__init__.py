@@ -1,4 +1,4 @@
-from .codec import RCSCANPolarCodec
+from .codec import RCSCANCRCPolarCodec, RCSCANPolarCodec
 from .decoder import RCSCANDecoder
 from .functions import *
-from .node import INFINITY, RCSCANNode
+from .node import RCSCANNode
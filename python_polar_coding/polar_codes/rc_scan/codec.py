@@ -1,6 +1,11 @@
 from typing import Union
 
-from python_polar_coding.polar_codes.base import BasePolarCodec
+import numpy as np
+
+from python_polar_coding.polar_codes.base import (
+    BaseCRCPolarCodec,
+    BasePolarCodec,
+)
 
 from .decoder import RCSCANDecoder
 
@@ -22,19 +27,87 @@ class RCSCANPolarCodec(BasePolarCodec):
             mask: Union[str, None] = None,
             pcc_method: str = BasePolarCodec.BHATTACHARYYA,
             I: int = 1,
+            check_node: str = 'min-sum',
+            dtype=np.double,
+            early_stopping: str = None,
             * args, **kwargs,
     ):
         self.I = I
+        self.early_stopping = early_stopping
+        super().__init__(N=N, K=K,
+                         is_systematic=True,
+                         design_snr=design_snr,
+                         mask=mask,
+                         pcc_method=pcc_method,
+                         check_node=check_node,
+                         dtype=dtype)
+
+    @property
+    def _iterations(self) -> float:
+        """Average number of iterations of the decoded frames."""
+        return self.decoder.average_iterations
+
+    def init_decoder(self):
+        return self.decoder_class(n=self.n, mask=self.mask, I=self.I,
+                                  check_node=self.check_node,
+                                  dtype=self.dtype,
+                                  info_indices=self.info_indices,
+                                  early_stopping=self.early_stopping)
+
+    def to_dict(self):
+        d = super().to_dict()
+        d.update({
+            'I': self.I,
+            'early_stopping': self.early_stopping,
+        })
+        return d
+
+
+class RCSCANCRCPolarCodec(BaseCRCPolarCodec):
+    """Polar code with RC-SCAN decoding algorithm stopped by CRC."""
+    decoder_class = RCSCANDecoder
+
+    def __init__(
+            self,
+            N: int,
+            K: int,
+            crc_size: int = 32,
+            design_snr: float = 0.0,
+            mask: Union[str, None] = None,
+            pcc_method: str = BaseCRCPolarCodec.BHATTACHARYYA,
+            I: int = 1,
+            check_node: str = 'min-sum',
+            dtype=np.double,
+            early_stopping: str = RCSCANDecoder.CRC_CHECK,
+    ):
+        self.I = I
+        self.early_stopping = early_stopping
         super().__init__(N=N, K=K,
                          is_systematic=True,
                          design_snr=design_snr,
                          mask=mask,
-                         pcc_method=pcc_method)
+                         pcc_method=pcc_method,
+                         crc_size=crc_size,
+                         check_node=check_node,
+                         dtype=dtype)
+
+    @property
+    def _iterations(self) -> float:
+        """Average number of iterations of the decoded frames."""
+        return self.decoder.average_iterations
 
     def init_decoder(self):
-        return self.decoder_class(n=self.n, mask=self.mask, I=self.I)
+        return self.decoder_class(n=self.n, mask=self.mask, I=self.I,
+                                  check_node=self.check_node,
+                                  dtype=self.dtype,
+                                  info_indices=self.info_indices,
+                                  early_stopping=self.early_stopping,
+                                  crc_codec=self.crc_codec)
 
     def to_dict(self):
         d = super().to_dict()
-        d.update({'I': self.I})
+        d.update({
+            'I': self.I,
+            'early_stopping': self.early_stopping,
+        })
         return d
@@ -1,10 +1,12 @@
+from collections import defaultdict
+
 import numpy as np
-from anytree import PreOrderIter
 
 from python_polar_coding.polar_codes.fast_ssc import FastSSCDecoder
 
-from ..base import make_hard_decision
-from .functions import function_1, function_2
+from ..base import MIN_SUM, BaseDecoder, Encoder, make_hard_decision
+from ..crc import CRC
+from .functions import compute_function_1, compute_function_2
 from .node import RCSCANNode
 
 
@@ -15,8 +17,33 @@ class RCSCANDecoder(FastSSCDecoder):
         * https://arxiv.org/pdf/1510.06495.pdf
         * doi:10.1007/s12243-018-0634-7
 
+    REPETITION and SINGLE PARITY CHECK subtrees are leaves computing soft
+    BETA values in closed form instead of decoding each of their bits, as
+    in Fast-SCAN decoding.
+
+    Iterations stop before `I` ones are done when the early stopping
+    criterion is met by the hard decisions of an iteration:
+
+    * `DECISIONS` - the decisions are the same as of the previous iteration;
+    * `ENCODING` - the decisions are a codeword: re-encoded by the polar
+      transform, they give zeros at all frozen positions;
+    * `CRC_CHECK` - the info bits pass CRC check, CRC is removed from them.
+
+    Args:
+        I (int): Maximal number of iterations.
+        early_stopping (str): Early stopping criterion, None to always
+            make `I` iterations.
+        crc_codec (CRC): CRC of the info bits, required by `CRC_CHECK`
+            criterion.
+
     """
     node_class = RCSCANNode
+    parallel_batch = False
+
+    DECISIONS = 'decisions'
+    ENCODING = 'encoding'
+    CRC_CHECK = 'crc'
+    EARLY_STOPPING = (DECISIONS, ENCODING, CRC_CHECK)
 
     def __init__(
             self,
@@ -24,10 +51,50 @@ class RCSCANDecoder(FastSSCDecoder):
             mask: np.array,
             code_min_size: int = 0,
             I: int = 1,
+            check_node: str = 'min-sum',
+            dtype=np.double,
+            info_indices: np.array = None,
+            early_stopping: str = None,
+            crc_codec: CRC = None,
     ):
         super().__init__(n=n, mask=mask, is_systematic=True,
-                         code_min_size=code_min_size)
+                         code_min_size=code_min_size, check_node=check_node,
+                         dtype=dtype, info_indices=info_indices)
+        assert early_stopping in self.EARLY_STOPPING + (None, ), (
+            f'Unsupported early stopping criterion ({early_stopping})')
+        assert early_stopping != self.CRC_CHECK or crc_codec is not None, (
+            'CRC early stopping requires CRC codec')
         self.I = I
+        self.early_stopping = early_stopping
+        self.crc_codec = crc_codec
+        # Indices of info bits without CRC
+        self._message_indices = (
+            self.info_indices[:-crc_codec.crc_size] if crc_codec
+            else self.info_indices
+        )
+        self._frozen_mask = self.mask == 0
+        self._previous_result = np.zeros(self.N, dtype=np.int8)
+
+        self._iterations = 0
+        # Number of decoded frames per number of iterations
+        self.iterations = defaultdict(int)
+
+    @property
+    def status(self):
+        """Number of iterations made decoding the last frame."""
+        return {'iterations': self._iterations}
+
+    @property
+    def average_iterations(self) -> float:
+        """Average number of iterations of the decoded frames."""
+        frames = sum(self.iterations.values())
+        if not frames:
+            return 0.0
+        return sum(i * count for i, count in self.iterations.items()) / frames
+
+    def reset_statistics(self):
+        """Forget the numbers of iterations of the decoded frames."""
+        self.iterations.clear()
 
     def decode_internal(self, received_llr: np.array) -> np.array:
         """Implementation of SC decoding method."""
@@ -36,38 +103,85 @@ class RCSCANDecoder(FastSSCDecoder):
         for leaf in self._decoding_tree.leaves:
             leaf.initialize_leaf_beta()
 
-        for _ in range(self.I):
+        self._iterations = 0
+        while self._iterations < self.I:
             super().decode_internal(received_llr)
+            self._iterations += 1
+            if self._iterations < self.I and self._is_stopped():
+                break
 
+        self.iterations[self._iterations] += 1
         return self.result
 
+    def decode_batch_internal(self, received_llr: np.array):
+        """Decode a batch of frames one by one.
+
+        Soft BETA values of SCAN iterations are not supported by decoding
+        programs, so the frames are decoded by the tree.
+
+        """
+        return BaseDecoder.decode_batch_internal(self, received_llr)
+
+    def get_result(self, decoded: np.array,
+                   out: np.array = None) -> np.array:
+        """Get decoded info bits without CRC."""
+        return np.take(decoded, self._message_indices, out=out)
+
+    def get_batch_result(self, decoded: np.array) -> np.array:
+        """Get decoded info bits of a batch of messages without CRC."""
+        return np.take(decoded, self._message_indices, axis=1)
+
+    def _is_stopped(self) -> bool:
+        """Check the early stopping criterion after an iteration."""
+        if self.early_stopping is None:
+            return False
+
+        result = self.result
+        if self.early_stopping == self.DECISIONS:
+            is_stopped = (self._iterations > 1
+                          and np.array_equal(result, self._previous_result))
+            self._previous_result[:] = result
+            return is_stopped
+        if self.early_stopping == self.ENCODING:
+            # Polar transform is its own inverse
+            precoded = Encoder._non_systematic_encode(result, self.n)
+            return not np.any(precoded[self._frozen_mask])
+        return self.crc_codec.check_crc(result[self.info_indices])
+
+    @property
+    def beta_dtype(self):
+        """Soft BETA values are of the same type as LLRs."""
+        return self.llr_dtype
+
     def clean_before_decoding(self):
         """Reset intermediate BETA values.
 
-        Run this before calling `__call__` method.
+        Run this before calling `__call__` method. BETA values of all nodes
+        are stored in the same memory, leaves are initialized after it.
 
         """
-        for node in PreOrderIter(self._decoding_tree):
-            if not node.is_leaf:
-                node.beta *= 0
+        self._beta[:] = 0
 
     def compute_intermediate_alpha(self, leaf):
         """Compute intermediate Alpha values (LLR)."""
-        for node in leaf.path[1:]:
-            if node.is_computed or node.is_zero or node.is_one:
+        for node in self._paths[leaf]:
+            if node.generation == self._generation:
+                continue
+            if node.is_zero or node.is_one:
                 continue
 
-            parent_alpha = node.parent.alpha
+            parent = node.parent
+            left, right = parent.children
 
             if node.is_left:
-                right_beta = node.siblings[0].beta
-                node.alpha = self.compute_left_alpha(parent_alpha, right_beta)
+                self.compute_left_alpha(parent.alpha, right.beta, node.alpha,
+                                        self._kernel)
 
             if node.is_right:
-                left_beta = node.siblings[0].beta
-                node.alpha = self.compute_right_alpha(parent_alpha, left_beta)
+                self.compute_right_alpha(parent.alpha, left.beta, node.alpha,
+                                         self._kernel)
 
-            node.is_computed = True
+            node.generation = self._generation
 
     def compute_intermediate_beta(self, node):
         """Compute intermediate BETA values."""
@@ -75,8 +189,9 @@ class RCSCANDecoder(FastSSCDecoder):
         if node.is_left or node.is_root or parent.is_root:
             return
 
-        left = node.siblings[0]
-        parent.beta = self.compute_parent_beta(left.beta, node.beta, parent.alpha)  # noqa
+        left = parent.children[0]
+        self.compute_parent_beta(left.beta, node.beta, parent.alpha,
+                                 parent.beta, self._kernel)
         return self.compute_intermediate_beta(parent)
 
     @property
@@ -85,39 +200,43 @@ class RCSCANDecoder(FastSSCDecoder):
             return make_hard_decision(self.root.alpha + self._compute_result_beta())
 
     @staticmethod
-    def compute_left_alpha(parent_alpha, beta):
+    def compute_left_alpha(parent_alpha, beta, result, kernel=MIN_SUM):
         """Compute LLR for left node."""
-        return RCSCANDecoder.compute_alpha(parent_alpha, beta, is_left=True)
+        RCSCANDecoder.compute_alpha(parent_alpha, beta, result, is_left=True,
+                                    kernel=kernel)
 
     @staticmethod
-    def compute_right_alpha(parent_alpha, beta):
+    def compute_right_alpha(parent_alpha, beta, result, kernel=MIN_SUM):
         """Compute LLR for right node."""
-        return RCSCANDecoder.compute_alpha(parent_alpha, beta, is_left=False)
+        RCSCANDecoder.compute_alpha(parent_alpha, beta, result, is_left=False,
+                                    kernel=kernel)
 
     @staticmethod
-    def compute_alpha(parent_alpha, beta, is_left):
+    def compute_alpha(parent_alpha, beta, result, is_left, kernel=MIN_SUM):
         """Compute ALPHA values for left or right node."""
         N = parent_alpha.size // 2
         left_parent_alpha = parent_alpha[:N]
         right_parent_alpha = parent_alpha[N:]
 
         if is_left:
-            result_alpha = function_1(left_parent_alpha, right_parent_alpha, beta)
+            compute_function_1(left_parent_alpha, right_parent_alpha, beta,
+                               result, kernel)
         else:
-            result_alpha = function_2(left_parent_alpha, beta, right_parent_alpha)
-        return result_alpha
+            compute_function_2(left_parent_alpha, beta, right_parent_alpha,
+                               result, kernel)
 
     @staticmethod
-    def compute_parent_beta(left_beta, right_beta, parent_alpha):
+    def compute_parent_beta(left_beta, right_beta, parent_alpha, result,
+                            kernel=MIN_SUM):
         """Compute bits of a parent Node."""
         N = parent_alpha.size // 2
         left_parent_alpha = parent_alpha[:N]
         right_parent_alpha = parent_alpha[N:]
 
-        parent_beta_left = function_1(left_beta, right_beta, right_parent_alpha)
-        parent_beta_right = function_2(left_beta, left_parent_alpha, right_beta)
-
-        return np.append(parent_beta_left, parent_beta_right)
+        compute_function_1(left_beta, right_beta, right_parent_alpha,
+                           result[:N], kernel)
+        compute_function_2(left_beta, left_parent_alpha, right_beta,
+                           result[N:], kernel)
 
     def _compute_result_beta(self):
         """Compute result BETA values."""
@@ -125,4 +244,6 @@ class RCSCANDecoder(FastSSCDecoder):
         if not self.root.children:
             return self.root.beta
         left, right = self.root.children
-        return self.compute_parent_beta(left.beta, right.beta, alpha)
+        self.compute_parent_beta(left.beta, right.beta, alpha, self.root.beta,
+                                 self._kernel)
+        return self.root.beta
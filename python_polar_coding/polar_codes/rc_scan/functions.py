@@ -1,7 +1,7 @@
 import numba
 import numpy as np
 
-from ..base import INFINITY, compute_alpha
+from ..base import INFINITY, MIN_SUM, check_node, compute_alpha
 
 
 @numba.njit
@@ -42,3 +42,55 @@ def compute_beta_one_node(alpha):
 
     """
     return np.zeros(alpha.size, dtype=np.double)
+
+
+@numba.njit
+def compute_beta_repetition_node(alpha, beta):
+    """Compute beta values for REPETITION node.
+
+    BETA of each bit is the sum of ALPHA values of all the other bits, as
+    computed by SCAN decoding of the node subtree.
+
+    """
+    total = 0.0
+    for i in range(alpha.size):
+        total += alpha[i]
+    for i in range(alpha.size):
+        beta[i] = total - alpha[i]
+
+
+@numba.njit
+def compute_beta_spc_node(alpha, beta, kernel=MIN_SUM):
+    """Compute beta values for SINGLE PARITY CHECK node.
+
+    BETA of each bit is the check node of ALPHA values of all the other
+    bits, for min-sum kernel as computed by SCAN decoding of the node
+    subtree.
+
+    """
+    size = alpha.size
+    # Check node of ALPHA values of the bits before each bit
+    beta[1] = alpha[0]
+    for i in range(2, size):
+        beta[i] = check_node(beta[i - 1], alpha[i - 1], kernel)
+
+    # Combined with check node of ALPHA values of the bits after it
+    after = alpha[size - 1]
+    for i in range(size - 2, 0, -1):
+        beta[i] = check_node(beta[i], after, kernel)
+        after = check_node(after, alpha[i], kernel)
+    beta[0] = after
+
+
+@numba.njit
+def compute_function_1(a, b, c, result, kernel=MIN_SUM):
+    """Function 1 written into `result`."""
+    for i in range(result.size):
+        result[i] = check_node(a[i], b[i] + c[i], kernel)
+
+
+@numba.njit
+def compute_function_2(a, b, c, result, kernel=MIN_SUM):
+    """Function 2 written into `result`."""
+    for i in range(result.size):
+        result[i] = check_node(a[i], b[i], kernel) + c[i]
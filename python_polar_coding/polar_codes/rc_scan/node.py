@@ -2,20 +2,26 @@ import numpy as np
 
 from python_polar_coding.polar_codes.fast_ssc import FastSSCNode
 
-from .functions import compute_beta_one_node, compute_beta_zero_node
+from ..base import INFINITY
+from .functions import compute_beta_repetition_node, compute_beta_spc_node
 
 
 class RCSCANNode(FastSSCNode):
+    # SCAN decoders use soft BETA values
+    BETA_DTYPE = np.double
 
     def compute_leaf_beta(self):
-        """Do nothing for ZERO and ONE nodes.
+        """Compute soft BETA values of REPETITION and SPC nodes.
 
         Unlike SC-based decoders SCAN decoders does not make decisions
-        in leaves.
+        in leaves. BETA values of ZERO and ONE nodes do not depend on
+        ALPHA and are set on initialization.
 
         """
-        if self.is_zero or self.is_one:
-            return
+        if self._node_type == RCSCANNode.REPETITION:
+            compute_beta_repetition_node(self.alpha, self._beta)
+        elif self._node_type == RCSCANNode.SINGLE_PARITY_CHECK:
+            compute_beta_spc_node(self.alpha, self._beta, self.kernel)
 
     def initialize_leaf_beta(self):
         """Initialize BETA values on tree building.
@@ -27,15 +33,18 @@ class RCSCANNode(FastSSCNode):
             return
 
         if self._node_type == RCSCANNode.ZERO_NODE:
-            self._beta = compute_beta_zero_node(self.alpha)
+            # Same as `compute_beta_zero_node`, without a new array
+            self._beta[:] = INFINITY
         if self._node_type == RCSCANNode.ONE_NODE:
-            self._beta = compute_beta_one_node(self.alpha)
+            self._beta[:] = 0
 
     def get_node_type(self):
         """Get the type of RC SCAN Node.
 
         * Zero node - [0, 0, 0, 0, 0, 0, 0, 0];
         * One node - [1, 1, 1, 1, 1, 1, 1, 1];
+        * Single parity check node - [0, 1, 1, 1, 1, 1, 1, 1];
+        * Repetition node - [0, 0, 0, 0, 0, 0, 0, 1].
 
         Or other type.
 
@@ -44,4 +53,9 @@ class RCSCANNode(FastSSCNode):
             return RCSCANNode.ZERO_NODE
         if np.all(self._mask == 1):
             return RCSCANNode.ONE_NODE
+        if (self.N >= self.repetition_min_size
+                and self._check_is_rep(self._mask)):
+            return RCSCANNode.REPETITION
+        if self.N >= self.spc_min_size and self._check_is_spc(self._mask):
+            return RCSCANNode.SINGLE_PARITY_CHECK
         return RCSCANNode.OTHER
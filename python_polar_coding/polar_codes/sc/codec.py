@@ -1,3 +1,7 @@
+from typing import Union
+
+import numpy as np
+
 from ..base import BasePolarCodec
 from .decoder import SCDecoder
 
@@ -6,7 +10,28 @@ class SCPolarCodec(BasePolarCodec):
     """Polar code with SC decoding algorithm."""
     decoder_class = SCDecoder
 
+    def __init__(self, N: int, K: int,
+                 design_snr: float = 0.0,
+                 is_systematic: bool = True,
+                 mask: Union[str, None] = None,
+                 pcc_method: str = BasePolarCodec.BHATTACHARYYA,
+                 compiled: bool = False,
+                 check_node: str = 'min-sum',
+                 llr_bits: int = 0,
+                 fractional_bits: int = 0,
+                 dtype=np.double):
+
+        self.compiled = compiled
+        super().__init__(N=N, K=K,
+                         is_systematic=is_systematic,
+                         design_snr=design_snr,
+                         mask=mask,
+                         pcc_method=pcc_method,
+                         check_node=check_node,
+                         llr_bits=llr_bits,
+                         fractional_bits=fractional_bits,
+                         dtype=dtype)
+
     def init_decoder(self):
-        return self.decoder_class(
-            n=self.n, mask=self.mask, is_systematic=self.is_systematic
-        )
+        return self.decoder_class(compiled=self.compiled,
+                                  **self.get_decoder_kwargs())
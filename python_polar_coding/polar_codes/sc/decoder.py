@@ -1,7 +1,8 @@
 import numba
 import numpy as np
 
-from ..base import decoder, functions
+from ..base import CHECK_NODE_KERNELS, Quantizer, decoder, functions
+from . import functions as sc_functions
 
 
 class SCDecoder(decoder.BaseDecoder):
@@ -13,23 +14,57 @@ class SCDecoder(decoder.BaseDecoder):
     Args:
         mask (np.array): Polar code mask.
         is_systematic (bool): Systematic code or not
+        compiled (bool): Decode using compiled kernels over flat LLR and
+            partial sums memory instead of per-stage arrays.
+        check_node (str): Check-node kernel to compute LLRs of left nodes,
+            one of `CHECK_NODE_KERNELS`.
+        quantizer (Quantizer): Quantizer of received LLRs for fixed-point
+            decoding, floating point LLRs are decoded if not set.
+        dtype (type): Type of floating point LLRs, e.g. `np.float32`.
 
     """
-
-    def __init__(self, n: int, mask: np.array, is_systematic: bool = True):
-        super().__init__(n=n, mask=mask, is_systematic=is_systematic)
-
+    parallel_batch = True
+
+    def __init__(self, n: int, mask: np.array, is_systematic: bool = True,
+                 compiled: bool = False, check_node: str = 'min-sum',
+                 quantizer: Quantizer = None, dtype=np.double,
+                 info_indices: np.array = None):
+        super().__init__(n=n, mask=mask, is_systematic=is_systematic,
+                         quantizer=quantizer, dtype=dtype,
+                         info_indices=info_indices)
+
+        assert check_node in CHECK_NODE_KERNELS, (
+            f'Unsupported check-node kernel ({check_node})')
+        self.compiled = compiled
+        self.check_node = check_node
+        self._kernel = CHECK_NODE_KERNELS[check_node]
         self._current_decision = 0
 
+        # Flat memory of compiled decoding: LLRs, partial sums and decisions
+        self._llr = np.zeros(2 * self.N - 1, dtype=self.llr_dtype)
+        self._bits = np.zeros(2 * self.N, dtype=np.int8)
+        self._decisions = np.zeros(self.N, dtype=np.int8)
+
         # LLR values at intermediate steps
         self.intermediate_llr = None
         # Bit values at intermediate steps
         self.intermediate_bits = None
-        self.current_state = np.zeros(self.n, dtype=np.int8)
-        self.previous_state = np.ones(self.n, dtype=np.int8)
+
+        # Decoding schedule: for each position, the first stage to compute
+        # and the decoder state, where 0 means left and 1 means right node
+        self._first_stages, self._states = (
+            sc_functions.compute_decoding_schedule(self.n))
+        self.current_state = self._states[0]
 
     def decode_internal(self, received_llr: np.array) -> np.array:
         """Implementation of SC decoding method."""
+        if self.compiled:
+            sc_functions.decode_frame(received_llr, self.mask,
+                                      self._llr, self._bits, self._decisions,
+                                      self._kernel, self.llr_limit,
+                                      self.llr_scale)
+            return self.result
+
         self._set_initial_state(received_llr)
 
         for pos in range(self.N):
@@ -37,16 +72,44 @@ class SCDecoder(decoder.BaseDecoder):
 
         return self.result
 
+    def decode_batch_internal(self, received_llr: np.array):
+        """Decode a batch of frames at once over flat memory."""
+        batch_size = received_llr.shape[0]
+        llr = np.zeros((2 * self.N - 1, batch_size), dtype=self.llr_dtype)
+        bits = np.zeros((2 * self.N, batch_size), dtype=np.int8)
+        decisions = np.zeros((self.N, batch_size), dtype=np.int8)
+
+        sc_functions.decode_frames(received_llr, self.mask, llr, bits,
+                                   decisions, self._kernel, self.llr_limit,
+                                   self.llr_scale)
+        if self.is_systematic:
+            return bits[self.N:].T, dict()
+        return decisions.T, dict()
+
     @property
     def result(self):
+        if self.compiled:
+            if self.is_systematic:
+                return self._bits[self.N:]
+            return self._decisions
+
         if self.is_systematic:
             return self.intermediate_bits[0]
         return self.intermediate_bits[-1]
 
+    @property
+    def current_llr(self):
+        """LLR of the current decoding position."""
+        if self.compiled:
+            return self._llr[0]
+        return self.intermediate_llr[-1][0]
+
     def _set_initial_state(self, received_llr):
         """Initialize decoder with received message"""
-        self.current_state = np.zeros(self.n, dtype=np.int8)
-        self.previous_state = np.ones(self.n, dtype=np.int8)
+        if self.compiled:
+            self._llr[self.N - 1:] = received_llr
+            return
+
         # LLR values at intermediate steps
         self.intermediate_llr = self._get_intermediate_llr_structure(
             received_llr)
@@ -57,12 +120,12 @@ class SCDecoder(decoder.BaseDecoder):
         intermediate_llr = [received_llr, ]
         length = self.N // 2
         while length > 0:
-            intermediate_llr.append(np.zeros(length, dtype=np.double))
+            intermediate_llr.append(np.zeros(length, dtype=self.llr_dtype))
             length //= 2
         return intermediate_llr
 
     def _get_intermediate_bits_structure(self):
-        return [np.zeros(self.N, dtype=np.int8) for _ in range(self.n + 1)]
+        return np.zeros((self.n + 1, self.N), dtype=np.int8)
 
     def _decode_position(self, position):
         """Decode single position."""
@@ -70,36 +133,38 @@ class SCDecoder(decoder.BaseDecoder):
         self._compute_intermediate_alpha(position)
         self._compute_beta(position)
         self._compute_intermediate_beta(position)
-        self._update_decoder_state()
 
     def _set_decoder_state(self, position):
         """Set current state of the decoder."""
-        bits = np.unpackbits(
-            np.array([position], dtype=np.uint32).byteswap().view(np.uint8)
-        )
-        self.current_state = bits[-self.n:]
+        self.current_state = self._states[position]
 
     def _compute_intermediate_alpha(self, position):
         """Compute intermediate LLR values."""
-        for i in range(1, self.n + 1):
-            llr = self.intermediate_llr[i - 1]
+        if self.compiled:
+            sc_functions.compute_llr(self._llr, self._bits, position, self.N,
+                                     self._kernel, self.llr_limit,
+                                     self.llr_scale)
+            return
 
-            if self.current_state[i - 1] == self.previous_state[i - 1]:
-                continue
+        for i in range(self._first_stages[position], self.n + 1):
+            llr = self.intermediate_llr[i - 1]
 
             if self.current_state[i - 1] == 0:
-                self.intermediate_llr[i] = functions.compute_left_alpha(llr)
+                functions.compute_left_llr(llr, self.intermediate_llr[i],
+                                           self._kernel, self.llr_scale)
                 continue
 
             end = position
             start = end - np.power(2, self.n - i)
             left_bits = self.intermediate_bits[i][start: end]
-            self.intermediate_llr[i] = functions.compute_right_alpha(llr, left_bits)
+            functions.compute_right_llr(llr, left_bits,
+                                        self.intermediate_llr[i],
+                                        self.llr_limit)
 
     def _compute_beta(self, position):
         """Make decision about current decoding value."""
         mask_bit = self.mask[position]
-        self._current_decision = (int(self.intermediate_llr[-1][0] < 0)
+        self._current_decision = (int(self.current_llr < 0)
                                   if mask_bit == 1 else 0)
 
     @staticmethod
@@ -127,16 +192,12 @@ class SCDecoder(decoder.BaseDecoder):
 
     def _compute_intermediate_beta(self, position):
         """Compute intermediate BIT values."""
-        self.intermediate_bits[-1][position] = self._current_decision
-
-        for i in range(self.n - 1, -1, -1):
-            source = self.intermediate_bits[i + 1]
-            result = self.intermediate_bits[i]
-
-            self.intermediate_bits[i] = functions.compute_encoding_step(
-                i, self.n, source, result
-            )
-
-    def _update_decoder_state(self):
-        """Set next decoding position."""
-        self.previous_state.ravel()[:self.n] = self.current_state
+        if self.compiled:
+            self._decisions[position] = self._current_decision
+            sc_functions.compute_bits(self._bits, position,
+                                      self._current_decision, self.N)
+            return
+
+        sc_functions.update_intermediate_bits(
+            self.intermediate_bits, position, self._current_decision, self.n
+        )
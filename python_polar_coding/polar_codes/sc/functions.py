@@ -0,0 +1,238 @@
+"""Functions for SC decoding.
+
+Compiled SC decoding runs over flat memory. LLR values are stored in a
+single array of size 2N - 1. LLRs of a node of size `s` take positions
+[s - 1, 2s - 1), so the received LLRs are stored at the end of the array and
+the LLR of the current bit is stored at position 0.
+
+Partial sums are stored in a single array of size 2N. Bits of a node of
+size `s` take positions [s, 2s), so the codeword is stored at the end of the
+array after the last bit is decoded.
+
+Batches of frames are decoded over the same memory with an extra last axis
+of size B, so each step of decoding is computed for all the frames at once.
+
+"""
+from functools import lru_cache
+
+import numba
+import numpy as np
+
+from ..base import MIN_SUM, check_node, saturate
+
+
+@lru_cache(maxsize=None)
+def compute_decoding_schedule(n: int):
+    """Compute SC decoding schedule for a code of length 2^n.
+
+    The schedule does not depend on the polar code mask, so it is computed
+    once per code length and shared by all decoders.
+
+    Returns:
+        first_stages (np.array): for each position, the first stage where
+            intermediate LLR values must be recomputed.
+        states (np.array): for each position, the kind of node at each
+            stage: 0 for left node (F function), 1 for right node
+            (G function).
+
+    """
+    positions = np.arange(2 ** n)
+    states = (positions[:, np.newaxis] >> np.arange(n - 1, -1, -1)) & 1
+    states = states.astype(np.int8)
+
+    # Moving from `position - 1` to `position` changes the nodes of the
+    # last stages, the number of them is one more than the number of
+    # trailing zeros of `position`
+    first_stages = np.ones(2 ** n, dtype=np.int64)
+    for position in range(1, 2 ** n):
+        trailing_zeros = (position & -position).bit_length() - 1
+        first_stages[position] = n - trailing_zeros
+
+    states.setflags(write=False)
+    first_stages.setflags(write=False)
+    return first_stages, states
+
+
+@numba.njit
+def compute_llr(llr, bits, position, N, kernel=MIN_SUM, limit=0, scale=1):
+    """Compute LLR of the bit at `position`.
+
+    Only LLRs of the nodes on the path to the bit which were not computed
+    for previous bits are updated. Quantized LLRs of right nodes are
+    saturated to [-limit, limit], `scale` is the quantized value of LLR = 1.
+
+    """
+    if position == 0:
+        size = N // 2
+    else:
+        # The lowest set bit of position is the size of the right node to
+        # compute. All the nodes below it on the path are left nodes.
+        size = position & -position
+        for i in range(size):
+            left = llr[2 * size - 1 + i]
+            right = llr[3 * size - 1 + i]
+            llr[size - 1 + i] = saturate(
+                right + (1 - 2 * bits[2 * size + i]) * left, limit)
+        size //= 2
+
+    while size > 0:
+        for i in range(size):
+            left = llr[2 * size - 1 + i]
+            right = llr[3 * size - 1 + i]
+            llr[size - 1 + i] = check_node(left, right, kernel, scale)
+        size //= 2
+
+
+@numba.njit
+def compute_bits(bits, position, decision, N):
+    """Update partial sums with the decision about the bit at `position`.
+
+    Bits of a left node are stored in the first half of its parent, bits
+    of a right node are combined with them into bits of the parent.
+
+    """
+    bits[1] = decision
+    size = 1
+
+    while size < N:
+        if position & size == 0:
+            for i in range(size):
+                bits[2 * size + i] = bits[size + i]
+            return
+
+        for i in range(size):
+            bits[2 * size + i] ^= bits[size + i]
+            bits[3 * size + i] = bits[size + i]
+        size *= 2
+
+
+@numba.njit
+def decode_frame(received_llr, mask, llr, bits, decisions, kernel=MIN_SUM,
+                 limit=0, scale=1):
+    """Decode a frame using SC decoding.
+
+    Args:
+        received_llr (np.array): LLR values of received message.
+        mask (np.array): Polar code mask.
+        llr (np.array): LLR memory of size 2N - 1.
+        bits (np.array): Partial sums memory of size 2N.
+        decisions (np.array): Memory of size N for decoded bits.
+        kernel (int): Check-node kernel.
+        limit (int): Maximal magnitude of quantized LLRs, 0 for floating
+            point LLRs.
+        scale (int): Quantized value of LLR = 1, 1 for floating point LLRs.
+
+    """
+    N = mask.size
+    llr[N - 1:] = received_llr
+
+    for position in range(N):
+        compute_llr(llr, bits, position, N, kernel, limit, scale)
+        decision = 0
+        if mask[position] == 1 and llr[0] < 0:
+            decision = 1
+        decisions[position] = decision
+        compute_bits(bits, position, decision, N)
+
+
+@numba.njit
+def compute_llr_batch(llr, bits, position, N, kernel=MIN_SUM, limit=0,
+                      scale=1):
+    """Compute LLRs of the bit at `position` for a batch of frames."""
+    batch_size = llr.shape[1]
+
+    if position == 0:
+        size = N // 2
+    else:
+        size = position & -position
+        for i in range(size):
+            for b in range(batch_size):
+                left = llr[2 * size - 1 + i, b]
+                right = llr[3 * size - 1 + i, b]
+                llr[size - 1 + i, b] = saturate(
+                    right + (1 - 2 * bits[2 * size + i, b]) * left, limit)
+        size //= 2
+
+    while size > 0:
+        for i in range(size):
+            for b in range(batch_size):
+                left = llr[2 * size - 1 + i, b]
+                right = llr[3 * size - 1 + i, b]
+                llr[size - 1 + i, b] = check_node(left, right, kernel,
+                                                  scale)
+        size //= 2
+
+
+@numba.njit
+def compute_bits_batch(bits, position, decisions, N):
+    """Update partial sums of a batch of frames with `decisions`."""
+    bits[1] = decisions
+    size = 1
+
+    while size < N:
+        if position & size == 0:
+            bits[2 * size:3 * size] = bits[size:2 * size]
+            return
+
+        bits[2 * size:3 * size] ^= bits[size:2 * size]
+        bits[3 * size:4 * size] = bits[size:2 * size]
+        size *= 2
+
+
+@numba.njit(nogil=True)
+def decode_frames(received_llr, mask, llr, bits, decisions,
+                  kernel=MIN_SUM, limit=0, scale=1):
+    """Decode a batch of frames using SC decoding.
+
+    Args:
+        received_llr (np.array): LLR values of received messages of shape
+            (B, N).
+        mask (np.array): Polar code mask.
+        llr (np.array): LLR memory of shape (2N - 1, B).
+        bits (np.array): Partial sums memory of shape (2N, B).
+        decisions (np.array): Memory of shape (N, B) for decoded bits.
+        kernel (int): Check-node kernel.
+        limit (int): Maximal magnitude of quantized LLRs, 0 for floating
+            point LLRs.
+        scale (int): Quantized value of LLR = 1, 1 for floating point LLRs.
+
+    """
+    N = mask.size
+    llr[N - 1:] = received_llr.T
+
+    for position in range(N):
+        compute_llr_batch(llr, bits, position, N, kernel, limit, scale)
+        if mask[position] == 1:
+            for b in range(llr.shape[1]):
+                decisions[position, b] = llr[0, b] < 0
+        else:
+            decisions[position] = 0
+        compute_bits_batch(bits, position, decisions[position], N)
+
+
+@numba.njit
+def update_intermediate_bits(intermediate_bits, position, decision, n):
+    """Update intermediate bits of all stages with the decision at `position`.
+
+    Encoding is linear, so the decision changes only the bits into which
+    the unit vector at `position` is encoded. At each stage those are the
+    positions obtained by clearing any subset of the `position` bits which
+    were already processed by the encoding steps. Zero decision changes
+    nothing.
+
+    """
+    if intermediate_bits[n, position] == decision:
+        return
+    intermediate_bits[n, position] = decision
+
+    for level in range(n - 1, -1, -1):
+        processed = position & ((1 << (n - level)) - 1)
+        unprocessed = position - processed
+
+        # Iterate over all submasks of processed bits
+        submask = processed
+        while True:
+            intermediate_bits[level, unprocessed + submask] ^= 1
+            if submask == 0:
+                break
+            submask = (submask - 1) & processed
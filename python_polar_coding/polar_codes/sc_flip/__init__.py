@@ -0,0 +1,2 @@
+from .codec import SCFlipPolarCodec
+from .decoder import SCFlipDecoder
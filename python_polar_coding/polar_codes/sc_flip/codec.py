@@ -0,0 +1,43 @@
+from typing import Union
+
+import numpy as np
+
+from ..base import BaseCRCPolarCodec
+from .decoder import SCFlipDecoder
+
+
+class SCFlipPolarCodec(BaseCRCPolarCodec):
+    """Polar code with SC Flip decoding algorithm and CRC."""
+    decoder_class = SCFlipDecoder
+
+    def __init__(self, N: int, K: int,
+                 crc_size: int = 32,
+                 design_snr: float = 0.0,
+                 is_systematic: bool = True,
+                 mask: Union[str, None] = None,
+                 pcc_method: str = BaseCRCPolarCodec.BHATTACHARYYA,
+                 T: int = 8,
+                 check_node: str = 'min-sum',
+                 llr_bits: int = 0,
+                 fractional_bits: int = 0,
+                 dtype=np.double):
+
+        self.T = T
+        super().__init__(N=N, K=K,
+                         is_systematic=is_systematic,
+                         design_snr=design_snr,
+                         mask=mask,
+                         pcc_method=pcc_method,
+                         crc_size=crc_size,
+                         check_node=check_node,
+                         llr_bits=llr_bits,
+                         fractional_bits=fractional_bits,
+                         dtype=dtype)
+
+    def init_decoder(self):
+        return self.decoder_class(T=self.T, **self.get_decoder_kwargs())
+
+    def to_dict(self):
+        d = super().to_dict()
+        d.update({'T': self.T})
+        return d
@@ -0,0 +1,123 @@
+from collections import defaultdict
+
+import numpy as np
+
+from python_polar_coding.polar_codes.base import BaseDecoder, Quantizer
+from python_polar_coding.polar_codes.crc import CRC
+from python_polar_coding.polar_codes.sc import SCDecoder
+
+from .functions import decode_flipped, decode_positions
+
+
+class SCFlipDecoder(SCDecoder):
+    """SC Flip decoding with CRC.
+
+    The frame is decoded by SC decoding first. If the info bits fail the
+    CRC check, the frame is decoded again flipping the decision of one of
+    the `T` least reliable info bits at a time, from the least reliable
+    one, until the CRC check passes. The result of SC decoding is taken if
+    no attempt passes the check. CRC is removed from the decoded info bits.
+
+    Based on: O. Afisiadis, A. Balatsoukas-Stimming, A. Burg, "A
+    Low-Complexity Improved Successive Cancellation Decoder for Polar
+    Codes", https://arxiv.org/abs/1412.5501
+
+    Args:
+        T (int): Maximal number of flipped decisions.
+
+    """
+    # Statistics of the decoded frames are kept in the decoder
+    parallel_batch = False
+
+    def __init__(self, n: int, mask: np.array, crc_codec: CRC,
+                 is_systematic: bool = True, T: int = 8,
+                 check_node: str = 'min-sum', quantizer: Quantizer = None,
+                 dtype=np.double, info_indices: np.array = None):
+        super().__init__(n=n, mask=mask, is_systematic=is_systematic,
+                         compiled=True, check_node=check_node,
+                         quantizer=quantizer, dtype=dtype,
+                         info_indices=info_indices)
+        self.crc_codec = crc_codec
+        self.T = T
+        # Indices of info bits without CRC
+        self._message_indices = self.info_indices[:-crc_codec.crc_size]
+
+        # LLRs of the decisions and the result of SC decoding
+        self._decision_llr = np.zeros(self.N, dtype=self.llr_dtype)
+        self._sc_decisions = np.zeros(self.N, dtype=np.int8)
+        self._sc_codeword = np.zeros(self.N, dtype=np.int8)
+
+        self._attempts = 0
+        self._crc_passed = False
+        # Number of decoded frames per number of decoding attempts
+        self.attempts = defaultdict(int)
+
+    @property
+    def status(self):
+        """Number of decoding attempts and the result of CRC check."""
+        return {'attempts': self._attempts, 'crc_passed': self._crc_passed}
+
+    @property
+    def average_attempts(self) -> float:
+        """Average number of decoding attempts of the decoded frames."""
+        frames = sum(self.attempts.values())
+        if not frames:
+            return 0.0
+        return sum(a * count for a, count in self.attempts.items()) / frames
+
+    def reset_statistics(self):
+        """Forget the numbers of attempts of the decoded frames."""
+        self.attempts.clear()
+
+    def decode_internal(self, received_llr: np.array) -> np.array:
+        """Decode by SC decoding flipping decisions on CRC failure."""
+        self._llr[self.N - 1:] = received_llr
+        decode_positions(self.mask, self._llr, self._bits, self._decisions,
+                         self._decision_llr, 0, self._kernel, self.llr_limit,
+                         self.llr_scale)
+        self._attempts = 1
+        self._crc_passed = self._check_crc()
+
+        if not self._crc_passed:
+            self._flip_decisions()
+
+        self.attempts[self._attempts] += 1
+        return self.result
+
+    def decode_batch_internal(self, received_llr: np.array):
+        """Decode a batch of received messages frame by frame."""
+        return BaseDecoder.decode_batch_internal(self, received_llr)
+
+    def get_result(self, decoded: np.array,
+                   out: np.array = None) -> np.array:
+        """Get decoded info bits without CRC."""
+        return np.take(decoded, self._message_indices, out=out)
+
+    def get_batch_result(self, decoded: np.array) -> np.array:
+        """Get decoded info bits of a batch of messages without CRC."""
+        return np.take(decoded, self._message_indices, axis=1)
+
+    def _flip_decisions(self):
+        """Decode again flipping the least reliable info bits one by one."""
+        self._sc_decisions[:] = self._decisions
+        self._sc_codeword[:] = self._bits[self.N:]
+
+        reliability = np.abs(self._decision_llr[self.info_indices])
+        flips = self.info_indices[
+            np.argsort(reliability, kind='stable')[:self.T]]
+
+        for position in flips:
+            decode_flipped(self.mask, self._llr, self._bits, self._decisions,
+                           self._decision_llr, self._sc_decisions, position,
+                           self._kernel, self.llr_limit, self.llr_scale)
+            self._attempts += 1
+            if self._check_crc():
+                self._crc_passed = True
+                return
+
+        self._decisions[:] = self._sc_decisions
+        self._bits[self.N:] = self._sc_codeword
+
+    def _check_crc(self) -> bool:
+        """Check info bits of the result by CRC."""
+        return self.crc_codec.check_crc(self.result[self.info_indices])
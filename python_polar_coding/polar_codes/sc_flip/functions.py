@@ -0,0 +1,75 @@
+"""Functions for SC Flip decoding over flat memory of compiled SC decoding.
+
+See `sc.functions` for the memory layout.
+
+"""
+import numba
+
+from ..base import MIN_SUM, check_node, saturate
+from ..sc.functions import compute_bits, compute_llr
+
+
+@numba.njit
+def decode_positions(mask, llr, bits, decisions, decision_llr, start,
+                     kernel=MIN_SUM, limit=0, scale=1):
+    """Decode the bits from `start` to the end of the frame.
+
+    LLRs the decisions are made on are written into `decision_llr`.
+
+    """
+    N = mask.size
+    for position in range(start, N):
+        compute_llr(llr, bits, position, N, kernel, limit, scale)
+        decision_llr[position] = llr[0]
+        decision = 0
+        if mask[position] == 1 and llr[0] < 0:
+            decision = 1
+        decisions[position] = decision
+        compute_bits(bits, position, decision, N)
+
+
+@numba.njit
+def restore_state(llr, bits, decisions, position, kernel=MIN_SUM, limit=0,
+                  scale=1):
+    """Restore LLRs and partial sums of decoding at `position`.
+
+    Partial sums are computed from `decisions` of the previous bits. LLRs
+    are computed only for the nodes on the path from the root to the bit,
+    the other LLRs are not used by the following bits.
+
+    """
+    N = bits.size // 2
+    for previous in range(position):
+        compute_bits(bits, previous, decisions[previous], N)
+
+    size = N // 2
+    while size > 0:
+        for i in range(size):
+            left = llr[2 * size - 1 + i]
+            right = llr[3 * size - 1 + i]
+            if position & size:
+                llr[size - 1 + i] = saturate(
+                    right + (1 - 2 * bits[2 * size + i]) * left, limit)
+            else:
+                llr[size - 1 + i] = check_node(left, right, kernel, scale)
+        size //= 2
+
+
+@numba.njit
+def decode_flipped(mask, llr, bits, decisions, decision_llr, sc_decisions,
+                   position, kernel=MIN_SUM, limit=0, scale=1):
+    """Decode the frame again with the decision at `position` flipped.
+
+    Decoding resumes at `position` from the state restored from the
+    decisions of SC decoding `sc_decisions` instead of from the start of
+    the frame.
+
+    """
+    N = mask.size
+    decisions[:position] = sc_decisions[:position]
+    restore_state(llr, bits, decisions, position, kernel, limit, scale)
+
+    decisions[position] = 1 - sc_decisions[position]
+    compute_bits(bits, position, decisions[position], N)
+    decode_positions(mask, llr, bits, decisions, decision_llr, position + 1,
+                     kernel, limit, scale)
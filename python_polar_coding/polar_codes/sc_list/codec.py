@@ -1,5 +1,7 @@
 from typing import Union
 
+import numpy as np
+
 from ..base import BasePolarCodec
 from .decoder import SCListDecoder
 
@@ -13,20 +15,45 @@ class SCListPolarCodec(BasePolarCodec):
                  is_systematic: bool = True,
                  mask: Union[str, None] = None,
                  pcc_method: str = BasePolarCodec.BHATTACHARYYA,
-                 L: int = 1):
+                 L: int = 1,
+                 compiled: bool = False,
+                 check_node: str = 'min-sum',
+                 llr_bits: int = 0,
+                 fractional_bits: int = 0,
+                 dtype=np.double,
+                 lazy_copy: bool = False,
+                 split_threshold: float = 0,
+                 prune_threshold: float = 0):
 
         self.L = L
+        self.compiled = compiled
+        self.lazy_copy = lazy_copy
+        self.split_threshold = split_threshold
+        self.prune_threshold = prune_threshold
         super().__init__(N=N, K=K,
                          is_systematic=is_systematic,
                          design_snr=design_snr,
                          mask=mask,
-                         pcc_method=pcc_method)
+                         pcc_method=pcc_method,
+                         check_node=check_node,
+                         llr_bits=llr_bits,
+                         fractional_bits=fractional_bits,
+                         dtype=dtype)
 
     def init_decoder(self):
-        return self.decoder_class(n=self.n, mask=self.mask,
-                                  is_systematic=self.is_systematic, L=self.L)
+        return self.decoder_class(L=self.L,
+                                  compiled=self.compiled,
+                                  lazy_copy=self.lazy_copy,
+                                  split_threshold=self.split_threshold,
+                                  prune_threshold=self.prune_threshold,
+                                  **self.get_decoder_kwargs())
 
     def to_dict(self):
         d = super().to_dict()
-        d.update({'L': self.L})
+        d.update({
+            'L': self.L,
+            'lazy_copy': self.lazy_copy,
+            'split_threshold': self.split_threshold,
+            'prune_threshold': self.prune_threshold,
+        })
         return d
@@ -1,27 +1,80 @@
 import numpy as np
 
-from python_polar_coding.polar_codes.base import BaseDecoder
+from python_polar_coding.polar_codes.base import (
+    CHECK_NODE_KERNELS,
+    BaseDecoder,
+    Encoder,
+    Quantizer,
+)
 
 from .decoding_path import SCPath
+from .path_memory import PathMemory
 
 
 class SCListDecoder(BaseDecoder):
-    """SC List decoding."""
+    """SC List decoding.
+
+    Args:
+        lazy_copy (bool): Keep the paths in shared memory copied only on
+            write instead of copying each path on splitting. Paths are
+            decoded over flat memory as compiled SC paths. With `compiled`
+            all the paths decode the whole frame in a single compiled call.
+        split_threshold (float): Paths are not split on information bits
+            with LLR magnitude of at least the threshold, the hard decision
+            is taken instead. 0 to split on every information bit.
+        prune_threshold (float): Paths with metric worse than the metric of
+            the best path by more than the threshold are dropped. 0 to keep
+            the best L paths.
+
+    Both thresholds are in units of the decoded LLRs, i.e. of quantized
+    LLRs for fixed-point decoding.
+
+    """
     path_class = SCPath
 
     def __init__(self, n: int,
                  mask: np.array,
                  is_systematic: bool = True,
-                 L: int = 1):
-        super().__init__(n=n, mask=mask, is_systematic=is_systematic)
+                 L: int = 1,
+                 compiled: bool = False,
+                 check_node: str = 'min-sum',
+                 quantizer: Quantizer = None,
+                 dtype=np.double,
+                 info_indices: np.array = None,
+                 lazy_copy: bool = False,
+                 split_threshold: float = 0,
+                 prune_threshold: float = 0):
+        super().__init__(n=n, mask=mask, is_systematic=is_systematic,
+                         quantizer=quantizer, dtype=dtype,
+                         info_indices=info_indices)
         self.L = L
-        self.paths = [
-            self.path_class(n=n, mask=mask, is_systematic=is_systematic),
-        ]
+        self.compiled = compiled
+        self.check_node = check_node
+        self.lazy_copy = lazy_copy
+        self.split_threshold = split_threshold
+        self.prune_threshold = prune_threshold
+        self.paths = [self._create_path()]
+
+        self._memory = None
+        if lazy_copy:
+            self._memory = PathMemory(n=n, L=L, llr_dtype=self.llr_dtype,
+                                      kernel=CHECK_NODE_KERNELS[check_node],
+                                      llr_limit=self.llr_limit,
+                                      llr_scale=self.llr_scale)
+        # Paths of lazy copying decoding from the best to the worst one and
+        # their metrics
+        self._order = [0]
+        self._metrics = np.zeros(L)
+
+        # Number of splits skipped on reliable bits and of pruned paths
+        # while decoding the last frame
+        self._counters = np.zeros(2, dtype=np.int64)
 
     @property
     def result(self):
         """Decoding result."""
+        if self.lazy_copy:
+            return [self._get_path_result(path) for path in self._order]
         return [path.result for path in self.paths]
 
     @property
@@ -29,8 +82,23 @@ class SCListDecoder(BaseDecoder):
         """Result from the best path."""
         return self.result[0]
 
+    @property
+    def status(self):
+        """Index of the path the result is taken from, the numbers of
+        skipped splits and of pruned paths."""
+        skipped_splits, pruned_paths = self._counters
+        return {
+            'path': 0,
+            'skipped_splits': int(skipped_splits),
+            'pruned_paths': int(pruned_paths),
+        }
+
     def decode_internal(self, received_llr: np.array) -> np.array:
         """Implementation of SC decoding method."""
+        self._counters[:] = 0
+        if self.lazy_copy:
+            return self._decode_lazy(received_llr)
+
         self._set_initial_state(received_llr)
 
         for pos in range(self.N):
@@ -38,19 +106,112 @@ class SCListDecoder(BaseDecoder):
 
         return self.best_result
 
+    def _decode_lazy(self, received_llr: np.array) -> np.array:
+        """Decode with paths sharing the memory copied on write.
+
+        Paths are split, selected and ordered the same way as `SCPath`
+        objects, so the result is the same.
+
+        """
+        if self.compiled:
+            order = self._memory.decode(received_llr, self.mask,
+                                        self._metrics, self._counters,
+                                        self.split_threshold,
+                                        self.prune_threshold)
+            self._order = list(order)
+            return self.best_result
+
+        self._memory.reset(received_llr)
+        self._order = [0]
+        self._metrics[:] = 0
+
+        for position in range(self.N):
+            self._decode_lazy_position(position)
+
+        return self.best_result
+
+    def _decode_lazy_position(self, position):
+        """Decode one bit by each path of lazy copying decoding."""
+        memory = self._memory
+        is_info = self.mask[position]
+
+        # Candidate paths: a path and its decision with the path metric
+        candidates = list()
+        for path in self._order:
+            llr = float(memory.compute_llr(path, position))
+            metric = self._metrics[path]
+
+            if is_info and self._is_reliable(llr):
+                self._counters[0] += 1
+                candidates.append((path, int(llr < 0), metric))
+                continue
+
+            candidates.append((path, 0, metric + min(llr, 0)))
+            if is_info:
+                candidates.append((path, 1, metric - max(llr, 0)))
+
+        # Stable sort keeps the order of paths with equal metrics
+        candidates = sorted(candidates, key=lambda c: c[2],
+                            reverse=True)[:self.L]
+        candidates = self._prune(candidates, key=lambda c: c[2])
+
+        survived = {path for path, _, _ in candidates}
+        for path in self._order:
+            if path not in survived:
+                memory.kill(path)
+
+        # Both decisions of a path survived: the second one is decoded by
+        # the copy of the path made before the decisions are written
+        free = [p for p in range(self.L) if p not in survived]
+        order = list()
+        for path, _, _ in candidates:
+            if path in order:
+                new_path = free.pop()
+                memory.clone(path, new_path)
+                path = new_path
+            order.append(path)
+
+        for path, (_, decision, metric) in zip(order, candidates):
+            memory.compute_bits(path, position, decision)
+            self._metrics[path] = metric
+
+        self._order = order
+
+    def _get_path_result(self, path):
+        """Decoding result of the path of lazy copying decoding."""
+        codeword = self._memory.codeword(path)
+        if self.is_systematic:
+            return codeword
+        # Polar transform is an involution, so the decoded bits are the
+        # transform of the codeword
+        return Encoder._non_systematic_encode(np.array(codeword), self.n)
+
+    def _create_path(self):
+        return self.path_class(n=self.n, mask=self.mask,
+                               is_systematic=self.is_systematic,
+                               compiled=self.compiled,
+                               check_node=self.check_node,
+                               quantizer=self.quantizer,
+                               dtype=self.dtype,
+                               info_indices=self.info_indices)
+
     def _set_initial_state(self, received_llr):
-        """Initialize paths with received message."""
-        for path in self.paths:
-            path._set_initial_state(received_llr)
+        """Start decoding of received message from a single path.
+
+        Paths of the previously decoded message are dropped.
+
+        """
+        self.paths = [self._create_path()]
+        self.paths[0]._set_initial_state(received_llr)
 
     def _decode_position(self, position):
         """Single step of SC-decoding algorithm to decode one bit."""
         self.set_decoder_state(position)
         self._compute_intermediate_alpha(position)
 
-        if self.mask[position] == 1:
+        if self.mask[position]:
             self._populate_paths()
-        if self.mask[position] == 0:
+        else:
             self.set_frozen_value()
 
         self._update_paths_metrics()
@@ -73,14 +234,40 @@ class SCListDecoder(BaseDecoder):
             path._current_decision = 0
 
     def _populate_paths(self):
-        """Populate SC paths with alternative decisions."""
+        """Populate SC paths with alternative decisions.
+
+        Paths are not split on reliable bits.
+
+        """
         new_paths = list()
         for path in self.paths:
+            llr = float(path.current_llr)
+            if self._is_reliable(llr):
+                self._counters[0] += 1
+                path._current_decision = int(llr < 0)
+                new_paths.append(path)
+                continue
+
             split_result = path.split_path()
             new_paths += split_result
 
         self.paths = new_paths
 
+    def _is_reliable(self, llr: float) -> bool:
+        """Whether the split on the bit with the LLR is skipped."""
+        return 0 < self.split_threshold <= abs(llr)
+
+    def _prune(self, paths: list, key) -> list:
+        """Drop the paths which metric, given by `key`, is too far behind
+        the metric of the best path, the first one."""
+        if not self.prune_threshold:
+            return paths
+
+        worst = key(paths[0]) - self.prune_threshold
+        kept = [path for path in paths if key(path) >= worst]
+        self._counters[1] += len(paths) - len(kept)
+        return kept
+
     def _update_paths_metrics(self):
         """Update path metric of each path."""
         for path in self.paths:
@@ -96,9 +283,9 @@ class SCListDecoder(BaseDecoder):
             self.paths = sorted(self.paths, reverse=True)
         else:
             self.paths = sorted(self.paths, reverse=True)[:self.L]
+        self.paths = self._prune(self.paths, key=lambda p: p._path_metric)
 
     def _compute_bits(self, position):
         """Compute bits of each path."""
         for path in self.paths:
             path._compute_intermediate_beta(position)
-            path._update_decoder_state()
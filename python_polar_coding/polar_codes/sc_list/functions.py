@@ -0,0 +1,283 @@
+"""Functions for SC List decoding with lazy copying of paths.
+
+Based on: I. Tal, A. Vardy, "List Decoding of Polar Codes", Section IV,
+https://arxiv.org/abs/1206.0050
+
+LLRs and partial sums of the paths are stored as in compiled SC decoding
+in arrays of shape (L, 2N - 1) and (L, 2N), one row per array. Each stage
+`k` of a row, the node of size s = 2^k, is a separate array: LLRs take
+positions [s - 1, 2s - 1) and partial sums take positions [s, 2s) of the
+row. A path refers to a row for every stage, so the paths share the stages
+they did not change. A stage shared by several paths is moved into a free
+row only when one of them writes it.
+
+Received LLRs are the stage `n` of LLRs shared by all paths and never
+written.
+
+"""
+import numba
+import numpy as np
+
+from ..base import MIN_SUM, check_node, saturate
+
+
+@numba.njit
+def make_stage_writable(pointers, references, path, stage):
+    """Give the path its own row of the stage.
+
+    Returns:
+        row (int): the row of the stage the path referred to before.
+
+    """
+    row = pointers[path, stage]
+    if references[stage, row] == 1:
+        return row
+
+    free = 0
+    while references[stage, free] > 0:
+        free += 1
+
+    references[stage, row] -= 1
+    references[stage, free] = 1
+    pointers[path, stage] = free
+    return row
+
+
+@numba.njit
+def clone_path(pointers, references, path, new_path):
+    """Make `new_path` refer to all the stages of `path`."""
+    for stage in range(pointers.shape[1]):
+        row = pointers[path, stage]
+        pointers[new_path, stage] = row
+        references[stage, row] += 1
+
+
+@numba.njit
+def kill_path(pointers, references, path):
+    """Release all the stages of the path."""
+    for stage in range(pointers.shape[1]):
+        references[stage, pointers[path, stage]] -= 1
+
+
+@numba.njit
+def compute_path_llr(received_llr, llr, bits, llr_pointers, llr_references,
+                     bits_pointers, path, position, kernel=MIN_SUM, limit=0,
+                     scale=1):
+    """Compute LLR of the bit at `position` for the path.
+
+    Same as `sc.functions.compute_llr` over the stages of the path.
+
+    Returns:
+        llr (float): LLR of the bit.
+
+    """
+    n = llr_pointers.shape[1]
+    size = 1 << (n - 1) if position == 0 else position & -position
+    stage = 0
+    while (1 << stage) < size:
+        stage += 1
+
+    is_right = position != 0
+    while stage >= 0:
+        size = 1 << stage
+        if stage + 1 == n:
+            parent = received_llr
+        else:
+            parent = llr[llr_pointers[path, stage + 1], 2 * size - 1:]
+
+        make_stage_writable(llr_pointers, llr_references, path, stage)
+        row = llr_pointers[path, stage]
+
+        if is_right:
+            left_bits = bits[bits_pointers[path, stage + 1], 2 * size:]
+            for i in range(size):
+                llr[row, size - 1 + i] = saturate(
+                    parent[size + i] + (1 - 2 * left_bits[i]) * parent[i],
+                    limit)
+            is_right = False
+        else:
+            for i in range(size):
+                llr[row, size - 1 + i] = check_node(
+                    parent[i], parent[size + i], kernel, scale)
+        stage -= 1
+
+    return llr[llr_pointers[path, 0], 0]
+
+
+@numba.njit
+def compute_path_bits(bits, pointers, references, path, position, decision):
+    """Update partial sums of the path with the decision at `position`.
+
+    Same as `sc.functions.compute_bits` over the stages of the path.
+
+    """
+    make_stage_writable(pointers, references, path, 0)
+    bits[pointers[path, 0], 1] = decision
+
+    n = pointers.shape[1] - 1
+    for stage in range(n):
+        size = 1 << stage
+        child = pointers[path, stage]
+        previous = make_stage_writable(pointers, references, path, stage + 1)
+        parent = pointers[path, stage + 1]
+
+        if position & size == 0:
+            for i in range(size):
+                bits[parent, 2 * size + i] = bits[child, size + i]
+            return
+
+        # Bits of the left child are read from the shared stage
+        for i in range(size):
+            bits[parent, 2 * size + i] = (bits[previous, 2 * size + i]
+                                          ^ bits[child, size + i])
+            bits[parent, 3 * size + i] = bits[child, size + i]
+
+
+@numba.njit
+def select_candidates(metrics, L):
+    """Select up to L candidates with the best metrics.
+
+    Candidates with equal metrics are taken in the order they are given,
+    the selected ones are ordered from the best to the worst.
+
+    Returns:
+        selected (np.array): indices of the selected candidates.
+
+    """
+    count = metrics.size
+    if count > L:
+        # The L-th best metric: candidates above it are taken and the
+        # first of the candidates equal to it fill the rest
+        threshold = metrics[np.argpartition(-metrics, L - 1)[L - 1]]
+        equal = L - np.sum(metrics > threshold)
+        selected = np.empty(L, dtype=np.int64)
+        k = 0
+        for i in range(count):
+            if metrics[i] > threshold or (metrics[i] == threshold
+                                          and equal > 0):
+                if metrics[i] == threshold:
+                    equal -= 1
+                selected[k] = i
+                k += 1
+    else:
+        selected = np.arange(count)
+
+    ranking = np.argsort(-metrics[selected], kind='mergesort')
+    return selected[ranking]
+
+
+@numba.njit(nogil=True)
+def decode_list_frame(received_llr, mask, llr, bits, llr_pointers,
+                      llr_references, bits_pointers, bits_references,
+                      order, metrics, counters, kernel=MIN_SUM, limit=0,
+                      scale=1, split_threshold=0.0, prune_threshold=0.0):
+    """Decode a frame using SC List decoding with lazy copying of paths.
+
+    All the paths are decoded over memory of L rows, see module docstring.
+    At each information bit every path is split into two candidates and
+    the best L of them survive. Path metric is LLR-based:
+    https://arxiv.org/abs/1411.7282 Section III-B.
+
+    Paths are not split on bits with |LLR| >= `split_threshold` and the
+    paths with metric worse than the best one by more than
+    `prune_threshold` are dropped, zero thresholds disable both.
+
+    Args:
+        order (np.array): Memory of size L for the paths from the best to
+            the worst one.
+        metrics (np.array): Memory of size L for the path metrics.
+        counters (np.array): Memory of size 2 for the numbers of skipped
+            splits and of pruned paths.
+
+    Returns:
+        count (int): Number of paths in `order`.
+
+    """
+    L = order.size
+    N = mask.size
+
+    llr_pointers[:] = 0
+    bits_pointers[:] = 0
+    llr_references[:] = 0
+    bits_references[:] = 0
+    llr_references[:, 0] = 1
+    bits_references[:, 0] = 1
+    metrics[:] = 0
+    counters[:] = 0
+    order[0] = 0
+    count = 1
+
+    paths = np.empty(2 * L, dtype=np.int64)
+    decisions = np.empty(2 * L, dtype=np.int8)
+    candidates = np.empty(2 * L)
+    alive = np.zeros(L, dtype=np.bool_)
+    taken = np.zeros(L, dtype=np.bool_)
+
+    for position in range(N):
+        size = 0
+        for j in range(count):
+            path = order[j]
+            path_llr = float(compute_path_llr(
+                received_llr, llr, bits, llr_pointers, llr_references,
+                bits_pointers, path, position, kernel, limit, scale))
+
+            if (mask[position] == 1 and split_threshold > 0
+                    and abs(path_llr) >= split_threshold):
+                counters[0] += 1
+                paths[size] = path
+                decisions[size] = path_llr < 0
+                candidates[size] = metrics[path]
+                size += 1
+                continue
+
+            paths[size] = path
+            decisions[size] = 0
+            candidates[size] = metrics[path] + min(path_llr, 0.0)
+            size += 1
+            if mask[position] == 1:
+                paths[size] = path
+                decisions[size] = 1
+                candidates[size] = metrics[path] - max(path_llr, 0.0)
+                size += 1
+
+        selected = select_candidates(candidates[:size], L)
+        if prune_threshold > 0:
+            worst = candidates[selected[0]] - prune_threshold
+            kept = 1
+            while (kept < selected.size
+                   and candidates[selected[kept]] >= worst):
+                kept += 1
+            counters[1] += selected.size - kept
+            selected = selected[:kept]
+
+        alive[:] = False
+        for i in selected:
+            alive[paths[i]] = True
+        for j in range(count):
+            if not alive[order[j]]:
+                kill_path(llr_pointers, llr_references, order[j])
+                kill_path(bits_pointers, bits_references, order[j])
+
+        # Both decisions of a path survived: the second one is decoded by
+        # the copy of the path made before the decisions are written
+        taken[:] = False
+        for k in range(selected.size):
+            path = paths[selected[k]]
+            if taken[path]:
+                new_path = 0
+                while alive[new_path]:
+                    new_path += 1
+                alive[new_path] = True
+                clone_path(llr_pointers, llr_references, path, new_path)
+                clone_path(bits_pointers, bits_references, path, new_path)
+                path = new_path
+            taken[path] = True
+            order[k] = path
+
+        count = selected.size
+        for k in range(count):
+            compute_path_bits(bits, bits_pointers, bits_references, order[k],
+                              position, decisions[selected[k]])
+            metrics[order[k]] = candidates[selected[k]]
+
+    return count
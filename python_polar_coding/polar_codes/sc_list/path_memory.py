@@ -0,0 +1,114 @@
+import numpy as np
+
+from ..base import MIN_SUM
+from . import functions
+
+
+class PathMemory:
+    """LLRs and partial sums of up to L SC List decoding paths.
+
+    Paths share the stages of LLRs and partial sums with reference counts
+    and a stage is copied only when a path writes it, so splitting a path
+    costs O(log N) instead of copying all its memory.
+
+    See `functions` module for the memory layout.
+
+    Args:
+        n (int): Code length is 2^n.
+        L (int): Maximal number of paths.
+        llr_dtype (type): Type of LLR values.
+        kernel (int): Check-node kernel.
+        llr_limit (int): Maximal magnitude of quantized LLRs, 0 for floating
+            point LLRs.
+        llr_scale (int): Quantized value of LLR = 1, 1 for floating point
+            LLRs.
+
+    """
+
+    def __init__(self, n: int, L: int, llr_dtype=np.double,
+                 kernel: int = MIN_SUM, llr_limit: int = 0,
+                 llr_scale: int = 1):
+        self.n = n
+        self.N = 2 ** n
+        self.L = L
+        self.kernel = kernel
+        self.llr_limit = llr_limit
+        self.llr_scale = llr_scale
+
+        self.llr = np.zeros((L, 2 * self.N - 1), dtype=llr_dtype)
+        self.bits = np.zeros((L, 2 * self.N), dtype=np.int8)
+
+        # Rows of each stage the paths refer to and the number of paths
+        # referring to each row of each stage
+        self.llr_pointers = np.zeros((L, n), dtype=np.int64)
+        self.llr_references = np.zeros((n, L), dtype=np.int64)
+        self.bits_pointers = np.zeros((L, n + 1), dtype=np.int64)
+        self.bits_references = np.zeros((n + 1, L), dtype=np.int64)
+
+        self.received_llr = None
+        self._order = np.zeros(L, dtype=np.int64)
+
+    def reset(self, received_llr: np.array):
+        """Start decoding of received message by the path 0."""
+        self.received_llr = received_llr
+        self.llr_pointers[:] = 0
+        self.bits_pointers[:] = 0
+        self.llr_references[:] = 0
+        self.bits_references[:] = 0
+        self.llr_references[:, 0] = 1
+        self.bits_references[:, 0] = 1
+
+    def decode(self, received_llr: np.array, mask: np.array,
+               metrics: np.array, counters: np.array,
+               split_threshold: float = 0,
+               prune_threshold: float = 0) -> np.array:
+        """Decode a frame by all the paths in a single compiled call.
+
+        Args:
+            metrics (np.array): Array of size L for the path metrics.
+            counters (np.array): Array of size 2 for the numbers of skipped
+                splits and of pruned paths.
+
+        Returns:
+            order (np.array): paths from the best to the worst one.
+
+        """
+        self.received_llr = received_llr
+        count = functions.decode_list_frame(
+            received_llr, mask, self.llr, self.bits,
+            self.llr_pointers, self.llr_references,
+            self.bits_pointers, self.bits_references,
+            self._order, metrics, counters, self.kernel, self.llr_limit,
+            self.llr_scale, split_threshold, prune_threshold,
+        )
+        return self._order[:count]
+
+    def compute_llr(self, path: int, position: int) -> float:
+        """Compute LLR of the bit at `position` for the path."""
+        return functions.compute_path_llr(
+            self.received_llr, self.llr, self.bits,
+            self.llr_pointers, self.llr_references, self.bits_pointers,
+            path, position, self.kernel, self.llr_limit, self.llr_scale,
+        )
+
+    def compute_bits(self, path: int, position: int, decision: int):
+        """Update partial sums of the path with the decision."""
+        functions.compute_path_bits(self.bits, self.bits_pointers,
+                                    self.bits_references, path, position,
+                                    decision)
+
+    def clone(self, path: int, new_path: int):
+        """Make `new_path` a copy of the path."""
+        functions.clone_path(self.llr_pointers, self.llr_references,
+                             path, new_path)
+        functions.clone_path(self.bits_pointers, self.bits_references,
+                             path, new_path)
+
+    def kill(self, path: int):
+        """Release the memory of the path."""
+        functions.kill_path(self.llr_pointers, self.llr_references, path)
+        functions.kill_path(self.bits_pointers, self.bits_references, path)
+
+    def codeword(self, path: int) -> np.array:
+        """Codeword of the path decoded up to the last bit."""
+        return self.bits[self.bits_pointers[path, self.n], self.N:]
@@ -1,2 +1,2 @@
-from .codec import SCListCRCPolarCodec
-from .decoder import SCListCRCDecoder
+from .codec import AdaptiveSCListCRCPolarCodec, SCListCRCPolarCodec
+from .decoder import AdaptiveSCListCRCDecoder, SCListCRCDecoder
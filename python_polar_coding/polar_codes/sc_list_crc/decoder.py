@@ -1,26 +1,169 @@
+from collections import defaultdict
+
 import numpy as np
 
+from python_polar_coding.polar_codes.base import Quantizer
 from python_polar_coding.polar_codes.crc import CRC
 
 from ..sc_list import SCListDecoder
 
 
 class SCListCRCDecoder(SCListDecoder):
-    """SC List decoding with CRC."""
+    """SC List decoding with CRC.
+
+    The result is taken from the best path which info bits pass the CRC
+    check, or from the best path if there is no such path. CRC is removed
+    from the decoded info bits.
+
+    """
 
     def __init__(self,
                  n: int,
                  mask: np.array,
                  crc_codec: CRC,
                  is_systematic: bool = True,
-                 L: int = 1):
-        super().__init__(n=n, mask=mask, is_systematic=is_systematic, L=L)
+                 L: int = 1,
+                 compiled: bool = False,
+                 check_node: str = 'min-sum',
+                 quantizer: Quantizer = None,
+                 dtype=np.double,
+                 info_indices: np.array = None,
+                 lazy_copy: bool = False,
+                 split_threshold: float = 0,
+                 prune_threshold: float = 0):
+        super().__init__(n=n, mask=mask, is_systematic=is_systematic, L=L,
+                         compiled=compiled, check_node=check_node,
+                         quantizer=quantizer, dtype=dtype,
+                         info_indices=info_indices, lazy_copy=lazy_copy,
+                         split_threshold=split_threshold,
+                         prune_threshold=prune_threshold)
         self.crc_codec = crc_codec
+        # Indices of info bits without CRC
+        self._message_indices = self.info_indices[:-crc_codec.crc_size]
+        self._best_path = 0
+        self._crc_passed = False
 
     @property
     def best_result(self):
-        """Result from the best path."""
-        for result in self.result:
-            if self.crc_codec.check_crc(result):
-                return result[:-self.crc_codec.crc_size]
-        return super().best_result
+        """Result from the best path passing the CRC check."""
+        results = self.result
+        for i, result in enumerate(results):
+            if self.crc_codec.check_crc(result[self.info_indices]):
+                self._best_path, self._crc_passed = i, True
+                return result
+
+        self._best_path, self._crc_passed = 0, False
+        return results[0]
+
+    @property
+    def status(self):
+        """Index of the chosen path, the result of CRC check and the
+        counters of SC List decoding."""
+        return {
+            **super().status,
+            'path': self._best_path,
+            'crc_passed': self._crc_passed,
+        }
+
+    def get_result(self, decoded: np.array,
+                   out: np.array = None) -> np.array:
+        """Get decoded info bits without CRC."""
+        return np.take(decoded, self._message_indices, out=out)
+
+    def get_batch_result(self, decoded: np.array) -> np.array:
+        """Get decoded info bits of a batch of messages without CRC."""
+        return np.take(decoded, self._message_indices, axis=1)
+
+
+class AdaptiveSCListCRCDecoder(SCListCRCDecoder):
+    """Adaptive SC List decoding with CRC.
+
+    A frame is decoded with the list size of 1 first. While no path passes
+    the CRC check, the same received LLRs are decoded again with the list
+    size doubled up to `L_max`, so most of the frames are decoded at the
+    cost of SC decoding.
+
+    Based on: B. Li, H. Shen, D. Tse, "An Adaptive Successive Cancellation
+    List Decoder for Polar Codes with Cyclic Redundancy Check",
+    https://arxiv.org/abs/1208.3091
+
+    Args:
+        L_max (int): Maximal list size.
+
+    Other arguments are the same as of `SCListCRCDecoder` and are used by
+    decoders of all the list sizes.
+
+    """
+
+    def __init__(self,
+                 n: int,
+                 mask: np.array,
+                 crc_codec: CRC,
+                 is_systematic: bool = True,
+                 L_max: int = 32,
+                 **kwargs):
+        super().__init__(n=n, mask=mask, crc_codec=crc_codec,
+                         is_systematic=is_systematic, L=L_max, **kwargs)
+        self.L_max = L_max
+
+        # Decoders of the list sizes smaller than `L_max`, the last attempt
+        # is made by this decoder
+        self._decoders = list()
+        kwargs['info_indices'] = self.info_indices
+        L = 1
+        while L < L_max:
+            self._decoders.append(SCListCRCDecoder(
+                n=n, mask=mask, crc_codec=crc_codec,
+                is_systematic=is_systematic, L=L, **kwargs,
+            ))
+            L *= 2
+
+        self._list_size = L_max
+        # Number of decoded frames per list size the frames were decoded with
+        self.list_sizes = defaultdict(int)
+
+    @property
+    def status(self):
+        """Status of the decoder the result is taken from and its list size.
+        """
+        decoder = self._get_decoder(self._list_size)
+        if decoder is self:
+            status = super().status
+        else:
+            status = decoder.status
+        return {**status, 'list_size': self._list_size}
+
+    def decode_internal(self, received_llr: np.array) -> np.array:
+        """Decode with growing list size until CRC check passes."""
+        for decoder in self._decoders:
+            result = decoder.decode_internal(received_llr)
+            if decoder.status['crc_passed']:
+                return self._set_list_size(decoder.L, result)
+
+        result = super().decode_internal(received_llr)
+        return self._set_list_size(self.L_max, result)
+
+    @property
+    def average_list_size(self) -> float:
+        """Average list size of the decoded frames."""
+        frames = sum(self.list_sizes.values())
+        if not frames:
+            return 0.0
+        return sum(L * count for L, count in self.list_sizes.items()) / frames
+
+    def reset_statistics(self):
+        """Forget the list sizes of the decoded frames."""
+        self.list_sizes.clear()
+
+    def _set_list_size(self, L: int, result: np.array) -> np.array:
+        """Count the frame decoded with the list size."""
+        self._list_size = L
+        self.list_sizes[L] += 1
+        return result
+
+    def _get_decoder(self, L: int) -> SCListCRCDecoder:
+        """Decoder of the list size."""
+        for decoder in self._decoders:
+            if decoder.L == L:
+                return decoder
+        return self
@@ -0,0 +1,2 @@
+from .codec import SCStackPolarCodec
+from .decoder import SCStackDecoder
@@ -0,0 +1,47 @@
+from typing import Union
+
+import numpy as np
+
+from ..base import BasePolarCodec
+from .decoder import SCStackDecoder
+
+
+class SCStackPolarCodec(BasePolarCodec):
+    """Polar code with SC Stack decoding algorithm."""
+    decoder_class = SCStackDecoder
+
+    def __init__(self, N: int, K: int,
+                 design_snr: float = 0.0,
+                 is_systematic: bool = True,
+                 mask: Union[str, None] = None,
+                 pcc_method: str = BasePolarCodec.BHATTACHARYYA,
+                 L: int = 8,
+                 D: int = 256,
+                 check_node: str = 'min-sum',
+                 llr_bits: int = 0,
+                 fractional_bits: int = 0,
+                 dtype=np.double):
+
+        self.L = L
+        self.D = D
+        super().__init__(N=N, K=K,
+                         is_systematic=is_systematic,
+                         design_snr=design_snr,
+                         mask=mask,
+                         pcc_method=pcc_method,
+                         check_node=check_node,
+                         llr_bits=llr_bits,
+                         fractional_bits=fractional_bits,
+                         dtype=dtype)
+
+    def init_decoder(self):
+        return self.decoder_class(L=self.L, D=self.D,
+                                  **self.get_decoder_kwargs())
+
+    def to_dict(self):
+        d = super().to_dict()
+        d.update({
+            'L': self.L,
+            'D': self.D,
+        })
+        return d
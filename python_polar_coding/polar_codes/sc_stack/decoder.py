@@ -0,0 +1,148 @@
+import bisect
+
+import numpy as np
+
+from python_polar_coding.polar_codes.base import (
+    CHECK_NODE_KERNELS,
+    BaseDecoder,
+    Encoder,
+    Quantizer,
+)
+from python_polar_coding.polar_codes.sc_list.path_memory import PathMemory
+
+from .decoding_path import StackPath
+
+
+class SCStackDecoder(BaseDecoder):
+    """SC Stack decoding.
+
+    Paths are kept in a stack sorted by path metrics. The best path is
+    taken from the stack and decoded up to the next info bit, where it is
+    split into two paths put back into the stack. Decoding stops when the
+    best path is decoded up to the end of the frame.
+
+    The stack keeps up to `D` paths, the worst paths are dropped. When `L`
+    paths were split at the same info bit, the paths which did not pass
+    the bit are dropped.
+
+    Paths share the memory copied on write as paths of SC List decoding
+    with lazy copying, so a split does not copy the memory of the path.
+
+    Based on: K. Niu, K. Chen, "CRC-Aided Decoding of Polar Codes", IEEE
+    Communications Letters, 2012.
+
+    Args:
+        L (int): Maximal number of paths split at each info bit.
+        D (int): Maximal number of paths in the stack.
+
+    """
+
+    def __init__(self, n: int,
+                 mask: np.array,
+                 is_systematic: bool = True,
+                 L: int = 8,
+                 D: int = 256,
+                 check_node: str = 'min-sum',
+                 quantizer: Quantizer = None,
+                 dtype=np.double,
+                 info_indices: np.array = None):
+        super().__init__(n=n, mask=mask, is_systematic=is_systematic,
+                         quantizer=quantizer, dtype=dtype,
+                         info_indices=info_indices)
+        self.L = L
+        self.D = D
+        self.check_node = check_node
+
+        # The path taken from the full stack needs one more slot to split
+        self._memory = PathMemory(n=n, L=D + 1, llr_dtype=self.llr_dtype,
+                                  kernel=CHECK_NODE_KERNELS[check_node],
+                                  llr_limit=self.llr_limit,
+                                  llr_scale=self.llr_scale)
+        self.stack = list()
+        self._free_slots = list()
+        self._best_path = None
+        # Number of bits decoded by all paths of the last frame
+        self._computed_bits = 0
+
+    @property
+    def result(self):
+        """Decoding result of the best path."""
+        codeword = self._memory.codeword(self._best_path.slot)
+        if self.is_systematic:
+            return codeword
+        return Encoder._non_systematic_encode(np.array(codeword), self.n)
+
+    @property
+    def status(self):
+        """Number of bits decoded by all the paths."""
+        return {'computed_bits': self._computed_bits}
+
+    def decode_internal(self, received_llr: np.array) -> np.array:
+        """Implementation of SC Stack decoding method."""
+        self._memory.reset(received_llr)
+        self.stack = [StackPath(slot=0)]
+        self._free_slots = list(range(self.D, 0, -1))
+        self._computed_bits = 0
+        # Number of paths split at each position
+        splits = np.zeros(self.N, dtype=np.int64)
+
+        while True:
+            path = self.stack.pop()
+            if path.position == self.N:
+                break
+
+            self._decode_frozen_bits(path)
+            if path.position == self.N:
+                bisect.insort(self.stack, path)
+                continue
+
+            position = path.position
+            self._split_path(path)
+
+            splits[position] += 1
+            if splits[position] == self.L:
+                self._drop_paths(lambda p: p.position <= position)
+            while len(self.stack) > self.D:
+                self._kill(self.stack.pop(0))
+
+        self._best_path = path
+        return self.result
+
+    def _decode_frozen_bits(self, path: StackPath):
+        """Decode the path up to the next info bit."""
+        while path.position < self.N and not self.mask[path.position]:
+            self._compute_llr(path)
+            path.decide(0)
+            self._memory.compute_bits(path.slot, path.position - 1, 0)
+
+    def _split_path(self, path: StackPath):
+        """Split the path on the info bit into two paths in the stack."""
+        self._compute_llr(path)
+        new_path = path.fork(self._free_slots.pop())
+        self._memory.clone(path.slot, new_path.slot)
+
+        for p, decision in [(path, 0), (new_path, 1)]:
+            p.decide(decision)
+            self._memory.compute_bits(p.slot, p.position - 1, decision)
+            bisect.insort(self.stack, p)
+
+    def _compute_llr(self, path: StackPath):
+        """Compute LLR of the current bit of the path."""
+        path.current_llr = float(
+            self._memory.compute_llr(path.slot, path.position))
+        self._computed_bits += 1
+
+    def _drop_paths(self, condition):
+        """Drop the paths of the stack satisfying the condition."""
+        kept = list()
+        for path in self.stack:
+            if condition(path):
+                self._kill(path)
+            else:
+                kept.append(path)
+        self.stack = kept
+
+    def _kill(self, path: StackPath):
+        """Release the memory of the path."""
+        self._memory.kill(path.slot)
+        self._free_slots.append(path.slot)
@@ -0,0 +1,34 @@
+from python_polar_coding.polar_codes.base import DecodingPathMixin
+
+
+class StackPath(DecodingPathMixin):
+    """Decoding path of SC Stack decoder.
+
+    LLRs and partial sums of the path are stored in the row `slot` of the
+    path memory shared by all paths, see `sc_list.PathMemory`.
+
+    Args:
+        slot (int): Row of the path in the path memory.
+        position (int): Number of decoded bits.
+
+    """
+
+    def __init__(self, slot: int, position: int = 0, **kwargs):
+        super().__init__(**kwargs)
+        self.slot = slot
+        self.position = position
+        self.current_llr = 0.0
+        self._current_decision = 0
+
+    def fork(self, slot: int) -> 'StackPath':
+        """Make a path with the same decoded bits in another slot."""
+        new_path = self.__class__(slot=slot, position=self.position)
+        new_path._path_metric = self._path_metric
+        new_path.current_llr = self.current_llr
+        return new_path
+
+    def decide(self, decision: int):
+        """Take the decision about the current bit."""
+        self._current_decision = decision
+        self.update_path_metric()
+        self.position += 1
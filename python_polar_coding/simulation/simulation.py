@@ -40,7 +40,8 @@ def simulate(code_type: str, channel_type: str, snr: float, messages: int,
              code_params: Dict) -> Dict:
     """Simulate polar codes transmission."""
     code = CODE_MAP[code_type](**code_params)
-    modem = MODEM_MAP[channel_type](fec_rate=code.K/code.N, snr_db=snr)
+    modem = MODEM_MAP[channel_type](fec_rate=code.K/code.N, snr_db=snr,
+                                    dtype=code.dtype)
     channel = SimpleAWGNChannel()
 
     bit_errors, frame_errors = 0, 0
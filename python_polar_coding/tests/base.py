@@ -6,6 +6,7 @@ from python_polar_coding.channels.simple import SimpleBPSKModulationAWGN
 class BasicVerifyPolarCode:
     """Provides simple BPSK modulator for polar codes testing."""
     messages = 1000
+    batch_size = 20
     polar_code_class = None
     channel_class = SimpleBPSKModulationAWGN
     code_parameters = None
@@ -13,7 +14,8 @@ class BasicVerifyPolarCode:
     @classmethod
     def setUpClass(cls):
         fec_rate = cls.code_parameters['K'] / cls.code_parameters['N']
-        cls.channel = cls.channel_class(fec_rate)
+        dtype = cls.code_parameters.get('dtype', np.double)
+        cls.channel = cls.channel_class(fec_rate, dtype=dtype)
         cls.polar_code = cls.polar_code_class(**cls.code_parameters)
         cls.result = cls.polar_code.to_dict()
 
@@ -63,6 +65,40 @@ class BasicVerifyPolarCode:
         self.assertEqual(bit_errors, 0)
         self.assertEqual(frame_errors, 0)
 
+    def test_decode_batch(self):
+        """Batch decoding gives the same result as frame by frame decoding.
+        """
+        messages = np.random.randint(0, 2, (self.batch_size, self.K))
+        llr = np.array([
+            self.channel.transmit(message=self.polar_code.encode(message),
+                                  snr_db=1.0)
+            for message in messages
+        ])
+
+        decoded, status = self.polar_code.decode_batch(llr)
+
+        expected = np.array([self.polar_code.decode(l) for l in llr])
+        np.testing.assert_equal(decoded, expected)
+        for value in status.values():
+            self.assertEqual(len(value), self.batch_size)
+
+    def test_decode_batch_parallel(self):
+        """Batch decoding by threads gives the same result as by one."""
+        messages = np.random.randint(0, 2, (self.batch_size, self.K))
+        llr = np.array([
+            self.channel.transmit(message=self.polar_code.encode(message),
+                                  snr_db=1.0)
+            for message in messages
+        ])
+
+        decoded, status = self.polar_code.decode_batch(llr, workers=3)
+
+        expected, expected_status = self.polar_code.decode_batch(llr)
+        np.testing.assert_equal(decoded, expected)
+        self.assertEqual(status.keys(), expected_status.keys())
+        for key, value in status.items():
+            np.testing.assert_equal(value, expected_status[key])
+
     def _get_channel(self):
         fec_rate = self.K / self.N
         return self.channel_class(fec_rate)
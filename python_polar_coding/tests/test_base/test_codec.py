@@ -22,7 +22,8 @@ class SimplePC(BasePolarCodec):
 
     def init_decoder(self):
         return self.decoder_class(
-            n=self.n, mask=self.mask, is_systematic=self.is_systematic
+            n=self.n, mask=self.mask, is_systematic=self.is_systematic,
+            info_indices=self.info_indices,
         )
 
 
@@ -32,7 +33,8 @@ class SimplePCCRC(BaseCRCPolarCodec):
 
     def init_decoder(self):
         return self.decoder_class(
-            n=self.n, mask=self.mask, is_systematic=self.is_systematic
+            n=self.n, mask=self.mask, is_systematic=self.is_systematic,
+            info_indices=self.info_indices,
         )
 
 
@@ -133,6 +135,28 @@ class TestBasicPolarCode(TestCase):
 
         self.assertTrue(all(extracted == self.message))
 
+    def test_extract_into_buffer(self):
+        """Test extraction of info bits into preallocated array."""
+        precoded = self.systematic_code.encoder._precode(self.message)
+        result = np.zeros(self.info_length, dtype=np.int8)
+
+        extracted = self.systematic_code.decoder.get_result(precoded,
+                                                            out=result)
+
+        self.assertIs(extracted, result)
+        np.testing.assert_equal(result, self.message)
+
+    def test_mask_indices(self):
+        """Encoder and decoder share indices of info and frozen bits."""
+        code = self.systematic_code
+        np.testing.assert_equal(code.info_indices,
+                                np.flatnonzero(code.mask == 1))
+        np.testing.assert_equal(code.frozen_indices,
+                                np.flatnonzero(code.mask == 0))
+        self.assertIs(code.encoder.info_indices, code.info_indices)
+        self.assertIs(code.decoder.info_indices, code.info_indices)
+        self.assertFalse(code.info_indices.flags.writeable)
+
     def test_non_systematic_encode(self):
         """Test `encode` method for non-systematic code."""
         encoded = self.non_systematic_code.encode(self.message)
@@ -153,3 +177,43 @@ class TestBasicPolarCode(TestCase):
 
         extracted = self.systematic_crc_code.decoder.get_result(encoded)
         self.assertTrue(all(extracted[:self.info_length] == self.message))
+
+    def test_non_systematic_encode_batch(self):
+        """Test `encode_batch` method for non-systematic code."""
+        messages = np.random.randint(0, 2, (100, self.info_length))
+        encoded = self.non_systematic_code.encode_batch(messages)
+
+        self.assertEqual(encoded.shape, (100, self.codeword_length))
+        for message, codeword in zip(messages, encoded):
+            np.testing.assert_equal(
+                codeword,
+                self.non_systematic_code.encode(message),
+            )
+
+    def test_systematic_encode_batch(self):
+        """Test `encode_batch` method for systematic code."""
+        messages = np.random.randint(0, 2, (100, self.info_length))
+        messages[0] = self.message
+        encoded = self.systematic_code.encode_batch(messages)
+
+        self.assertEqual(encoded.shape, (100, self.codeword_length))
+        np.testing.assert_equal(encoded[0], self.sys_enc_msg)
+        for message, codeword in zip(messages, encoded):
+            np.testing.assert_equal(
+                codeword,
+                self.systematic_code.encode(message),
+            )
+
+    def test_systematic_encode_batch_with_crc(self):
+        """Test `encode_batch` method for systematic code with CRC."""
+        messages = np.random.randint(0, 2, (100, self.info_length))
+        messages[0] = self.message
+        encoded = self.systematic_crc_code.encode_batch(messages)
+
+        self.assertEqual(encoded.shape, (100, self.codeword_length))
+        np.testing.assert_equal(encoded[0], self.sys_crc_enc_msg)
+        for message, codeword in zip(messages, encoded):
+            np.testing.assert_equal(
+                codeword,
+                self.systematic_crc_code.encode(message),
+            )
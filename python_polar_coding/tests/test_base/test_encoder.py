@@ -0,0 +1,50 @@
+from unittest import TestCase
+
+import numpy as np
+
+from python_polar_coding.polar_codes.base import (
+    BitSlicedEncoder,
+    Encoder,
+    pack_frames,
+    unpack_frames,
+)
+
+
+class TestBitSlicedEncoder(TestCase):
+    """Tests for `BitSlicedEncoder`."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.n = 6
+        cls.mask = np.array([
+            int(m) for m in
+            '0000000000000001000000010011111100000011011111110111111111111111'
+        ])
+        cls.K = np.sum(cls.mask)
+        # Not a multiple of 64 to check padding of the last word
+        cls.messages = np.random.randint(0, 2, (150, cls.K))
+
+    def test_pack_and_unpack_frames(self):
+        frames = np.random.randint(0, 2, (150, 64))
+        packed = pack_frames(frames)
+
+        self.assertEqual(packed.shape, (64, 3))
+        self.assertEqual(packed.dtype, np.uint64)
+        np.testing.assert_equal(unpack_frames(packed, 150), frames)
+
+    def test_non_systematic_encode(self):
+        self._check_bit_exact(is_systematic=False)
+
+    def test_systematic_encode(self):
+        self._check_bit_exact(is_systematic=True)
+
+    def _check_bit_exact(self, is_systematic):
+        encoder = Encoder(mask=self.mask, n=self.n,
+                          is_systematic=is_systematic)
+        bitsliced = BitSlicedEncoder(mask=self.mask, n=self.n,
+                                     is_systematic=is_systematic)
+
+        encoded = bitsliced.encode_batch(self.messages)
+        self.assertEqual(encoded.shape, (150, self.mask.size))
+        for message, codeword in zip(self.messages, encoded):
+            np.testing.assert_equal(codeword, encoder.encode(message))
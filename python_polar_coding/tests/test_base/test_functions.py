@@ -0,0 +1,87 @@
+from unittest import TestCase
+
+import numpy as np
+
+from python_polar_coding.polar_codes.base import (
+    BOX_PLUS,
+    CHECK_NODE_KERNELS,
+    MIN_SUM,
+    MIN_SUM_OFFSET,
+    MIN_SUM_SCALE,
+    NORMALIZED_MIN_SUM,
+    OFFSET_MIN_SUM,
+    Quantizer,
+    check_node,
+    compute_left_llr,
+)
+
+
+class TestCheckNode(TestCase):
+    """Tests for check-node kernels."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.llr = np.linspace(-10, 10, 21)
+
+    def test_min_sum(self):
+        self.assertEqual(check_node(-3., 2., MIN_SUM), -2.)
+        self.assertEqual(check_node(-3., -5., MIN_SUM), 3.)
+        self.assertEqual(check_node(0., -5., MIN_SUM), 0.)
+
+    def test_offset_min_sum(self):
+        self.assertEqual(check_node(-3., 2., OFFSET_MIN_SUM),
+                         -(2. - MIN_SUM_OFFSET))
+        self.assertEqual(check_node(MIN_SUM_OFFSET / 2, 2., OFFSET_MIN_SUM),
+                         0.)
+
+    def test_normalized_min_sum(self):
+        self.assertEqual(check_node(-3., 2., NORMALIZED_MIN_SUM),
+                         -2. * MIN_SUM_SCALE)
+
+    def test_box_plus(self):
+        """Box-plus kernel is close to the exact check node."""
+        for a in self.llr:
+            for b in self.llr:
+                exact = 2 * np.arctanh(np.tanh(a / 2) * np.tanh(b / 2))
+                self.assertAlmostEqual(check_node(a, b, BOX_PLUS), exact,
+                                       delta=0.1)
+
+
+class TestQuantizedCheckNode(TestCase):
+    """Tests for check-node kernels over quantized LLRs."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.quantizer = Quantizer(bits=8, fractional_bits=3)
+        values = np.linspace(-12, 12, 49)
+        a, b = np.meshgrid(values, values)
+        cls.llr = np.concatenate([a.ravel(), b.ravel()])
+
+    def _compute(self, llr, kernel, scale=1):
+        result = np.zeros(llr.size // 2, dtype=llr.dtype)
+        compute_left_llr(llr, result, kernel, scale)
+        return result
+
+    def test_offset_min_sum(self):
+        """Offset is applied in units of quantized LLR."""
+        llr = self.quantizer.quantize([1., 3.])
+        result = self._compute(llr, OFFSET_MIN_SUM, self.quantizer.scale)
+        self.assertEqual(result[0] / self.quantizer.scale, 0.5)
+
+    def test_box_plus(self):
+        """Box-plus correction is applied in units of quantized LLR."""
+        llr = self.quantizer.quantize([1., 3.])
+        result = self._compute(llr, BOX_PLUS, self.quantizer.scale)
+        self.assertEqual(result[0] / self.quantizer.scale, 0.875)
+
+    def test_kernels(self):
+        """Quantized results differ from floating point ones by < 1 LSB."""
+        quantized = self.quantizer.quantize(self.llr)
+        scale = self.quantizer.scale
+
+        for name, kernel in CHECK_NODE_KERNELS.items():
+            with self.subTest(kernel=name):
+                expected = self._compute(quantized / scale, kernel)
+                result = self._compute(quantized, kernel, scale)
+                np.testing.assert_array_less(
+                    np.abs(result / scale - expected), 1 / scale)
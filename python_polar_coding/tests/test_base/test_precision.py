@@ -0,0 +1,70 @@
+from unittest import TestCase
+
+import numpy as np
+
+from python_polar_coding.channels import SimpleBPSKModulationAWGN
+from python_polar_coding.polar_codes import (
+    FastSSCPolarCodec,
+    GeneralizedFastSSCPolarCodec,
+    RCSCANPolarCodec,
+    SCListPolarCodec,
+    SCPolarCodec,
+)
+
+
+class TestFloat32Precision(TestCase):
+    """Decoding of float32 LLRs has the same FER as decoding of float64."""
+    N = 512
+    K = 256
+    messages = 500
+    snr_range = [1.0, 1.5, 2.0, 2.5]
+
+    # Allowed difference of the frame error rates
+    max_fer_difference = 0.01
+
+    codes = [
+        (SCPolarCodec, {}),
+        (SCPolarCodec, {'compiled': True}),
+        (FastSSCPolarCodec, {}),
+        (FastSSCPolarCodec, {'compiled': True}),
+        (GeneralizedFastSSCPolarCodec, {'AF': 2}),
+        (RCSCANPolarCodec, {'I': 2}),
+        (SCListPolarCodec, {'L': 4, 'compiled': True}),
+    ]
+
+    def test_fer_parity(self):
+        channel = SimpleBPSKModulationAWGN(self.K / self.N)
+
+        for codec_class, params in self.codes:
+            code = codec_class(N=self.N, K=self.K, **params)
+            code_32 = codec_class(N=self.N, K=self.K, dtype=np.float32,
+                                  **params)
+            self.assertEqual(code_32.to_dict()['dtype'], 'float32')
+
+            for snr_db in self.snr_range:
+                messages = np.random.randint(0, 2, (self.messages, self.K))
+                llr = np.array([
+                    channel.transmit(message=code.encode(m), snr_db=snr_db)
+                    for m in messages
+                ])
+
+                decoded, _ = code.decode_batch(llr)
+                decoded_32, _ = code_32.decode_batch(llr.astype(np.float32))
+
+                fer = np.mean(np.any(decoded != messages, axis=1))
+                fer_32 = np.mean(np.any(decoded_32 != messages, axis=1))
+                self.assertLessEqual(
+                    abs(fer - fer_32), self.max_fer_difference,
+                    f'{code_32.to_dict()["type"]} {params}: {snr_db} dB')
+
+    def test_channel_keeps_float32(self):
+        channel = SimpleBPSKModulationAWGN(0.5, dtype=np.float32)
+        code = SCPolarCodec(N=self.N, K=self.K, compiled=True,
+                            dtype=np.float32)
+        message = np.random.randint(0, 2, self.K)
+
+        llr = channel.transmit(message=code.encode(message), snr_db=10.0)
+
+        self.assertEqual(llr.dtype, np.float32)
+        self.assertEqual(code.decoder._llr.dtype, np.float32)
+        np.testing.assert_equal(code.decode(llr), message)
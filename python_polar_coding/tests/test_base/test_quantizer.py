@@ -0,0 +1,41 @@
+from unittest import TestCase
+
+import numpy as np
+
+from python_polar_coding.polar_codes.base import Quantizer
+
+
+class TestQuantizer(TestCase):
+    """Tests for `Quantizer`."""
+
+    def test_quantize(self):
+        quantizer = Quantizer(bits=8, fractional_bits=2)
+        llr = np.array([0.1, -0.2, 1.3, -2.6, 100.0, -100.0])
+
+        quantized = quantizer.quantize(llr)
+
+        self.assertEqual(quantized.dtype, np.int8)
+        np.testing.assert_equal(quantized, [0, -1, 5, -10, 127, -127])
+
+    def test_quantize_batch(self):
+        quantizer = Quantizer(bits=16, fractional_bits=4)
+        llr = np.random.normal(0, 10, (5, 16))
+
+        quantized = quantizer.quantize(llr)
+
+        self.assertEqual(quantized.shape, llr.shape)
+        self.assertEqual(quantized.dtype, np.int16)
+        error = np.abs(quantized / 16 - llr)
+        np.testing.assert_array_less(error, 1 / 32 + 1e-9)
+
+    def test_limit(self):
+        self.assertEqual(Quantizer(bits=8).limit, 127)
+        self.assertEqual(Quantizer(bits=16).limit, 32767)
+
+    def test_scale(self):
+        self.assertEqual(Quantizer(bits=8).scale, 1)
+        self.assertEqual(Quantizer(bits=16, fractional_bits=4).scale, 16)
+
+    def test_unsupported_size(self):
+        with self.assertRaises(AssertionError):
+            Quantizer(bits=12)
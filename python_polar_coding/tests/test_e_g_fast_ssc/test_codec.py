@@ -0,0 +1,31 @@
+from unittest import TestCase
+
+from python_polar_coding.polar_codes.e_g_fast_ssc import EGFastSSCPolarCodec
+from python_polar_coding.tests.base import BasicVerifyPolarCode
+
+
+class TestEGFastSSCCode_1024_256(BasicVerifyPolarCode, TestCase):
+    polar_code_class = EGFastSSCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 256,
+    }
+
+
+class TestEGFastSSCCompiledCode_1024_256(BasicVerifyPolarCode, TestCase):
+    polar_code_class = EGFastSSCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 256,
+        'compiled': True,
+    }
+
+
+class TestEGFastSSCCompiledCode_2048_1536_AF_3(BasicVerifyPolarCode, TestCase):
+    polar_code_class = EGFastSSCPolarCodec
+    code_parameters = {
+        'N': 2048,
+        'K': 1536,
+        'AF': 3,
+        'compiled': True,
+    }
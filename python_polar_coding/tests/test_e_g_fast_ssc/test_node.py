@@ -58,6 +58,21 @@ class TestEGFastSSC(TestCase):
         mask = np.array([0, 0, 0, 1, 1, 1, 1, 1])
         self.assertTrue(self.check_node._check_is_rep_any(mask))
 
+    def test_compute_rep_any_right_one(self):
+        """"""
+        mask = np.array([0, 0, 0, 1, 1, 1, 1, 1])
+        alpha = np.array([
+            -2.7273, -8.7327, 0.1087, 1.6463,
+             2.0506,  5.0552, 1.5304, -2.1233,
+        ])
+        expected = np.array([1, 1, 1, 0, 0, 0, 0, 1, ])
+
+        node = EGFastSSCNode(mask=mask)
+        node.alpha = alpha
+        node.compute_leaf_beta()
+
+        np.testing.assert_equal(node.beta, expected)
+
     def test_check_is_rep_any_right_spc(self):
         """"""
         mask = np.array([0, 0, 0, 1, 0, 1, 1, 1])
@@ -1,5 +1,7 @@
 from unittest import TestCase
 
+import numpy as np
+
 from python_polar_coding.polar_codes.fast_ssc import FastSSCPolarCodec
 from python_polar_coding.tests.base import BasicVerifyPolarCode
 
@@ -50,3 +52,72 @@ class TestFastSSCCode_2048_1536(BasicVerifyPolarCode, TestCase):
         'N': 2048,
         'K': 1536,
     }
+
+
+class TestFastSSCCompiledCode_1024_512(BasicVerifyPolarCode, TestCase):
+    polar_code_class = FastSSCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'compiled': True,
+    }
+
+
+class TestFastSSCCompiledCode_2048_1536(BasicVerifyPolarCode, TestCase):
+    polar_code_class = FastSSCPolarCodec
+    code_parameters = {
+        'N': 2048,
+        'K': 1536,
+        'compiled': True,
+    }
+
+
+class TestFastSSCNormalizedMinSumCode_1024_512(BasicVerifyPolarCode, TestCase):
+    polar_code_class = FastSSCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'check_node': 'normalized-min-sum',
+    }
+
+
+class TestFastSSCCompiledBoxPlusCode_1024_512(BasicVerifyPolarCode, TestCase):
+    polar_code_class = FastSSCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'compiled': True,
+        'check_node': 'box-plus',
+    }
+
+
+class TestFastSSCQuantizedCode_1024_512(BasicVerifyPolarCode, TestCase):
+    polar_code_class = FastSSCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'llr_bits': 8,
+        'fractional_bits': 2,
+    }
+
+
+class TestFastSSCCompiledQuantizedCode_1024_512(BasicVerifyPolarCode,
+                                                TestCase):
+    polar_code_class = FastSSCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'compiled': True,
+        'llr_bits': 8,
+        'fractional_bits': 2,
+    }
+
+
+class TestFastSSCCompiledFloat32Code_1024_512(BasicVerifyPolarCode, TestCase):
+    polar_code_class = FastSSCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'compiled': True,
+        'dtype': np.float32,
+    }
@@ -2,7 +2,7 @@ from unittest import TestCase
 
 import numpy as np
 
-from python_polar_coding.polar_codes.fast_ssc import FastSSCDecoder
+from python_polar_coding.polar_codes.fast_ssc import FastSSCDecoder, program
 
 
 class TestFastSSCDecoder(TestCase):
@@ -196,3 +196,53 @@ class TestFastSSCDecoder(TestCase):
             np.array([1, 1, 0, 0, 0, 1, 1, 0, 1, 0, 1, 1, 1, 0, 0, 1, ],
                      dtype=np.int8)
         )
+
+    def test_compiled_program(self):
+        mask = np.array([0, 1, 1, 1, 0, 0, 0, 1], dtype=np.int8)
+        decoder = FastSSCDecoder(mask=mask, is_systematic=True, n=self.n,
+                                 compiled=True)
+
+        np.testing.assert_equal(decoder._program, np.array([
+            [program.F, 8, 0, 0, 0],
+            [program.SINGLE_PARITY_CHECK, 4, 0, 0, 0],
+            [program.G, 8, 0, 0, 0],
+            [program.REPETITION, 4, 4, 0, 0],
+            [program.COMBINE, 8, 0, 0, 0],
+        ]))
+
+        decoder.decode(self.received_llr)
+        np.testing.assert_equal(
+            decoder.result,
+            np.array([1, 1, 0, 0, 1, 1, 1, 1, ], dtype=np.int8)
+        )
+
+    def test_compiled_decoding(self):
+        mask = np.array(
+            [1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 1, 0, 0, 1, 1, 1, ], dtype=np.int8)
+        decoder = FastSSCDecoder(mask=mask, is_systematic=True, n=4)
+        compiled_decoder = FastSSCDecoder(mask=mask, is_systematic=True, n=4,
+                                          compiled=True)
+
+        for _ in range(100):
+            llr = np.random.randn(mask.size)
+            decoder.decode(llr)
+            compiled_decoder.decode(llr)
+            np.testing.assert_equal(compiled_decoder.result, decoder.result)
+
+    def test_nodes_share_memory(self):
+        mask = np.array(
+            [1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 1, 0, 0, 1, 1, 1, ], dtype=np.int8)
+        decoder = FastSSCDecoder(mask=mask, is_systematic=True, n=4)
+        compiled_decoder = FastSSCDecoder(mask=mask, is_systematic=True, n=4,
+                                          compiled=True)
+
+        for node in decoder._decoding_tree.descendants:
+            self.assertTrue(np.shares_memory(node.alpha, decoder._alpha))
+            self.assertTrue(np.shares_memory(node.beta, decoder._beta))
+
+        # Decoding of a frame does not depend on the previous frames
+        for _ in range(10):
+            llr = np.random.randn(mask.size)
+            decoder.decode(llr)
+            compiled_decoder.decode(llr)
+            np.testing.assert_equal(decoder.result, compiled_decoder.result)
@@ -1,4 +1,4 @@
-from unittest import TestCase
+from unittest import TestCase, mock
 
 import numpy as np
 
@@ -65,3 +65,33 @@ class FastSSCNodeTest(TestCase):
             self.assertEqual(len(leaf.path), leaf_path_lengths[i])
             np.testing.assert_equal(leaf._mask, leaf_masks[i])
             self.assertEqual(leaf._node_type, leaf_types[i])
+
+    def test_classification_cache(self):
+        mask = np.array([0, 0, 0, 1, 0, 1, 1, 1, 0, 0, 0, 1, 0, 1, 1, 1, ])
+        FastSSCNode.clear_cache()
+        tree = FastSSCNode(mask)
+        # Both halves of the mask are the same
+        self.assertEqual(len(FastSSCNode._cache), 4)
+
+        with mock.patch.object(FastSSCNode, 'get_node_type') as classify:
+            cached_tree = FastSSCNode(mask)
+            classify.assert_not_called()
+
+        self.assertEqual(
+            [leaf.type for leaf in cached_tree.leaves],
+            [leaf.type for leaf in tree.leaves],
+        )
+
+    def test_classification_cache_eviction(self):
+        FastSSCNode.clear_cache()
+        with mock.patch.object(FastSSCNode, 'CACHE_SIZE', 2):
+            FastSSCNode(np.zeros(4))
+            FastSSCNode(np.ones(4))
+            FastSSCNode(np.zeros(4))
+            FastSSCNode(np.array([0, 1, 1, 1]))
+
+        keys = [key[1] for key in FastSSCNode._cache]
+        self.assertEqual(keys, [
+            np.zeros(4, dtype=np.int8).tobytes(),
+            np.array([0, 1, 1, 1], dtype=np.int8).tobytes(),
+        ])
@@ -0,0 +1,77 @@
+from unittest import TestCase
+
+import numpy as np
+
+from python_polar_coding.polar_codes.e_g_fast_ssc import EGFastSSCNode
+from python_polar_coding.polar_codes.fast_ssc import DecodingTree, FastSSCNode
+from python_polar_coding.polar_codes.g_fast_ssc import GeneralizedFastSSCNode
+
+
+class DecodingTreeTest(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mask = np.array(
+            [1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 1, 0, 0, 1, 1, 1, ], dtype=np.int8)
+
+    def test_tree_arrays(self):
+        mask = np.array([0, 1, 1, 1, 0, 0, 0, 1, ], dtype=np.int8)
+        tree = DecodingTree(mask)
+
+        np.testing.assert_equal(tree.types, [
+            FastSSCNode.OTHER,
+            FastSSCNode.SINGLE_PARITY_CHECK,
+            FastSSCNode.REPETITION,
+        ])
+        np.testing.assert_equal(tree.offsets, [0, 0, 4])
+        np.testing.assert_equal(tree.sizes, [8, 4, 4])
+        np.testing.assert_equal(tree.parents, [-1, 0, 0])
+        np.testing.assert_equal(tree.left, [1, -1, -1])
+        np.testing.assert_equal(tree.right, [2, -1, -1])
+        np.testing.assert_equal(tree.leaves, [1, 2])
+
+    def test_leaves_order(self):
+        tree = DecodingTree(self.mask)
+        node = FastSSCNode(self.mask)
+
+        leaves = tree.leaves
+        self.assertEqual(len(leaves), len(node.leaves))
+        for index, leaf in zip(leaves, node.leaves):
+            self.assertEqual(tree.types[index], leaf.type)
+            offset, size = tree.offsets[index], tree.sizes[index]
+            np.testing.assert_equal(self.mask[offset:offset + size],
+                                    leaf._mask)
+
+    def test_to_anytree(self):
+        tree = DecodingTree(self.mask).to_anytree()
+        node = FastSSCNode(self.mask)
+
+        self.assertEqual(len(tree.descendants), len(node.descendants))
+        for leaf, expected in zip(tree.leaves, node.leaves):
+            self.assertEqual(leaf.name, expected.name)
+            self.assertEqual(leaf.type, expected.type)
+            np.testing.assert_equal(leaf._mask, expected._mask)
+
+    def test_g_fast_ssc_tree(self):
+        mask = np.array([0, 0, 0, 0, 0, 0, 1, 1,
+                         0, 0, 0, 0, 1, 1, 1, 1, ], dtype=np.int8)
+        tree = DecodingTree(mask, node_class=GeneralizedFastSSCNode,
+                            N_min=1, AF=1)
+
+        np.testing.assert_equal(tree.types, [
+            FastSSCNode.OTHER,
+            GeneralizedFastSSCNode.G_REPETITION,
+            GeneralizedFastSSCNode.G_REPETITION,
+        ])
+        np.testing.assert_equal(tree.mask_steps, [0, 4, 2])
+        np.testing.assert_equal(tree.last_chunk_types, [0, 1, 1])
+
+    def test_e_g_fast_ssc_tree(self):
+        mask = np.array([0, 0, 0, 0, 0, 0, 0, 0,
+                         0, 0, 1, 1, 1, 1, 1, 1, ], dtype=np.int8)
+        tree = DecodingTree(mask, node_class=EGFastSSCNode, N_min=1, AF=1)
+
+        np.testing.assert_equal(tree.types, [EGFastSSCNode.ZERO_ANY])
+        np.testing.assert_equal(tree.inner_types,
+                                [GeneralizedFastSSCNode.RG_PARITY])
+        np.testing.assert_equal(tree.inner_mask_steps, [4])
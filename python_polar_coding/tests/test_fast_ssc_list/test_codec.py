@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from python_polar_coding.polar_codes.fast_ssc_list import (
+    FastSSCListCRCPolarCodec,
+    FastSSCListPolarCodec,
+)
+from python_polar_coding.tests.base import BasicVerifyPolarCode
+
+
+class TestFastSSCListCode_1024_512_8(BasicVerifyPolarCode, TestCase):
+    polar_code_class = FastSSCListPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'L': 8,
+    }
+
+
+class TestFastSSCListCode_2048_1024_32(BasicVerifyPolarCode, TestCase):
+    polar_code_class = FastSSCListPolarCodec
+    code_parameters = {
+        'N': 2048,
+        'K': 1024,
+        'L': 32,
+    }
+
+
+class TestFastSSCListQuantizedCode_1024_512_8(BasicVerifyPolarCode, TestCase):
+    polar_code_class = FastSSCListPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'L': 8,
+        'llr_bits': 8,
+        'fractional_bits': 2,
+    }
+
+
+class TestFastSSCListCRCCode_1024_512_8(BasicVerifyPolarCode, TestCase):
+    polar_code_class = FastSSCListCRCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'L': 8,
+        'crc_size': 16,
+    }
+
+
+class TestFastSSCListCRCCode_2048_1024_32(BasicVerifyPolarCode, TestCase):
+    polar_code_class = FastSSCListCRCPolarCodec
+    code_parameters = {
+        'N': 2048,
+        'K': 1024,
+        'L': 32,
+    }
@@ -166,3 +166,14 @@ class TestGeneralizedFastSSCCode_2048_1536_AF_3(BasicVerifyPolarCode, TestCase):
         'K': 1536,
         'AF': 3,
     }
+
+
+class TestGeneralizedFastSSCCompiledCode_2048_1536_AF_3(
+        BasicVerifyPolarCode, TestCase):
+    polar_code_class = GeneralizedFastSSCPolarCodec
+    code_parameters = {
+        'N': 2048,
+        'K': 1536,
+        'AF': 3,
+        'compiled': True,
+    }
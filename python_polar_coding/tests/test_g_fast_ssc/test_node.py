@@ -164,3 +164,16 @@ class GeneralizedFastSSCNodeTest(TestCase):
             node._node_type,
             GeneralizedFastSSCNode.RG_PARITY,
         )
+
+    def test_classification_cache(self):
+        GeneralizedFastSSCNode.clear_cache()
+        node = GeneralizedFastSSCNode(mask=self.g_rep_spc)
+        cached_node = GeneralizedFastSSCNode(mask=self.g_rep_spc)
+        self.assertEqual(cached_node.mask_steps, node.mask_steps)
+        self.assertEqual(cached_node.last_chunk_type, node.last_chunk_type)
+
+        mask = np.array([0, 0, 0, 0, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1, ])
+        node = GeneralizedFastSSCNode(mask=mask, AF=1)
+        self.assertNotEqual(node._node_type, GeneralizedFastSSCNode.RG_PARITY)
+        node = GeneralizedFastSSCNode(mask=mask, AF=2)
+        self.assertEqual(node._node_type, GeneralizedFastSSCNode.RG_PARITY)
@@ -0,0 +1,41 @@
+from unittest import TestCase
+
+from python_polar_coding.polar_codes.g_fast_ssc_list import (
+    GeneralizedFastSSCListCRCPolarCodec,
+    GeneralizedFastSSCListPolarCodec,
+)
+from python_polar_coding.tests.base import BasicVerifyPolarCode
+
+
+class TestGeneralizedFastSSCListCode_1024_512_8(BasicVerifyPolarCode,
+                                                TestCase):
+    polar_code_class = GeneralizedFastSSCListPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'L': 8,
+        'AF': 1,
+    }
+
+
+class TestGeneralizedFastSSCListCode_2048_1024_32(BasicVerifyPolarCode,
+                                                  TestCase):
+    polar_code_class = GeneralizedFastSSCListPolarCodec
+    code_parameters = {
+        'N': 2048,
+        'K': 1024,
+        'L': 32,
+        'AF': 3,
+    }
+
+
+class TestGeneralizedFastSSCListCRCCode_1024_512_16(BasicVerifyPolarCode,
+                                                    TestCase):
+    polar_code_class = GeneralizedFastSSCListCRCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'L': 16,
+        'AF': 1,
+        'crc_size': 16,
+    }
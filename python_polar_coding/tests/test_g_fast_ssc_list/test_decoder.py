@@ -0,0 +1,62 @@
+import itertools
+from unittest import TestCase
+
+import numpy as np
+
+from python_polar_coding.polar_codes.base import Encoder
+from python_polar_coding.polar_codes.g_fast_ssc import (
+    GeneralizedFastSSCDecoder,
+    GeneralizedFastSSCNode,
+)
+from python_polar_coding.polar_codes.g_fast_ssc_list import (
+    GeneralizedFastSSCListDecoder,
+)
+
+
+class TestGeneralizedFastSSCListDecoder(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # G-REPETITION and RG-PARITY nodes
+        cls.mask = np.array(
+            [0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1], dtype=np.int8)
+        cls.n = 4
+
+    def test_nodes(self):
+        decoder = GeneralizedFastSSCListDecoder(n=self.n, mask=self.mask)
+        np.testing.assert_equal(decoder._tree.types, [
+            GeneralizedFastSSCNode.OTHER,
+            GeneralizedFastSSCNode.G_REPETITION,
+            GeneralizedFastSSCNode.RG_PARITY,
+        ])
+
+    def test_single_path(self):
+        """Decoding by a single path is Generalized Fast SSC decoding."""
+        decoder = GeneralizedFastSSCDecoder(n=self.n, mask=self.mask,
+                                            compiled=True)
+        list_decoder = GeneralizedFastSSCListDecoder(n=self.n,
+                                                     mask=self.mask, L=1)
+
+        for _ in range(100):
+            llr = np.random.randn(self.mask.size)
+            np.testing.assert_equal(list_decoder.decode(llr),
+                                    decoder.decode(llr))
+
+    def test_maximum_likelihood(self):
+        """Paths keeping all the codewords find the most likely one."""
+        K = int(np.sum(self.mask))
+        encoder = Encoder(mask=self.mask, n=self.n)
+        codewords = np.array([
+            encoder.encode(np.array(message))
+            for message in itertools.product([0, 1], repeat=K)
+        ])
+        decoder = GeneralizedFastSSCListDecoder(n=self.n, mask=self.mask,
+                                                L=2 ** K)
+
+        for _ in range(100):
+            llr = np.random.randn(self.mask.size)
+            # LLR-based metric of each codeword
+            metrics = -np.sum(np.abs(llr) * (codewords != (llr < 0)), axis=1)
+
+            decoder.decode_internal(llr)
+            np.testing.assert_equal(decoder.best_result,
+                                    codewords[np.argmax(metrics)])
@@ -1,6 +1,10 @@
 from unittest import TestCase
 
-from python_polar_coding.polar_codes.rc_scan import RCSCANPolarCodec
+from python_polar_coding.polar_codes.rc_scan import (
+    RCSCANCRCPolarCodec,
+    RCSCANDecoder,
+    RCSCANPolarCodec,
+)
 from python_polar_coding.tests.base import BasicVerifyPolarCode
 
 
@@ -170,3 +174,45 @@ class TestRCSCANCode_2048_1536_iter_4(BasicVerifyPolarCode, TestCase):
         'K': 1536,
         'I': 4,
     }
+
+
+class TestRCSCANBoxPlusCode_1024_512_iter_2(BasicVerifyPolarCode, TestCase):
+    polar_code_class = RCSCANPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'I': 2,
+        'check_node': 'box-plus',
+    }
+
+
+class TestRCSCANDecisionsStoppingCode_1024_512_iter_4(BasicVerifyPolarCode,
+                                                     TestCase):
+    polar_code_class = RCSCANPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'I': 4,
+        'early_stopping': RCSCANDecoder.DECISIONS,
+    }
+
+
+class TestRCSCANEncodingStoppingCode_1024_512_iter_4(BasicVerifyPolarCode,
+                                                    TestCase):
+    polar_code_class = RCSCANPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'I': 4,
+        'early_stopping': RCSCANDecoder.ENCODING,
+    }
+
+
+class TestRCSCANCRCCode_1024_512_iter_4(BasicVerifyPolarCode, TestCase):
+    polar_code_class = RCSCANCRCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'I': 4,
+        'crc_size': 16,
+    }
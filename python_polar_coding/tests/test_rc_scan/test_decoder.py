@@ -2,7 +2,11 @@ from unittest import TestCase
 
 import numpy as np
 
-from python_polar_coding.polar_codes.rc_scan import INFINITY, RCSCANDecoder
+from python_polar_coding.polar_codes.rc_scan import (
+    INFINITY,
+    RCSCANDecoder,
+    RCSCANPolarCodec,
+)
 
 
 class TestRCSCANDecoder(TestCase):
@@ -48,13 +52,8 @@ class TestRCSCANDecoderComplex(TestCase):
         cls.n = 4
         cls.sub_codes = [
             np.array([0, 0, 0, 0, ], dtype=np.int8),
-            np.array([0, ], dtype=np.int8),
-            np.array([1, ], dtype=np.int8),
-            np.array([1, 1, ], dtype=np.int8),
-            np.array([0, ], dtype=np.int8),
-            np.array([1, ], dtype=np.int8),
-            np.array([1, 1, ], dtype=np.int8),
-            np.array([1, 1, 1, 1, ], dtype=np.int8),
+            np.array([0, 1, 1, 1, ], dtype=np.int8),
+            np.array([0, 1, 1, 1, 1, 1, 1, 1, ], dtype=np.int8),
         ]
 
     def _get_decoder(self):
@@ -124,3 +123,73 @@ class TestRCSCANDecoderComplex(TestCase):
             dtype=np.int8
         )
         np.testing.assert_equal(decoder.result, expected_result)
+
+    def test_repeated_decoding(self):
+        decoder = self._get_decoder()
+        llr = np.array([
+            -1.9, -1.7, 2.6, -1.7, -1.1,  2.6, -1.3,  2.4,
+             2.2, -1.8, 2.1, -1.9,  2.3,  2.2, -1.5, -1.2,
+        ])
+
+        decoder.decode(-llr)
+        decoder.decode(llr)
+
+        expected_result = np.array(
+            [1, 1, 0, 0, 1, 0, 1, 0, 0, 1, 0, 1, 0, 0, 1, 1, ],
+            dtype=np.int8
+        )
+        np.testing.assert_equal(decoder.result, expected_result)
+
+
+class TestRCSCANEarlyStopping(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.received_llr = np.array([
+            -1.9, -1.7, 2.6, -1.7, -1.1,  2.6, -1.3,  2.4,
+             2.2, -1.8, 2.1, -1.9,  2.3,  2.2, -1.5, -1.2,
+        ])
+        cls.mask = np.array(
+            [0, 0, 0, 0, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, ],
+            dtype=np.int8
+        )
+        cls.n = 4
+
+    def _decode(self, early_stopping):
+        decoder = RCSCANDecoder(mask=self.mask, n=self.n, I=4,
+                                early_stopping=early_stopping)
+        return decoder.decode_internal(self.received_llr), decoder
+
+    def test_no_early_stopping(self):
+        _, decoder = self._decode(None)
+        self.assertEqual(decoder.status, {'iterations': 4})
+
+    def test_same_decisions(self):
+        result, decoder = self._decode(RCSCANDecoder.DECISIONS)
+        full_result, _ = self._decode(None)
+
+        self.assertEqual(decoder.status, {'iterations': 2})
+        np.testing.assert_equal(result, full_result)
+
+    def test_codeword(self):
+        result, decoder = self._decode(RCSCANDecoder.ENCODING)
+        full_result, _ = self._decode(None)
+
+        self.assertEqual(decoder.status, {'iterations': 1})
+        np.testing.assert_equal(result, full_result)
+
+    def test_average_iterations(self):
+        code = RCSCANPolarCodec(N=64, K=32, I=8,
+                                early_stopping=RCSCANDecoder.ENCODING)
+        message = np.random.randint(0, 2, code.K)
+        received_llr = 1 - 2. * code.encode(message)
+
+        np.testing.assert_equal(code.decode(received_llr), message)
+        self.assertEqual(code.decoder.status, {'iterations': 1})
+
+        code.decode(np.random.normal(0, 1, code.N))
+        iterations = code.decoder.status['iterations']
+        self.assertLessEqual(iterations, code.I)
+        self.assertEqual(code._iterations, (1 + iterations) / 2)
+
+        code.decoder.reset_statistics()
+        self.assertEqual(code._iterations, 0)
@@ -33,6 +33,28 @@ class TestRCSCANNode(TestCase):
             np.zeros(4)
         )
 
+    def test_repetition_node(self):
+        node = RCSCANNode(mask=np.array([0, 0, 0, 1, ]))
+        self.assertEqual(node._node_type, RCSCANNode.REPETITION)
+
+        node.alpha = self.llr
+        node.compute_leaf_beta()
+        np.testing.assert_almost_equal(
+            node.beta,
+            np.array([10.2703, -1.1897, 7.6517, 5.8967, ]),
+        )
+
+    def test_spc_node(self):
+        node = RCSCANNode(mask=np.array([0, 1, 1, 1, ]))
+        self.assertEqual(node._node_type, RCSCANNode.SINGLE_PARITY_CHECK)
+
+        node.alpha = self.llr
+        node.compute_leaf_beta()
+        np.testing.assert_almost_equal(
+            node.beta,
+            np.array([-0.1087, 0.1087, -1.6463, 0.1087, ]),
+        )
+
     def test_with_multiple_nodes(self):
         node = RCSCANNode(mask=np.array([
             0,
@@ -45,14 +67,14 @@ class TestRCSCANNode(TestCase):
         ]))
         self.assertEqual(node._node_type, RCSCANNode.OTHER)
 
-        leaf_path_lengths = [5, 5, 4, 4, 4, 3, 3]
+        leaf_path_lengths = [4, 4, 4, 4, 3, 3]
         leaf_masks = [
-            np.array([0, ]), np.array([1, ]), np.array([0, 0, ]),
+            np.array([0, 1, ]), np.array([0, 0, ]),
             np.array([0, 0, ]), np.array([1, 1, ]),
             np.array([0, 0, 0, 0, ]), np.array([1, 1, 1, 1, ]),
         ]
         leaf_types = [
-            node.ZERO_NODE, node.ONE_NODE, node.ZERO_NODE,
+            node.REPETITION, node.ZERO_NODE,
             node.ZERO_NODE, node.ONE_NODE,
             node.ZERO_NODE, node.ONE_NODE,
         ]
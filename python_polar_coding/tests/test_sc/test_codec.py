@@ -1,5 +1,7 @@
 from unittest import TestCase
 
+import numpy as np
+
 from python_polar_coding.polar_codes.sc import SCPolarCodec
 from python_polar_coding.tests.base import BasicVerifyPolarCode
 
@@ -50,3 +52,92 @@ class TestSCCode_2048_1536(BasicVerifyPolarCode, TestCase):
         'N': 2048,
         'K': 1536,
     }
+
+
+class TestSCCompiledCode_1024_512(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'compiled': True,
+    }
+
+
+class TestSCCompiledCode_2048_1024(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCPolarCodec
+    code_parameters = {
+        'N': 2048,
+        'K': 1024,
+        'compiled': True,
+    }
+
+
+class TestSCBoxPlusCode_1024_512(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'check_node': 'box-plus',
+    }
+
+
+class TestSCCompiledOffsetMinSumCode_1024_512(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'compiled': True,
+        'check_node': 'offset-min-sum',
+    }
+
+
+class TestSCQuantizedCode_1024_512(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'llr_bits': 8,
+        'fractional_bits': 2,
+    }
+
+
+class TestSCCompiledQuantizedCode_1024_512(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'compiled': True,
+        'llr_bits': 16,
+        'fractional_bits': 4,
+    }
+
+
+class TestSCQuantizedBoxPlusCode_1024_512(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'compiled': True,
+        'check_node': 'box-plus',
+        'llr_bits': 8,
+        'fractional_bits': 3,
+    }
+
+
+class TestSCFloat32Code_1024_512(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'dtype': np.float32,
+    }
+
+
+class TestSCCompiledFloat32Code_1024_512(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'compiled': True,
+        'dtype': np.float32,
+    }
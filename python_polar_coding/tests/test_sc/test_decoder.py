@@ -2,7 +2,12 @@ from unittest import TestCase
 
 import numpy as np
 
+from python_polar_coding.polar_codes.base import compute_encoding_step
 from python_polar_coding.polar_codes.sc import SCDecoder
+from python_polar_coding.polar_codes.sc.functions import (
+    compute_decoding_schedule,
+    update_intermediate_bits,
+)
 
 
 class TestSCDecoder(TestCase):
@@ -145,10 +150,80 @@ class TestSCDecoder(TestCase):
                 expected_bits[i]
             )
 
-        self.decoder._update_decoder_state()
-
     def test_decoding_steps(self):
         """Test SC decoding process step-by-step."""
         self.decoder._set_initial_state(self.received_llr)
         for i in range(self.steps):
             self._decoding_step(i)
+
+    def test_compiled_decoding_steps(self):
+        """Test SC decoding process over flat memory step-by-step."""
+        decoder = SCDecoder(mask=self.mask, is_systematic=False, n=3,
+                            compiled=True)
+        decoder._set_initial_state(self.received_llr)
+
+        for i in range(self.steps):
+            decoder._set_decoder_state(i)
+            decoder._compute_intermediate_alpha(i)
+            self.assertAlmostEqual(
+                decoder.current_llr,
+                self.expected_llrs[i][-1][0],
+                places=4,
+            )
+
+            decoder._compute_beta(i)
+            self.assertEqual(
+                decoder._current_decision,
+                self.expected_decoded[i],
+            )
+            decoder._compute_intermediate_beta(i)
+
+        np.testing.assert_equal(decoder.result, self.expected_decoded)
+        np.testing.assert_equal(
+            decoder._bits[decoder.N:],
+            self.expected_bits[-1][0],
+        )
+
+    def test_compiled_decoding(self):
+        """Test SC decoding of a whole frame over flat memory."""
+        decoder = SCDecoder(mask=self.mask, is_systematic=False, n=3,
+                            compiled=True)
+        decoder.decode_internal(self.received_llr)
+
+        np.testing.assert_equal(decoder.result, self.expected_decoded)
+        np.testing.assert_equal(
+            decoder._bits[decoder.N:],
+            self.expected_bits[-1][0],
+        )
+
+
+class TestUpdateIntermediateBits(TestCase):
+
+    def test_same_as_encoding_steps(self):
+        """Incremental update gives the same bits as full re-encoding."""
+        n = 6
+        decisions = np.random.randint(0, 2, 2 ** n)
+        intermediate_bits = np.zeros((n + 1, 2 ** n), dtype=np.int8)
+        expected_bits = np.zeros((n + 1, 2 ** n), dtype=np.int8)
+
+        for position, decision in enumerate(decisions):
+            update_intermediate_bits(intermediate_bits, position, decision, n)
+
+            expected_bits[n, position] = decision
+            for i in range(n - 1, -1, -1):
+                compute_encoding_step(
+                    i, n, expected_bits[i + 1], expected_bits[i])
+
+            np.testing.assert_equal(intermediate_bits, expected_bits)
+
+
+class TestDecodingSchedule(TestCase):
+
+    def test_schedule(self):
+        first_stages, states = compute_decoding_schedule(3)
+
+        np.testing.assert_equal(first_stages, [1, 3, 2, 3, 1, 3, 2, 3])
+        np.testing.assert_equal(states, [
+            [0, 0, 0], [0, 0, 1], [0, 1, 0], [0, 1, 1],
+            [1, 0, 0], [1, 0, 1], [1, 1, 0], [1, 1, 1],
+        ])
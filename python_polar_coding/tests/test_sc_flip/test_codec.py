@@ -0,0 +1,35 @@
+from unittest import TestCase
+
+from python_polar_coding.polar_codes.sc_flip import SCFlipPolarCodec
+from python_polar_coding.tests.base import BasicVerifyPolarCode
+
+
+class TestSCFlipPolarCode1024_512_8(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCFlipPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'T': 8,
+        'crc_size': 16,
+    }
+
+
+class TestSCFlipPolarCode2048_1024_16(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCFlipPolarCodec
+    code_parameters = {
+        'N': 2048,
+        'K': 1024,
+        'T': 16,
+    }
+
+
+class TestSCFlipQuantizedPolarCode1024_512_8(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCFlipPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'T': 8,
+        'crc_size': 16,
+        'llr_bits': 8,
+        'fractional_bits': 2,
+    }
@@ -0,0 +1,66 @@
+from unittest import TestCase
+
+import numpy as np
+
+from python_polar_coding.polar_codes.sc.functions import (
+    compute_bits,
+    compute_llr,
+)
+from python_polar_coding.polar_codes.sc_flip import SCFlipPolarCodec
+from python_polar_coding.polar_codes.sc_flip.functions import decode_flipped
+
+
+class TestSCFlipDecoder(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.code = SCFlipPolarCodec(N=64, K=16, crc_size=16, T=4)
+
+    def _decode_with_flip(self, received_llr, flip):
+        """SC decoding from the start of the frame flipping a decision."""
+        N = self.code.N
+        llr = np.zeros(2 * N - 1)
+        bits = np.zeros(2 * N, dtype=np.int8)
+        decisions = np.zeros(N, dtype=np.int8)
+        llr[N - 1:] = received_llr
+
+        for position in range(N):
+            compute_llr(llr, bits, position, N)
+            decision = int(self.code.mask[position] == 1 and llr[0] < 0)
+            decisions[position] = decision ^ (position == flip)
+            compute_bits(bits, position, decisions[position], N)
+        return decisions, bits[N:]
+
+    def test_resume_from_flip(self):
+        """Decoding resumed at the flipped bit is the same as decoding of
+        the whole frame."""
+        decoder = self.code.decoder
+        for _ in range(20):
+            received_llr = np.random.normal(1, 1, self.code.N)
+            decoder.decode_internal(received_llr)
+            sc_decisions, _ = self._decode_with_flip(received_llr, -1)
+
+            for flip in self.code.info_indices[::4]:
+                decode_flipped(self.code.mask, decoder._llr, decoder._bits,
+                               decoder._decisions, decoder._decision_llr,
+                               sc_decisions, flip)
+                decisions, codeword = self._decode_with_flip(received_llr,
+                                                             flip)
+                np.testing.assert_equal(decoder._decisions, decisions)
+                np.testing.assert_equal(decoder._bits[self.code.N:],
+                                        codeword)
+
+    def test_attempts(self):
+        decoder = self.code.decoder
+        decoder.reset_statistics()
+
+        message = np.random.randint(0, 2, self.code.K)
+        received_llr = 1 - 2. * self.code.encode(message)
+        np.testing.assert_equal(self.code.decode(received_llr), message)
+        self.assertEqual(decoder.status,
+                         {'attempts': 1, 'crc_passed': True})
+
+        # Noise without a codeword no flip can correct
+        self.code.decode(np.random.normal(0, 1, self.code.N))
+        self.assertFalse(decoder.status['crc_passed'])
+        self.assertEqual(decoder.status['attempts'], 1 + decoder.T)
+        self.assertEqual(decoder.average_attempts, (2 + decoder.T) / 2)
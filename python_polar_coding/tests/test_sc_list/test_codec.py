@@ -47,3 +47,59 @@ class TestSCListPolarCode2048_1024_32(BasicVerifyPolarCode, TestCase):
         'K': 1024,
         'L': 32,
     }
+
+
+class TestSCListCompiledPolarCode1024_512_4(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCListPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'L': 4,
+        'compiled': True,
+    }
+
+
+class TestSCListQuantizedPolarCode1024_512_4(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCListPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'L': 4,
+        'llr_bits': 8,
+        'fractional_bits': 2,
+    }
+
+
+class TestSCListLazyCopyPolarCode2048_1024_16(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCListPolarCodec
+    code_parameters = {
+        'N': 2048,
+        'K': 1024,
+        'L': 16,
+        'lazy_copy': True,
+    }
+
+
+class TestSCListLazyCopyCompiledPolarCode2048_1024_32(BasicVerifyPolarCode,
+                                                      TestCase):
+    polar_code_class = SCListPolarCodec
+    code_parameters = {
+        'N': 2048,
+        'K': 1024,
+        'L': 32,
+        'lazy_copy': True,
+        'compiled': True,
+    }
+
+
+class TestSCListReducedPolarCode2048_1024_32(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCListPolarCodec
+    code_parameters = {
+        'N': 2048,
+        'K': 1024,
+        'L': 32,
+        'lazy_copy': True,
+        'compiled': True,
+        'split_threshold': 10,
+        'prune_threshold': 20,
+    }
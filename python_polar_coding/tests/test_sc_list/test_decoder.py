@@ -432,3 +432,77 @@ class TestSCListDecoder(TestCase):
         self.decoder._set_initial_state(self.received_llr)
         for i in range(self.N):
             self._decoding_step(i)
+
+
+class TestSCListLazyCopyDecoder(TestCase):
+    """Lazy copying of paths gives the same paths as copying on split."""
+
+    def test_same_paths(self):
+        mask = np.array([0, 0, 0, 1, 0, 1, 1, 1] * 8, dtype=np.int8)
+        for is_systematic in [True, False]:
+            decoder = SCListDecoder(n=6, mask=mask,
+                                    is_systematic=is_systematic, L=4)
+            lazy_decoder = SCListDecoder(n=6, mask=mask,
+                                         is_systematic=is_systematic, L=4,
+                                         lazy_copy=True)
+            compiled_decoder = SCListDecoder(n=6, mask=mask,
+                                             is_systematic=is_systematic,
+                                             L=4, lazy_copy=True,
+                                             compiled=True)
+
+            for _ in range(20):
+                received_llr = np.random.normal(0, 2, mask.size)
+
+                decoder.decode_internal(received_llr)
+                lazy_decoder.decode_internal(received_llr)
+                compiled_decoder.decode_internal(received_llr)
+
+                results = decoder.result
+                for other in [lazy_decoder, compiled_decoder]:
+                    self.assertEqual(len(results), len(other.result))
+                    for result, other_result in zip(results, other.result):
+                        np.testing.assert_equal(result, other_result)
+
+
+class TestSCListReducedDecoder(TestCase):
+    """Skipping splits on reliable bits and pruning of unlikely paths."""
+
+    def test_same_paths(self):
+        mask = np.array([0, 0, 0, 1, 0, 1, 1, 1] * 8, dtype=np.int8)
+        thresholds = {'split_threshold': 3, 'prune_threshold': 8}
+        decoders = [
+            SCListDecoder(n=6, mask=mask, L=4, **thresholds),
+            SCListDecoder(n=6, mask=mask, L=4, lazy_copy=True, **thresholds),
+            SCListDecoder(n=6, mask=mask, L=4, lazy_copy=True, compiled=True,
+                          **thresholds),
+        ]
+
+        for _ in range(20):
+            received_llr = np.random.normal(1, 2, mask.size)
+            for decoder in decoders:
+                decoder.decode_internal(received_llr)
+
+            decoder = decoders[0]
+            for other in decoders[1:]:
+                self.assertEqual(other.status, decoder.status)
+                self.assertEqual(len(other.result), len(decoder.result))
+                for result, other_result in zip(decoder.result,
+                                                other.result):
+                    np.testing.assert_equal(result, other_result)
+
+    def test_counters(self):
+        mask = np.array([0, 0, 0, 1, 0, 1, 1, 1] * 8, dtype=np.int8)
+        received_llr = np.full(mask.size, 10.0)
+        decoder = SCListDecoder(n=6, mask=mask, L=4, lazy_copy=True,
+                                compiled=True, split_threshold=5)
+        decoder.decode_internal(received_llr)
+
+        # All the bits are reliable, so a single path decodes the frame
+        self.assertEqual(decoder.status['skipped_splits'], mask.sum())
+        self.assertEqual(decoder.status['pruned_paths'], 0)
+        self.assertEqual(len(decoder.result), 1)
+
+        decoder = SCListDecoder(n=6, mask=mask, L=4, lazy_copy=True,
+                                compiled=True)
+        decoder.decode_internal(received_llr)
+        self.assertEqual(decoder.status['skipped_splits'], 0)
@@ -0,0 +1,41 @@
+from unittest import TestCase
+
+import numpy as np
+
+from python_polar_coding.polar_codes.sc_list_crc import (
+    AdaptiveSCListCRCPolarCodec,
+)
+from python_polar_coding.tests.base import BasicVerifyPolarCode
+
+
+class TestAdaptiveSCListPolarCode1024_512_32(BasicVerifyPolarCode, TestCase):
+    polar_code_class = AdaptiveSCListCRCPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'L_max': 32,
+        'crc_size': 16,
+        'lazy_copy': True,
+        'compiled': True,
+    }
+
+    def test_list_sizes(self):
+        """List size grows only for frames failing the CRC check."""
+        decoder = self.polar_code.decoder
+        decoder.reset_statistics()
+
+        messages = np.random.randint(0, 2, (self.batch_size, self.K))
+        llr = np.array([
+            self.channel.transmit(message=self.polar_code.encode(message),
+                                  snr_db=1.0)
+            for message in messages
+        ])
+        _, status = self.polar_code.decode_batch(llr)
+
+        for L, crc_passed in zip(status['list_size'], status['crc_passed']):
+            self.assertIn(L, [1, 2, 4, 8, 16, 32])
+            self.assertTrue(crc_passed or L == 32)
+
+        self.assertEqual(sum(decoder.list_sizes.values()), self.batch_size)
+        self.assertEqual(decoder.average_list_size,
+                         np.mean(status['list_size']))
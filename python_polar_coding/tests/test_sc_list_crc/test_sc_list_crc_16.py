@@ -1,5 +1,7 @@
 from unittest import TestCase
 
+import numpy as np
+
 from python_polar_coding.polar_codes.sc_list_crc import SCListCRCPolarCodec
 from python_polar_coding.tests.base import BasicVerifyPolarCode
 
@@ -51,3 +53,22 @@ class TestSCListPolarCode2048_1024_32(BasicVerifyPolarCode, TestCase):
         'L': 32,
         'crc_size': 16,
     }
+
+
+class TestSCListCRCDecodeBatch(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.polar_code = SCListCRCPolarCodec(N=128, K=48, L=4, crc_size=16)
+
+    def test_status(self):
+        messages = np.random.randint(0, 2, (10, 48))
+        encoded = self.polar_code.encode_batch(messages)
+        llr = 1 - 2. * encoded
+        llr[5:] = -llr[5:]
+
+        decoded, status = self.polar_code.decode_batch(llr)
+
+        np.testing.assert_equal(decoded[:5], messages[:5])
+        np.testing.assert_equal(status['crc_passed'][:5], True)
+        np.testing.assert_equal(status['path'][:5], 0)
+        self.assertEqual(status['crc_passed'].size, 10)
@@ -0,0 +1,37 @@
+from unittest import TestCase
+
+from python_polar_coding.polar_codes.sc_stack import SCStackPolarCodec
+from python_polar_coding.tests.base import BasicVerifyPolarCode
+
+
+class TestSCStackPolarCode1024_512_8_256(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCStackPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'L': 8,
+        'D': 256,
+    }
+
+
+class TestSCStackPolarCode2048_1024_4_64(BasicVerifyPolarCode, TestCase):
+    polar_code_class = SCStackPolarCodec
+    code_parameters = {
+        'N': 2048,
+        'K': 1024,
+        'L': 4,
+        'D': 64,
+    }
+
+
+class TestSCStackQuantizedPolarCode1024_512_8_256(BasicVerifyPolarCode,
+                                                  TestCase):
+    polar_code_class = SCStackPolarCodec
+    code_parameters = {
+        'N': 1024,
+        'K': 512,
+        'L': 8,
+        'D': 256,
+        'llr_bits': 8,
+        'fractional_bits': 2,
+    }
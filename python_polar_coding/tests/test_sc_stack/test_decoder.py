@@ -0,0 +1,46 @@
+import itertools
+from unittest import TestCase
+
+import numpy as np
+
+from python_polar_coding.polar_codes.base import Encoder
+from python_polar_coding.polar_codes.sc_stack import (
+    SCStackDecoder,
+    SCStackPolarCodec,
+)
+
+
+class TestSCStackDecoder(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mask = np.array(
+            [0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1], dtype=np.int8)
+        cls.n = 4
+
+    def test_maximum_likelihood(self):
+        """Stack keeping all the paths finds the most likely codeword."""
+        K = int(np.sum(self.mask))
+        encoder = Encoder(mask=self.mask, n=self.n)
+        codewords = np.array([
+            encoder.encode(np.array(message))
+            for message in itertools.product([0, 1], repeat=K)
+        ])
+        decoder = SCStackDecoder(n=self.n, mask=self.mask,
+                                 L=2 ** K, D=2 ** K)
+
+        for _ in range(100):
+            llr = np.random.randn(self.mask.size)
+            # LLR-based metric of each codeword
+            metrics = -np.sum(np.abs(llr) * (codewords != (llr < 0)), axis=1)
+
+            np.testing.assert_equal(decoder.decode_internal(llr),
+                                    codewords[np.argmax(metrics)])
+
+    def test_computed_bits(self):
+        """Noiseless codeword is decoded by a single path."""
+        code = SCStackPolarCodec(N=64, K=32, L=4, D=16)
+        message = np.random.randint(0, 2, code.K)
+        received_llr = 1 - 2. * code.encode(message)
+
+        np.testing.assert_equal(code.decode(received_llr), message)
+        self.assertEqual(code.decoder.status, {'computed_bits': code.N})